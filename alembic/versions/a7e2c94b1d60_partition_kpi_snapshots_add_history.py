@@ -0,0 +1,248 @@
+"""Partition kpi_snapshots by session; add snapshot history and rollups
+
+Revision ID: a7e2c94b1d60
+Revises: f1c3a9d2e7b4
+Create Date: 2026-10-18 16:12:48.207431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e2c94b1d60'
+down_revision: Union[str, Sequence[str], None] = 'f1c3a9d2e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns); mirrored in the models' __table_args__
+INDEXES = [
+    ("ix_kpi_snapshot_history_created_at", "kpi_snapshot_history", ["created_at"]),
+    (
+        "ix_kpi_snapshot_history_metric",
+        "kpi_snapshot_history",
+        ["department_id", "metric_name", "created_at"],
+    ),
+]
+
+# Index access methods other than btree
+INDEX_USING = {"ix_kpi_snapshot_history_created_at": "brin"}
+
+# Partition naming; mirrored by app.db.partitions
+DEFAULT_PARTITION = "kpi_snapshots_default"
+SNAPSHOT_COLUMNS = (
+    "id, academic_session_id, department_id, pillar_name, metric_name, calculated_value, "
+    "target_value, percentage_achieved, status, created_at, updated_at"
+)
+SNAPSHOT_KEY = "academic_session_id, department_id, pillar_name, metric_name"
+
+
+def _partition(session_id: int) -> str:
+    return f"kpi_snapshots_s{int(session_id)}"
+
+
+def _metric_columns() -> list:
+    return [
+        sa.Column("academic_session_id", sa.Integer(), sa.ForeignKey("academic_sessions.id"), nullable=False),
+        sa.Column("department_id", sa.Integer(), sa.ForeignKey("departments.id"), nullable=False),
+        sa.Column("pillar_name", sa.String(length=100), nullable=False),
+        sa.Column("metric_name", sa.String(length=255), nullable=False),
+    ]
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+
+def _rollup_columns() -> list:
+    return [
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.Column("min_value", sa.Float(), nullable=False),
+        sa.Column("max_value", sa.Float(), nullable=False),
+        sa.Column("avg_value", sa.Float(), nullable=False),
+        sa.Column("avg_percentage", sa.Float(), nullable=False),
+    ]
+
+
+def _is_partitioned(bind) -> bool:
+    return bool(
+        bind.scalar(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('kpi_snapshots'))"
+            )
+        )
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "kpi_snapshot_history",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        *_metric_columns(),
+        sa.Column("calculated_value", sa.Float(), nullable=False),
+        sa.Column("target_value", sa.Float(), nullable=False),
+        sa.Column("percentage_achieved", sa.Float(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    for name, table, columns in INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            postgresql_using=INDEX_USING.get(name, "btree"),
+            if_not_exists=True,
+        )
+    op.create_table(
+        "kpi_daily_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        *_metric_columns(),
+        *_rollup_columns(),
+        *_timestamps(),
+        sa.UniqueConstraint(
+            "department_id",
+            "metric_name",
+            "day",
+            "academic_session_id",
+            "pillar_name",
+            name="uq_kpi_daily_rollups_key",
+        ),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "kpi_session_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        *_metric_columns(),
+        sa.Column("first_day", sa.Date(), nullable=False),
+        sa.Column("last_day", sa.Date(), nullable=False),
+        *_rollup_columns(),
+        *_timestamps(),
+        sa.UniqueConstraint(
+            "academic_session_id",
+            "department_id",
+            "pillar_name",
+            "metric_name",
+            name="uq_kpi_session_rollups_key",
+        ),
+        if_not_exists=True,
+    )
+
+    bind = op.get_bind()
+    if _is_partitioned(bind):
+        return
+
+    # Rebuild kpi_snapshots as a table partitioned by session. Partitioned
+    # tables need the partition key in every unique constraint, hence the
+    # (id, academic_session_id) primary key.
+    op.execute("ALTER TABLE kpi_snapshots RENAME TO kpi_snapshots_unpartitioned")
+    op.execute(
+        "ALTER TABLE kpi_snapshots_unpartitioned "
+        "RENAME CONSTRAINT kpi_snapshots_pkey TO kpi_snapshots_unpartitioned_pkey"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_kpi_snapshots_id")
+    op.execute("DROP INDEX IF EXISTS ix_kpi_snapshots_key")
+    op.execute("ALTER SEQUENCE kpi_snapshots_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE kpi_snapshots (
+            id INTEGER NOT NULL DEFAULT nextval('kpi_snapshots_id_seq'),
+            academic_session_id INTEGER NOT NULL REFERENCES academic_sessions (id),
+            department_id INTEGER NOT NULL REFERENCES departments (id),
+            pillar_name VARCHAR(100) NOT NULL,
+            metric_name VARCHAR(255) NOT NULL,
+            calculated_value FLOAT NOT NULL,
+            target_value FLOAT NOT NULL,
+            percentage_achieved FLOAT NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT kpi_snapshots_pkey PRIMARY KEY (id, academic_session_id),
+            CONSTRAINT uq_kpi_snapshots_key UNIQUE (academic_session_id, department_id, pillar_name, metric_name)
+        ) PARTITION BY LIST (academic_session_id)
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_kpi_snapshots_key ON kpi_snapshots (department_id, academic_session_id, pillar_name)"
+    )
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF kpi_snapshots DEFAULT")
+    for session_id in bind.scalars(sa.text("SELECT id FROM academic_sessions ORDER BY id")):
+        op.execute(
+            f"CREATE TABLE {_partition(session_id)} PARTITION OF kpi_snapshots FOR VALUES IN ({int(session_id)})"
+        )
+
+    # Every earlier recompute becomes history; the latest row per key stays
+    op.execute(
+        f"""
+        INSERT INTO kpi_snapshot_history ({SNAPSHOT_COLUMNS})
+        SELECT {SNAPSHOT_COLUMNS} FROM kpi_snapshots_unpartitioned
+        """
+    )
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('kpi_snapshot_history', 'id'), "
+        "(SELECT COALESCE(MAX(id), 0) + 1 FROM kpi_snapshot_history), false)"
+    )
+    op.execute(
+        f"""
+        INSERT INTO kpi_snapshots ({SNAPSHOT_COLUMNS})
+        SELECT DISTINCT ON ({SNAPSHOT_KEY}) {SNAPSHOT_COLUMNS}
+        FROM kpi_snapshots_unpartitioned
+        ORDER BY {SNAPSHOT_KEY}, updated_at DESC, id DESC
+        """
+    )
+    op.execute("DROP TABLE kpi_snapshots_unpartitioned")
+    op.execute("ALTER SEQUENCE kpi_snapshots_id_seq OWNED BY kpi_snapshots.id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if _is_partitioned(bind):
+        op.execute("ALTER TABLE kpi_snapshots RENAME TO kpi_snapshots_partitioned")
+        op.execute("ALTER SEQUENCE kpi_snapshots_id_seq OWNED BY NONE")
+        op.execute("ALTER TABLE kpi_snapshots_partitioned DROP CONSTRAINT kpi_snapshots_pkey")
+        op.execute("ALTER TABLE kpi_snapshots_partitioned DROP CONSTRAINT uq_kpi_snapshots_key")
+        op.execute("DROP INDEX IF EXISTS ix_kpi_snapshots_key")
+        op.execute(
+            """
+            CREATE TABLE kpi_snapshots (
+                id INTEGER NOT NULL DEFAULT nextval('kpi_snapshots_id_seq'),
+                academic_session_id INTEGER NOT NULL REFERENCES academic_sessions (id),
+                department_id INTEGER NOT NULL REFERENCES departments (id),
+                pillar_name VARCHAR(100) NOT NULL,
+                metric_name VARCHAR(255) NOT NULL,
+                calculated_value FLOAT NOT NULL,
+                target_value FLOAT NOT NULL,
+                percentage_achieved FLOAT NOT NULL,
+                status VARCHAR(50) NOT NULL,
+                created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                CONSTRAINT kpi_snapshots_pkey PRIMARY KEY (id)
+            )
+            """
+        )
+        op.execute(
+            f"INSERT INTO kpi_snapshots ({SNAPSHOT_COLUMNS}) "
+            f"SELECT {SNAPSHOT_COLUMNS} FROM kpi_snapshots_partitioned"
+        )
+        # Dropping the parent drops every partition
+        op.execute("DROP TABLE kpi_snapshots_partitioned")
+        op.execute("ALTER SEQUENCE kpi_snapshots_id_seq OWNED BY kpi_snapshots.id")
+        op.execute("CREATE INDEX ix_kpi_snapshots_id ON kpi_snapshots (id)")
+        op.execute(
+            "CREATE INDEX ix_kpi_snapshots_key ON kpi_snapshots (department_id, academic_session_id, pillar_name)"
+        )
+
+    op.drop_table("kpi_session_rollups", if_exists=True)
+    op.drop_table("kpi_daily_rollups", if_exists=True)
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table("kpi_snapshot_history", if_exists=True)
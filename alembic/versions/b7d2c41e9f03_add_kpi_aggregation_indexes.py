@@ -0,0 +1,77 @@
+"""Add composite indexes for KPI aggregation queries
+
+Revision ID: b7d2c41e9f03
+Revises: 44ad433cb3a8
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2c41e9f03'
+down_revision: Union[str, Sequence[str], None] = '44ad433cb3a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns); mirrored in the models' __table_args__
+INDEXES = [
+    ("ix_students_department_id_id", "students", ["department_id", "id"]),
+    ("ix_courses_department_id", "courses", ["department_id"]),
+    (
+        "ix_student_feedback_course_id_academic_session_id",
+        "student_feedback",
+        ["course_id", "academic_session_id"],
+    ),
+    (
+        "ix_internship_records_student_id_academic_session_id",
+        "internship_records",
+        ["student_id", "academic_session_id"],
+    ),
+    (
+        "ix_student_projects_student_id_academic_session_id",
+        "student_projects",
+        ["student_id", "academic_session_id"],
+    ),
+    ("ix_events_academic_session_id", "events", ["academic_session_id"]),
+    (
+        "ix_event_participants_event_id_student_id",
+        "event_participants",
+        ["event_id", "student_id"],
+    ),
+    ("ix_event_participants_student_id", "event_participants", ["student_id"]),
+    (
+        "ix_kpi_snapshots_key",
+        "kpi_snapshots",
+        ["department_id", "academic_session_id", "pillar_name"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,73 @@
+"""Add collector sync state and run tables
+
+Revision ID: c3f8a61d5e27
+Revises: a7e2c94b1d60
+Create Date: 2026-10-18 18:04:37.918254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a61d5e27'
+down_revision: Union[str, Sequence[str], None] = 'a7e2c94b1d60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns); mirrored in the models' __table_args__
+INDEXES = [
+    ("ix_collector_sync_states_id", "collector_sync_states", ["id"]),
+    ("ix_collector_sync_runs_id", "collector_sync_runs", ["id"]),
+    ("ix_collector_sync_runs_source_created_at", "collector_sync_runs", ["source", "created_at"]),
+]
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "collector_sync_states",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("entity", sa.String(length=255), nullable=False),
+        sa.Column("watermark", sa.String(length=100), nullable=True),
+        sa.Column("etag", sa.String(length=255), nullable=True),
+        sa.Column("page_token", sa.String(length=1000), nullable=True),
+        *_timestamps(),
+        sa.UniqueConstraint("source", "entity", name="uq_collector_sync_states_source_entity"),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "collector_sync_runs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("items_collected", sa.Integer(), nullable=False),
+        sa.Column("items_valid", sa.Integer(), nullable=False),
+        sa.Column("items_persisted", sa.Integer(), nullable=False),
+        sa.Column("checkpoints", sa.Integer(), nullable=False),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(length=1000), nullable=True),
+        *_timestamps(),
+        if_not_exists=True,
+    )
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table("collector_sync_runs", if_exists=True)
+    op.drop_table("collector_sync_states", if_exists=True)
@@ -0,0 +1,86 @@
+"""Add materialized per-(department, session) KPI aggregate views
+
+Revision ID: d4a8e17c2b56
+Revises: b7d2c41e9f03
+Create Date: 2026-10-18 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8e17c2b56'
+down_revision: Union[str, Sequence[str], None] = 'b7d2c41e9f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# View name -> defining query; mirrored by app.db.materialized_views
+VIEWS = {
+    "kpi_feedback_aggregates": """
+        SELECT c.department_id,
+               sf.academic_session_id,
+               COUNT(*) AS feedback_count,
+               COUNT(DISTINCT sf.student_id) AS feedback_respondents,
+               SUM(sf.rating) AS rating_sum,
+               AVG(sf.rating) AS rating_avg
+        FROM student_feedback sf
+        JOIN courses c ON c.id = sf.course_id
+        GROUP BY c.department_id, sf.academic_session_id
+    """,
+    "kpi_internship_aggregates": """
+        SELECT s.department_id,
+               ir.academic_session_id,
+               COUNT(DISTINCT ir.student_id) AS internship_students,
+               COALESCE(SUM(ir.duration_weeks), 0) AS internship_weeks_sum,
+               COUNT(ir.duration_weeks) AS internship_weeks_count,
+               AVG(ir.duration_weeks) AS internship_weeks_avg
+        FROM internship_records ir
+        JOIN students s ON s.id = ir.student_id
+        GROUP BY s.department_id, ir.academic_session_id
+    """,
+    "kpi_project_aggregates": """
+        SELECT s.department_id,
+               sp.academic_session_id,
+               COUNT(*) AS project_count,
+               SUM(CASE WHEN sp.is_deployed THEN 1 ELSE 0 END) AS deployed_projects,
+               AVG(CASE WHEN sp.is_deployed THEN 1.0 ELSE 0.0 END) AS deployed_ratio,
+               COALESCE(SUM(sp.project_quality_score), 0) AS project_quality_sum,
+               COUNT(sp.project_quality_score) AS project_quality_count
+        FROM student_projects sp
+        JOIN students s ON s.id = sp.student_id
+        GROUP BY s.department_id, sp.academic_session_id
+    """,
+    "kpi_event_aggregates": """
+        SELECT s.department_id,
+               e.academic_session_id,
+               COUNT(*) AS event_participations,
+               COUNT(DISTINCT ep.student_id) AS event_students
+        FROM event_participants ep
+        JOIN students s ON s.id = ep.student_id
+        JOIN events e ON e.id = ep.event_id
+        GROUP BY s.department_id, e.academic_session_id
+    """,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, query in VIEWS.items():
+        op.execute(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {query} WITH DATA")
+        # REFRESH ... CONCURRENTLY requires a unique index covering every row
+        op.create_index(
+            f"ux_{name}_key",
+            name,
+            ["department_id", "academic_session_id"],
+            unique=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in reversed(list(VIEWS)):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
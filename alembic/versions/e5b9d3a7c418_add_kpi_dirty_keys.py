@@ -0,0 +1,49 @@
+"""Add kpi_dirty_keys change tracking markers
+
+Revision ID: e5b9d3a7c418
+Revises: c3f8a61d5e27
+Create Date: 2026-10-18 19:22:51.604183
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9d3a7c418'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a61d5e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns); mirrored in the models' __table_args__
+INDEXES = [
+    ("ix_kpi_dirty_keys_id", "kpi_dirty_keys", ["id"]),
+    ("ix_kpi_dirty_keys_key", "kpi_dirty_keys", ["department_id", "academic_session_id", "pillar_name"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "kpi_dirty_keys",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("department_id", sa.Integer(), sa.ForeignKey("departments.id"), nullable=False),
+        sa.Column(
+            "academic_session_id", sa.Integer(), sa.ForeignKey("academic_sessions.id"), nullable=False
+        ),
+        sa.Column("pillar_name", sa.String(length=100), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table("kpi_dirty_keys", if_exists=True)
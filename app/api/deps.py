@@ -7,21 +7,28 @@ from typing import Generator
 
 from fastapi import Depends, HTTPException, status
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.logging import bind_log_context
+from app.db.session import get_async_db
 from app.models.user import User
 from app.crud.user import crud_user
 
 
 async def get_current_user(
     token: str = Depends(lambda: None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """
     Get the current authenticated user from JWT token.
 
+    The principal is cached per user and token issue time for
+    ``PRINCIPAL_CACHE_TTL_SECONDS``, and dropped whenever the user row is
+    written through ``crud_user``. The returned user is a detached copy
+    built from the cached columns.
+
     Args:
         token: JWT token from Authorization header
         db: Database session
@@ -53,11 +60,21 @@ async def get_current_user(
     except JWTError:
         raise credential_exception
 
-    user = crud_user.get(db=db, id=int(user_id))
-    if user is None:
+    async def load():
+        user = await crud_user.aget(db=db, id=int(user_id))
+        return None if user is None else crud_user.to_principal(user)
+
+    principal = await cache.aget_or_set(
+        crud_user.principal_cache_key(user_id, payload.get("iat", 0)),
+        load,
+        ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        local_ttl=settings.PRINCIPAL_LOCAL_TTL_SECONDS,
+    )
+    if principal is None:
         raise credential_exception
 
-    return user
+    bind_log_context(user_id=int(user_id))
+    return crud_user.from_principal(principal)
 
 
 async def get_current_active_user(
@@ -1,16 +1,18 @@
 """Authentication endpoints."""
 
+from typing import cast
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
 )
 from app.crud.user import crud_user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse, UserResponse
 
 router = APIRouter(prefix="/auth")
@@ -19,7 +21,7 @@ router = APIRouter(prefix="/auth")
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     data: RegisterRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Register a new user.
@@ -35,14 +37,14 @@ async def register(
         HTTPException: If user already exists
     """
     # Check if user already exists
-    existing_user = crud_user.get_by_email(db=db, email=data.email)
+    existing_user = await crud_user.aget_by_email(db=db, email=data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
-    existing_username = crud_user.get_by_username(db=db, username=data.username)
+    existing_username = await crud_user.aget_by_username(db=db, username=data.username)
     if existing_username:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,12 +52,12 @@ async def register(
         )
 
     # Create new user
-    user = crud_user.create(
+    user = await crud_user.acreate(
         db=db,
         obj_in={
             "email": data.email,
             "username": data.username,
-            "hashed_password": hash_password(data.password),
+            "hashed_password": await hash_password_async(data.password),
             "full_name": data.full_name,
         },
     )
@@ -66,7 +68,7 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     credentials: LoginRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Login user and return JWT tokens.
@@ -82,8 +84,10 @@ async def login(
         HTTPException: If credentials are invalid
     """
     # Get user by email
-    user = crud_user.get_by_email(db=db, email=credentials.email)
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    user = await crud_user.aget_by_email(db=db, email=credentials.email)
+    if not user or not await verify_password_async(
+        credentials.password, cast(str, user.hashed_password)
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
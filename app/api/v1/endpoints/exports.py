@@ -0,0 +1,80 @@
+"""Export endpoints."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import get_async_session_factory
+from app.services.exporters.table_export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    kpi_snapshots_statement,
+    stream_export,
+    students_statement,
+)
+
+router = APIRouter(prefix="/exports")
+
+
+def _streaming_response(
+    statement, export_format: ExportFormat, name: str, session_factory
+) -> StreamingResponse:
+    """Wrap an export stream in a downloadable response."""
+    return StreamingResponse(
+        stream_export(statement, export_format, session_factory),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'
+        },
+    )
+
+
+@router.get("/students")
+async def export_students(
+    format: ExportFormat = ExportFormat.NDJSON,
+    department_id: Optional[int] = None,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+):
+    """
+    Stream every student as NDJSON or CSV.
+
+    Args:
+        format: Output format
+        department_id: Filter by department
+        session_factory: Factory for the streaming session
+
+    Returns:
+        Streaming file download
+    """
+    return _streaming_response(
+        students_statement(department_id), format, "students", session_factory
+    )
+
+
+@router.get("/kpi-snapshots")
+async def export_kpi_snapshots(
+    format: ExportFormat = ExportFormat.NDJSON,
+    department_id: Optional[int] = None,
+    academic_session_id: Optional[int] = None,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+):
+    """
+    Stream every KPI snapshot as NDJSON or CSV.
+
+    Args:
+        format: Output format
+        department_id: Filter by department
+        academic_session_id: Filter by academic session
+        session_factory: Factory for the streaming session
+
+    Returns:
+        Streaming file download
+    """
+    return _streaming_response(
+        kpi_snapshots_statement(department_id, academic_session_id),
+        format,
+        "kpi_snapshots",
+        session_factory,
+    )
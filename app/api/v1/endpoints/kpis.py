@@ -0,0 +1,67 @@
+"""KPI endpoints."""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.kpi import crud_kpi_history, crud_kpi_snapshot
+from app.db.session import get_async_db
+from app.schemas.kpi import KPISnapshot, KPITrendPoint
+
+router = APIRouter(prefix="/kpis")
+
+
+@router.get("/departments/{department_id}", response_model=list[KPISnapshot])
+async def get_department_kpis(
+    department_id: int,
+    academic_session_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get a department's KPI snapshots.
+
+    Args:
+        department_id: Department ID
+        academic_session_id: Filter by academic session
+        db: Database session
+
+    Returns:
+        One KPI snapshot per academic session, newest first
+    """
+    return await crud_kpi_snapshot.aget_department_summary(
+        db=db,
+        department_id=department_id,
+        academic_session_id=academic_session_id,
+    )
+
+
+@router.get("/departments/{department_id}/trend", response_model=list[KPITrendPoint])
+async def get_department_kpi_trend(
+    department_id: int,
+    metric_name: str,
+    days: int = Query(365, ge=1, le=3660, description="Days of history to return"),
+    academic_session_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get the daily history of one of a department's KPI metrics.
+
+    Args:
+        department_id: Department ID
+        metric_name: Metric to trace
+        days: Days of history to return
+        academic_session_id: Filter by academic session
+        db: Database session
+
+    Returns:
+        One point per day and academic session, oldest first
+    """
+    return await crud_kpi_history.aget_trend(
+        db=db,
+        department_id=department_id,
+        metric_name=metric_name,
+        since=date.today() - timedelta(days=days - 1),
+        academic_session_id=academic_session_id,
+    )
@@ -0,0 +1,112 @@
+"""Report endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_async_db
+from app.schemas.report import ReportRequest, ReportStatus
+from app.services.reports.kpi_report import MEDIA_TYPES, ReportFormat, areport_key
+from app.services.reports.store import ArtifactStore
+from app.tasks.celery_app import celery_app
+from app.tasks.report_tasks import generate_kpi_report_task
+
+router = APIRouter(prefix="/reports")
+
+# Artifacts never change under their key, so clients may cache them for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def get_report_store() -> ArtifactStore:
+    """Store of rendered report artifacts."""
+    return ArtifactStore()
+
+
+def _ready(request: Request, key: str, report_format: ReportFormat) -> ReportStatus:
+    return ReportStatus(
+        status="ready",
+        key=key,
+        format=report_format,
+        download_url=str(request.url_for("download_report", key=key, report_format=report_format.value)),
+    )
+
+
+@router.post("/kpi", response_model=ReportStatus)
+async def request_kpi_report(
+    report: ReportRequest,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    store: ArtifactStore = Depends(get_report_store),
+):
+    """
+    Request a department's KPI report.
+
+    The report's data is hashed first; if an artifact of the same data
+    exists it is returned at once, otherwise rendering is queued.
+
+    Args:
+        report: Department, optional academic session and format
+        request: Current request, for the download URL
+        response: Response, whose status is set to 202 while rendering
+        db: Database session
+        store: Report artifact store
+
+    Returns:
+        Download URL if ready, otherwise the rendering task
+    """
+    key = await areport_key(db, report.department_id, report.academic_session_id)
+    if store.get(key, report.format.value) is not None:
+        return _ready(request, key, report.format)
+
+    task = generate_kpi_report_task.delay(report.department_id, report.academic_session_id, report.format.value)
+    response.status_code = status.HTTP_202_ACCEPTED
+    return ReportStatus(status="pending", key=key, format=report.format, task_id=task.id)
+
+
+@router.get("/tasks/{task_id}", response_model=ReportStatus)
+async def get_report_task(task_id: str, request: Request):
+    """
+    Get the state of a report rendering task.
+
+    Args:
+        task_id: Task returned when the report was requested
+        request: Current request, for the download URL
+
+    Returns:
+        Download URL once rendered
+    """
+    result = celery_app.AsyncResult(task_id)
+    if result.failed():
+        return ReportStatus(status="failed", task_id=task_id)
+    if not result.successful():
+        return ReportStatus(status="pending", task_id=task_id)
+    return _ready(request, result.result["key"], ReportFormat(result.result["format"]))
+
+
+@router.get("/{key}.{report_format}", name="download_report")
+async def download_report(
+    key: str,
+    report_format: ReportFormat,
+    store: ArtifactStore = Depends(get_report_store),
+):
+    """
+    Download a rendered report.
+
+    Args:
+        key: Content hash of the report
+        report_format: File format
+        store: Report artifact store
+
+    Returns:
+        The report file
+    """
+    path = store.get(key, report_format.value) if store.is_key(key) else None
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES[report_format],
+        filename=f"kpi-report-{key[:12]}.{report_format.value}",
+        headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+    )
@@ -1,22 +1,55 @@
 """Student endpoints."""
 
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Dict, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.crud.student import crud_student
-from app.db.session import get_db
-from app.schemas.student import StudentCreate, StudentUpdate, StudentResponse
-from app.schemas.common import PaginationParams, PaginatedResponse
+from app.core.cache import cache
+from app.crud.pagination import CountMode
+from app.crud.student import PROFILE_SECTIONS, crud_student
+from app.db.instrumentation import query_budget
+from app.db.session import get_async_db, get_db
+from app.models.student import Student
+from app.schemas.student import (
+    StudentCreate,
+    StudentUpdate,
+    StudentResponse,
+    StudentPage,
+    StudentImportReport,
+    StudentProfile,
+    student_page_adapter,
+)
+from app.services.importers.student_import import StudentImporter
 
 router = APIRouter(prefix="/students")
 
+# Columns of StudentResponse, selected directly for list pages
+STUDENT_COLUMNS = [getattr(crud_student.model, name) for name in StudentResponse.model_fields]
+
+# Most students one batched profile request may ask for
+MAX_PROFILE_BATCH = 100
+
+# The students, one query per section and one for the participations' events
+PROFILE_QUERY_BUDGET = len(PROFILE_SECTIONS) + 2
+
+INCLUDE_DESCRIPTION = f"Comma-separated sections to load (default: all of {', '.join(PROFILE_SECTIONS)})"
+
+
+def _profile(student: Student, sections: Sequence[str]) -> Dict[str, Any]:
+    """Profile data of a student; only the loaded sections are read."""
+    data = {name: getattr(student, name) for name in StudentResponse.model_fields}
+    for section in sections:
+        data[section] = sorted(getattr(student, section), key=attrgetter("id"))
+    return data
+
 
 @router.post("", response_model=StudentResponse, status_code=status.HTTP_201_CREATED)
 async def create_student(
     data: StudentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create a new student record.
@@ -29,21 +62,114 @@ async def create_student(
         Created student
     """
     # Check if matric number already exists
-    existing = crud_student.get_by_matric(db=db, matric_number=data.matric_number)
+    existing = await crud_student.aget_by_matric(db=db, matric_number=data.matric_number)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Matric number already exists",
         )
 
-    student = crud_student.create(db=db, obj_in=data.model_dump())
+    student = await crud_student.acreate(db=db, obj_in=data.model_dump())
     return student
 
 
+@router.post("/import", response_model=StudentImportReport)
+def import_students(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk import students from a CSV or XLSX file.
+
+    The upload is streamed and inserted in chunks; existing students are
+    skipped and invalid rows are listed in the report.
+
+    Args:
+        file: CSV or XLSX file with a header row
+        db: Database session
+
+    Returns:
+        Import report
+
+    Raises:
+        HTTPException: If the upload has no file name to pick a reader by
+    """
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import file name is required",
+        )
+    return StudentImporter(db).import_file(file.file, file.filename)
+
+
+@router.get("/profiles", response_model=list[StudentProfile])
+@query_budget(PROFILE_QUERY_BUDGET)
+async def get_student_profiles(
+    ids: list[int] = Query(..., description="Student IDs"),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get the profiles of several students.
+
+    All students and their selected sections are loaded in a fixed number
+    of queries. Unknown IDs are left out.
+
+    Args:
+        ids: Student IDs
+        include: Profile sections to load
+        db: Database session
+
+    Returns:
+        Profiles in the order of ``ids``
+    """
+    if len(ids) > MAX_PROFILE_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_PROFILE_BATCH} students per request",
+        )
+
+    sections = crud_student.profile_sections(include)
+    students = await crud_student.aget_profiles(db, ids, sections)
+    return [_profile(students[id], sections) for id in dict.fromkeys(ids) if id in students]
+
+
+@router.get("/{student_id}/profile", response_model=StudentProfile)
+@query_budget(PROFILE_QUERY_BUDGET)
+async def get_student_profile(
+    student_id: int,
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get a student with their projects, internships, feedback and event
+    participations.
+
+    Each selected section is loaded with one query, whatever the size of
+    the student's history.
+
+    Args:
+        student_id: Student ID
+        include: Profile sections to load
+        db: Database session
+
+    Returns:
+        Student profile
+    """
+    sections = crud_student.profile_sections(include)
+    students = await crud_student.aget_profiles(db, [student_id], sections)
+    if student_id not in students:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Student not found",
+        )
+    return _profile(students[student_id], sections)
+
+
 @router.get("/{student_id}", response_model=StudentResponse)
 async def get_student(
     student_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a student by ID.
@@ -55,7 +181,13 @@ async def get_student(
     Returns:
         Student data
     """
-    student = crud_student.get(db=db, id=student_id)
+    async def load():
+        student = await crud_student.aget(db=db, id=student_id)
+        if student is None:
+            return None
+        return StudentResponse.model_validate(student).model_dump(mode="json")
+
+    student = await cache.aget_or_set(crud_student.cache_key(student_id), load)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -64,46 +196,68 @@ async def get_student(
     return student
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", response_model=StudentPage)
 async def list_students(
-    skip: int = 0,
-    limit: int = 10,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
     department_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     List all students with pagination.
 
+    Students are ordered by (department_id, id). Pass the returned
+    ``next_cursor`` back as ``cursor`` to fetch the next page at constant
+    cost; ``skip`` is only honoured without a cursor.
+
+    Rows are selected as plain columns and serialized by a typed adapter,
+    without hydrating ORM instances.
+
     Args:
         skip: Number of records to skip
         limit: Number of records to return
         department_id: Filter by department
+        cursor: Cursor of the page to fetch
+        count: Total count mode: none, exact or estimate
         db: Database session
 
     Returns:
         Paginated student list
     """
-    query = db.query(crud_student.model)
-
+    filters = []
     if department_id:
-        query = query.filter(crud_student.model.department_id == department_id)
+        filters.append(crud_student.model.department_id == department_id)
 
-    total = query.count()
-    students = query.offset(skip).limit(limit).all()
+    page = await crud_student.aget_page_rows(
+        db,
+        STUDENT_COLUMNS,
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
+        filters=filters,
+        count=count,
+    )
 
-    return {
-        "total": total,
-        "skip": skip,
-        "limit": limit,
-        "items": students,
-    }
+    body = student_page_adapter.validate_python(
+        {
+            "total": page.total,
+            "total_is_estimate": page.total_is_estimate,
+            "skip": 0 if cursor else skip,
+            "limit": limit,
+            "next_cursor": page.next_cursor,
+            "items": page.items,
+        }
+    )
+    return Response(student_page_adapter.dump_json(body), media_type="application/json")
 
 
 @router.put("/{student_id}", response_model=StudentResponse)
 async def update_student(
     student_id: int,
     data: StudentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Update a student record.
@@ -116,7 +270,7 @@ async def update_student(
     Returns:
         Updated student
     """
-    student = crud_student.get(db=db, id=student_id)
+    student = await crud_student.aget(db=db, id=student_id)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -124,14 +278,14 @@ async def update_student(
         )
 
     update_data = data.model_dump(exclude_unset=True)
-    student = crud_student.update(db=db, db_obj=student, obj_in=update_data)
+    student = await crud_student.aupdate(db=db, db_obj=student, obj_in=update_data)
     return student
 
 
 @router.delete("/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_student(
     student_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Delete a student record.
@@ -140,11 +294,11 @@ async def delete_student(
         student_id: Student ID
         db: Database session
     """
-    student = crud_student.get(db=db, id=student_id)
+    student = await crud_student.aget(db=db, id=student_id)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Student not found",
         )
 
-    crud_student.remove(db=db, id=student_id)
+    await crud_student.aremove(db=db, id=student_id)
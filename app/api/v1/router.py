@@ -5,7 +5,7 @@ Includes all endpoint routers.
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import health, auth, students
+from app.api.v1.endpoints import health, auth, students, kpis, exports, reports
 
 api_router = APIRouter(prefix="/api/v1")
 
@@ -13,3 +13,6 @@ api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(auth.router, tags=["authentication"])
 api_router.include_router(students.router, tags=["students"])
+api_router.include_router(kpis.router, tags=["kpis"])
+api_router.include_router(exports.router, tags=["exports"])
+api_router.include_router(reports.router, tags=["reports"])
@@ -0,0 +1,372 @@
+"""
+Caching layer.
+Read-through cache with a small in-process LRU in front of Redis.
+The ``a``-prefixed methods talk to Redis through ``redis.asyncio`` so they
+never block the event loop.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, cast
+
+import redis
+import redis.asyncio as aredis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds to stop talking to Redis after a connection failure
+REDIS_RETRY_SECONDS = 30.0
+
+
+class LRUCache:
+    """Thread-safe, size-bounded in-process cache with per-entry TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl_seconds: Default time-to-live of an entry
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a live entry and mark it recently used, else None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used when full."""
+        ttl = self.ttl_seconds if ttl is None else min(ttl, self.ttl_seconds)
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """Remove entries."""
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every entry whose key starts with ``prefix``."""
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class Cache:
+    """Two-tier cache: local LRU first, then Redis, then the loader."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        default_ttl: int,
+        enabled: bool = True,
+        local_max_entries: int = 1024,
+        local_ttl_seconds: float = 30.0,
+        key_prefix: str = "cache:",
+    ):
+        """
+        Initialize cache.
+
+        The local tier keeps entries for at most ``local_ttl_seconds`` so
+        invalidations made by other processes are picked up quickly.
+
+        Args:
+            redis_url: Redis connection URL, or None for local-only caching
+            default_ttl: Default time-to-live in seconds
+            enabled: When False every lookup goes to the loader
+            local_max_entries: Size of the in-process LRU
+            local_ttl_seconds: Maximum lifetime of a local entry
+            key_prefix: Prefix applied to Redis keys
+        """
+        self.enabled = enabled
+        self.default_ttl = default_ttl
+        self.key_prefix = key_prefix
+        self.local = LRUCache(local_max_entries, local_ttl_seconds)
+        self._redis_url = redis_url
+        self._redis: Optional[redis.Redis] = None
+        self._aredis: Optional[aredis.Redis] = None
+        self._aredis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_retry_at = 0.0
+
+    def get(self, key: str, local_ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Return a cached value or None.
+
+        Args:
+            key: Cache key
+            local_ttl: Lifetime of a Redis hit in the local tier (default:
+                the local TTL); 0 keeps the value out of the local tier
+        """
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            raw = cast(Optional[bytes], client.get(self.key_prefix + key))
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+        if raw is None:
+            return None
+        value = json.loads(raw)
+        self._set_local(key, value, local_ttl)
+        return value
+
+    def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, local_ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store a JSON-serializable value in both tiers.
+
+        Args:
+            key: Cache key
+            value: Value to store; None is ignored
+            ttl: Time-to-live in seconds (default: ``default_ttl``)
+            local_ttl: Lifetime in the local tier (default: ``ttl`` capped by
+                the local TTL); 0 stores the value in Redis only
+        """
+        if not self.enabled or value is None:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        self._set_local(key, value, ttl if local_ttl is None else min(ttl, local_ttl))
+
+        client = self._client()
+        if client is None:
+            return
+        try:
+            client.setex(self.key_prefix + key, ttl, json.dumps(value, default=str))
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[int] = None,
+        local_ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Read-through lookup.
+
+        Args:
+            key: Cache key
+            loader: Called on a miss; a None result is not cached
+            ttl: Time-to-live in seconds (default: ``default_ttl``)
+            local_ttl: Lifetime in the local tier; 0 bypasses it, for values
+                whose invalidation must reach every process at once
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key, local_ttl)
+        if value is None:
+            value = loader()
+            self.set(key, value, ttl, local_ttl)
+        return value
+
+    async def aget(self, key: str, local_ttl: Optional[float] = None) -> Optional[Any]:
+        """Async version of ``get``."""
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        client = self._aclient()
+        if client is None:
+            return None
+        try:
+            raw = await client.get(self.key_prefix + key)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+        if raw is None:
+            return None
+        value = json.loads(raw)
+        self._set_local(key, value, local_ttl)
+        return value
+
+    async def aset(
+        self, key: str, value: Any, ttl: Optional[int] = None, local_ttl: Optional[float] = None
+    ) -> None:
+        """Async version of ``set``."""
+        if not self.enabled or value is None:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        self._set_local(key, value, ttl if local_ttl is None else min(ttl, local_ttl))
+
+        client = self._aclient()
+        if client is None:
+            return
+        try:
+            await client.setex(self.key_prefix + key, ttl, json.dumps(value, default=str))
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    async def aget_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        local_ttl: Optional[float] = None,
+    ) -> Any:
+        """Read-through lookup with an async loader."""
+        value = await self.aget(key, local_ttl)
+        if value is None:
+            value = await loader()
+            await self.aset(key, value, ttl, local_ttl)
+        return value
+
+    def delete(self, *keys: str) -> None:
+        """Invalidate keys in both tiers."""
+        if not keys:
+            return
+        self.local.delete(*keys)
+
+        client = self._client()
+        if client is None:
+            return
+        try:
+            client.delete(*(self.key_prefix + key for key in keys))
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Invalidate every key starting with ``prefix`` in both tiers."""
+        self.local.delete_prefix(prefix)
+
+        client = self._client()
+        if client is None:
+            return
+        try:
+            keys = list(client.scan_iter(match=f"{self.key_prefix}{prefix}*", count=500))
+            if keys:
+                client.delete(*keys)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    async def adelete(self, *keys: str) -> None:
+        """Async version of ``delete``."""
+        if not keys:
+            return
+        self.local.delete(*keys)
+
+        client = self._aclient()
+        if client is None:
+            return
+        try:
+            await client.delete(*(self.key_prefix + key for key in keys))
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    async def adelete_prefix(self, prefix: str) -> None:
+        """Async version of ``delete_prefix``; the SCAN yields between batches."""
+        self.local.delete_prefix(prefix)
+
+        client = self._aclient()
+        if client is None:
+            return
+        try:
+            keys = [key async for key in client.scan_iter(match=f"{self.key_prefix}{prefix}*", count=500)]
+            if keys:
+                await client.delete(*keys)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def clear(self) -> None:
+        """Drop the local tier (Redis entries expire on their own)."""
+        self.local.clear()
+
+    def _set_local(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store a value in the local tier unless its TTL is 0."""
+        if ttl is None or ttl > 0:
+            self.local.set(key, value, ttl)
+
+    def _client(self) -> Optional[redis.Redis]:
+        """Return the Redis client unless Redis is disabled or backing off."""
+        if not self._redis_url or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                self._redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    def _aclient(self) -> Optional[aredis.Redis]:
+        """
+        Return the asyncio Redis client of the running event loop.
+
+        Connections of ``redis.asyncio`` belong to the loop that opened them,
+        so a new client is created when called from a different loop.
+        """
+        if not self._redis_url or time.monotonic() < self._redis_retry_at:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._aredis is None or self._aredis_loop is not loop:
+            self._aredis = aredis.Redis.from_url(
+                self._redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+            self._aredis_loop = loop
+        return self._aredis
+
+    def _redis_failed(self, error: Exception) -> None:
+        """Fall back to the local tier for a while after a Redis error."""
+        logger.warning(f"Redis cache unavailable, using local cache only: {error}")
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+
+# Create cache instance
+cache = Cache(
+    redis_url=settings.REDIS_URL,
+    default_ttl=settings.CACHE_TTL_SECONDS,
+    enabled=settings.ENABLE_CACHING,
+    local_max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+    local_ttl_seconds=settings.CACHE_LOCAL_TTL_SECONDS,
+)
@@ -32,12 +32,25 @@ class Settings(BaseSettings):
         """Build database URL from individual credentials."""
         return f"postgresql://{self.PGUSER}:{self.PGPASSWORD}@{self.PGHOST}:{self.PGPORT}/{self.DB_NAME}"
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """Build asyncpg database URL from individual credentials."""
+        return f"postgresql+asyncpg://{self.PGUSER}:{self.PGPASSWORD}@{self.PGHOST}:{self.PGPORT}/{self.DB_NAME}"
+
+    # Query diagnostics
+    SLOW_QUERY_SECONDS: float = 0.5  # 0 disables the slow query log
+    SLOW_QUERY_EXPLAIN: bool = False  # Re-runs slow SELECTs under EXPLAIN ANALYZE
+    N_PLUS_ONE_THRESHOLD: int = 10
+    QUERY_BUDGET_DEFAULT: int = 100
+    QUERY_BUDGET_STRICT: bool = False
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
     # GitHub
     GITHUB_TOKEN: Optional[str] = None
     GITHUB_API_BASE_URL: str = "https://api.github.com"
+    GITHUB_MAX_CONCURRENCY: int = 10
 
     # Email
     SMTP_HOST: str = "smtp.gmail.com"
@@ -52,6 +65,16 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    # Lifetime of principals in each worker's local cache tier. Invalidation
+    # only reaches the local tier of the worker making the change, so other
+    # workers may serve a deactivated user for this long; 0 (the default)
+    # keeps principals in Redis only.
+    PRINCIPAL_LOCAL_TTL_SECONDS: int = 0
+
+    # Password hashing
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
 
     # API
     API_V1_PREFIX: str = "/api/v1"
@@ -60,15 +83,36 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
+    KPI_DIRTY_RECOMPUTE_SECONDS: int = 300
+    KPI_FULL_RECOMPUTE_HOUR: int = 2
+    KPI_PIPELINE_KEYS_PER_TASK: int = 4
+    KPI_HISTORY_ROLLUP_HOUR: int = 3
+    KPI_HISTORY_RAW_DAYS: int = 30  # Raw snapshot history kept before rolling up
 
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
+    LOG_QUEUE: bool = True  # Format and write records on a background thread
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_SAMPLE_RATES: str = ""  # e.g. "httpx=0.01,app.api=0.1"; applies below WARNING
 
     # Features
     ENABLE_WEBHOOKS: bool = True
     ENABLE_CACHING: bool = True
     CACHE_TTL_SECONDS: int = 3600
+    CACHE_LOCAL_MAX_ENTRIES: int = 1024
+    CACHE_LOCAL_TTL_SECONDS: int = 30
+    ENABLE_METRICS: bool = True
+
+    # Exports
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Reports
+    REPORTS_DIR: str = "var/reports"  # Rendered report artifacts, keyed by content hash
+
+    # Collectors
+    COLLECTOR_BATCH_SIZE: int = 500
+    COLLECTOR_BUFFER_BATCHES: int = 4
 
     class Config:
         """Pydantic configuration."""
@@ -81,6 +125,16 @@ class Settings(BaseSettings):
         """Parse CORS origins string into list."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def log_sample_rates(self) -> dict[str, float]:
+        """Parse log sampling rates string into a logger-to-rate mapping."""
+        rates = {}
+        for entry in self.LOG_SAMPLE_RATES.split(","):
+            name, _, rate = entry.partition("=")
+            if name.strip():
+                rates[name.strip()] = float(rate)
+        return rates
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
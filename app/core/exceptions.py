@@ -78,6 +78,17 @@ class ExternalServiceException(KPISystemException):
         )
 
 
+class ServiceUnavailableException(KPISystemException):
+    """Raised when a bounded resource is saturated and the request is shed."""
+
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(
+            message=message,
+            error_code="SERVICE_UNAVAILABLE",
+            status_code=503,
+        )
+
+
 class DatabaseException(KPISystemException):
     """Raised when database operation fails."""
 
@@ -1,12 +1,80 @@
-"""Logging configuration for the application."""
+"""
+Logging configuration for the application.
 
-import json
+In queue mode request threads only enqueue records; a background
+listener thread formats and writes them. Records carry the context bound
+to the current request (request id, user id, route), and chatty loggers
+can be sampled below WARNING.
+"""
+
+import atexit
+import copy
 import logging
 import logging.config
-from typing import Any
+import queue
+import random
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, Dict, Iterator, MutableMapping, Optional
+
+import orjson
 
 from app.core.config import settings
 
+# Fields bound to the current request; the dict is shared with the threads
+# and tasks the request starts, so fields bound there are seen everywhere
+_log_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("log_context", default=None)
+_request_scope: ContextVar[Optional[MutableMapping[str, Any]]] = ContextVar("request_scope", default=None)
+
+# Handler and listener installed by setup_logging
+_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+
+
+def current_log_context() -> Dict[str, Any]:
+    """Fields bound to the current request, including its matched route."""
+    context = dict(_log_context.get() or {})
+    scope = _request_scope.get()
+    route = scope.get("route") if scope is not None else None
+    if route is not None:
+        context["route"] = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return context
+
+
+def bind_log_context(**fields: Any) -> None:
+    """
+    Add fields to the context of the current request.
+
+    Outside a request (or ``log_context`` block) this does nothing.
+
+    Args:
+        **fields: Fields to add, e.g. ``user_id``
+    """
+    context = _log_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Bind fields to the records logged inside the block.
+
+    Args:
+        **fields: Initial fields
+
+    Yields:
+        The bound fields, extended by ``bind_log_context``
+    """
+    context = {**(_log_context.get() or {}), **fields}
+    token = _log_context.set(context)
+    try:
+        yield context
+    finally:
+        _log_context.reset(token)
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -20,14 +88,145 @@ class JSONFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
 
+        # Records prepared by ContextQueueHandler carry their context
+        context = getattr(record, "context", None)
+        if context is None:
+            context = current_log_context()
+        log_data.update(context)
+
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
+
+        return orjson.dumps(log_data, default=str).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of a logger's records below WARNING.
+
+    Rates apply to a logger and its children; the most specific configured
+    logger wins. Warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: Dict[str, float], rng: Callable[[], float] = random.random):
+        """
+        Initialize filter.
+
+        Args:
+            rates: Fraction of records kept per logger name
+            rng: Uniform random source in [0, 1)
+        """
+        super().__init__()
+        self.rates = rates
+        self._rng = rng
+        self._resolved: Dict[str, float] = {}
+
+    def rate(self, name: str) -> float:
+        """Sampling rate of a logger."""
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep a record."""
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate(record.name)
+        return rate >= 1.0 or self._rng() < rate
+
 
-        return json.dumps(log_data)
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that captures everything a record needs from the calling
+    thread, so the listener only formats and writes.
+
+    When the queue is full records are dropped and counted rather than
+    blocking the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize handler.
+
+        Args:
+            log_queue: Queue drained by the listener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments and attach the bound context."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.context = current_log_context()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping it when the listener has fallen behind."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogContextMiddleware:
+    """
+    ASGI middleware binding a request id, method and path (and, once
+    routed, the route) to the records logged while handling a request.
+
+    The request id is taken from the ``X-Request-ID`` header when present
+    and echoed in the response.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: MutableMapping[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1")[:64] or uuid.uuid4().hex
+
+        async def send_wrapper(message: MutableMapping[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        token = _request_scope.set(scope)
+        try:
+            with log_context(request_id=request_id, method=scope["method"], path=scope["path"]):
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_scope.reset(token)
 
 
 def setup_logging() -> None:
     """Configure application logging based on settings."""
+    global _handler, _listener
+
     if settings.LOG_FORMAT == "json":
         formatter = JSONFormatter()
     else:
@@ -35,18 +234,48 @@ def setup_logging() -> None:
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
 
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.LOG_LEVEL))
+
+    # Replace the handler of an earlier call
+    shutdown_logging()
+
+    handler: logging.Handler
+    if settings.LOG_QUEUE:
+        records: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        handler = ContextQueueHandler(records)
+        _listener = QueueListener(records, stream_handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        handler = stream_handler
+    if settings.log_sample_rates:
+        handler.addFilter(SamplingFilter(settings.log_sample_rates))
     root_logger.addHandler(handler)
+    _handler = handler
 
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and remove the handler installed by ``setup_logging``."""
+    global _handler, _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
     return logging.getLogger(name)
+
+
+atexit.register(shutdown_logging)
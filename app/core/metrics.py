@@ -0,0 +1,236 @@
+"""
+Prometheus metrics.
+Per-route request latency, size and database usage, plus connection and
+password hashing pool gauges, exposed at ``/metrics``; and per-route
+query budgets.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, MutableMapping, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import pool
+from sqlalchemy.engine import Engine
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.security import PasswordHashPool
+from app.db.instrumentation import check_query_budget, track_queries
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# Route label of requests that matched no route, to bound label cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requests handled",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being handled",
+    ["method"],
+)
+HTTP_RESPONSE_BYTES = Histogram(
+    "http_response_size_bytes",
+    "Response body size",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000),
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Database time per request",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements per request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 1000),
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the route that handled a request, e.g. ``/students/{student_id}``."""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """
+    ASGI middleware recording request metrics.
+
+    Implemented at the ASGI level rather than with ``BaseHTTPMiddleware``
+    so streaming responses are not buffered and their full body size and
+    duration are measured.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]], skip_paths: tuple = ("/metrics",)):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            skip_paths: Paths not recorded
+        """
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            with track_queries() as queries:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            # The router stores the matched route in the scope
+            route = route_template(scope)
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            HTTP_REQUEST_SECONDS.labels(method, route).observe(elapsed)
+            HTTP_RESPONSE_BYTES.labels(method, route).observe(size)
+            HTTP_REQUEST_DB_SECONDS.labels(method, route).observe(queries.seconds)
+            HTTP_REQUEST_DB_QUERIES.labels(method, route).observe(queries.count)
+
+
+class QueryBudgetMiddleware:
+    """
+    ASGI middleware checking each request's statements against the
+    budget of its route.
+
+    Repeated statement shapes are logged as possible N+1 queries. Over
+    budget requests are logged, or fail with ``QueryBudgetExceeded`` in
+    strict mode, which tests enable to catch query regressions.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]], strict: Optional[bool] = None):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            strict: Raise on over budget requests (default: ``QUERY_BUDGET_STRICT``)
+        """
+        self.app = app
+        self.strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+            await self.app(scope, receive, send)
+
+        # Routes declare their own budget with @query_budget
+        budget = getattr(scope.get("endpoint"), "query_budget", settings.QUERY_BUDGET_DEFAULT)
+        strict = settings.QUERY_BUDGET_STRICT if self.strict is None else self.strict
+        check_query_budget(queries, route_template(scope), budget, strict)
+
+
+class PoolCollector(Collector):
+    """Reads connection and password hashing pool state at scrape time."""
+
+    def __init__(self, engines: Dict[str, Engine], password_pool: PasswordHashPool):
+        """
+        Initialize collector.
+
+        Args:
+            engines: Engines keyed by ``pool`` label (sync engines of async ones)
+            password_pool: Password hashing pool
+        """
+        self.engines = engines
+        self.password_pool = password_pool
+
+    def collect(self) -> Iterator[Any]:
+        """Yield the current pool metrics."""
+        gauges = {
+            name: GaugeMetricFamily(f"db_pool_{name}", description, labels=["pool"])
+            for name, description in (
+                ("size", "Connections the pool keeps open"),
+                ("checked_out", "Connections in use"),
+                ("checked_in", "Idle connections"),
+                ("overflow", "Connections opened beyond the pool size"),
+            )
+        }
+        for label, engine in self.engines.items():
+            # Read through the engine, since dispose() replaces its pool
+            queue_pool = engine.pool
+            if not isinstance(queue_pool, pool.QueuePool):
+                continue
+            gauges["size"].add_metric([label], queue_pool.size())
+            gauges["checked_out"].add_metric([label], queue_pool.checkedout())
+            gauges["checked_in"].add_metric([label], queue_pool.checkedin())
+            gauges["overflow"].add_metric([label], max(queue_pool.overflow(), 0))
+        yield from gauges.values()
+
+        stats = self.password_pool.stats()
+        yield GaugeMetricFamily(
+            "password_hash_pool_in_progress", "Hashes being computed", value=stats["in_progress"]
+        )
+        yield GaugeMetricFamily(
+            "password_hash_pool_queued", "Hashes waiting for a worker", value=stats["queued"]
+        )
+        yield CounterMetricFamily("password_hash_pool_completed", "Hashes computed", value=stats["completed"])
+        yield CounterMetricFamily(
+            "password_hash_pool_rejected", "Hashes rejected with a full queue", value=stats["rejected"]
+        )
+        yield CounterMetricFamily(
+            "password_hash_pool_wait_seconds", "Time hashes waited for a worker", value=stats["wait_seconds_total"]
+        )
+        yield CounterMetricFamily(
+            "password_hash_pool_busy_seconds", "Time workers spent hashing", value=stats["busy_seconds_total"]
+        )
+
+
+def register_pool_metrics(engines: Dict[str, Engine], password_pool: PasswordHashPool) -> PoolCollector:
+    """
+    Register pool gauges with the default registry.
+
+    Args:
+        engines: Engines keyed by ``pool`` label
+        password_pool: Password hashing pool
+
+    Returns:
+        The registered collector
+    """
+    collector = PoolCollector(engines, password_pool)
+    REGISTRY.register(collector)
+    return collector
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Render all metrics in the Prometheus text format."""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
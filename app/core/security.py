@@ -2,18 +2,25 @@
 Security utilities for authentication, password hashing, and JWT token management.
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 class TokenData(BaseModel):
     """JWT token payload data."""
@@ -34,6 +41,117 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHashPool:
+    """
+    Bounded worker pool that keeps bcrypt off the event loop.
+
+    bcrypt releases the GIL, so a small thread pool gives real parallelism.
+    Calls beyond ``max_workers + max_queue`` are rejected immediately so a
+    login burst sheds load instead of stalling every request.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        """
+        Initialize pool.
+
+        Args:
+            max_workers: Number of hashing threads
+            max_queue: Calls allowed to wait for a free thread
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+        self._busy_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` on the pool.
+
+        Cancelling the caller does not stop a job that already started, so
+        a job stays counted as pending until its worker is done with it.
+
+        Raises:
+            ServiceUnavailableException: If the queue is full
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ServiceUnavailableException(
+                    "Authentication is busy, please retry shortly"
+                )
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+            executor = self._executor
+
+        future = executor.submit(self._timed, func, time.perf_counter(), *args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        """Executor callback: the job finished, or was cancelled while queued."""
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed += 1
+
+    def _timed(self, func: Callable[..., T], submitted: float, *args: Any) -> T:
+        """Run ``func`` in a worker thread, recording wait and busy time."""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._wait_seconds += started - submitted
+                self._busy_seconds += finished - started
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue-depth and throughput counters."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_progress": min(self._pending, self.max_workers),
+                "queued": max(self._pending - self.max_workers, 0),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_seconds_total": self._wait_seconds,
+                "busy_seconds_total": self._busy_seconds,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# Shared pool used by the async hashing helpers
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hash pool."""
+    return await password_hash_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hash pool."""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
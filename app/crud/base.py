@@ -3,11 +3,33 @@ Base CRUD class with generic Create, Read, Update, Delete operations.
 All specific CRUD classes should inherit from this.
 """
 
-from typing import Generic, TypeVar, Optional, List, Dict, Any
+import json
+from typing import Generic, TypeVar, Optional, List, Dict, Any, Protocol, Sequence
 
+from sqlalchemy import delete, event, func, insert, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-ModelType = TypeVar("ModelType")
+from app.core.cache import cache
+from app.crud.pagination import CountMode, Page, decode_cursor, encode_cursor
+from app.services.calculators.change_tracker import (
+    KEY_ATTRIBUTES,
+    TRACKED_MODELS,
+    bulk_changes,
+    mark_instances_dirty,
+)
+
+
+class Identified(Protocol):
+    """A mapped model with an ``id`` primary key column."""
+
+    id: Any
+
+
+ModelType = TypeVar("ModelType", bound=Identified)
+ItemType = TypeVar("ItemType")
 CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
 
@@ -15,6 +37,18 @@ UpdateSchemaType = TypeVar("UpdateSchemaType")
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base CRUD class."""
 
+    # Cache namespace of views built from this model; None disables invalidation
+    cache_namespace: Optional[str] = None
+
+    # Columns defining the keyset (cursor) page order; the last must be unique
+    keyset_columns: tuple[str, ...] = ("id",)
+
+    # Unique columns identifying a record for upsert_many
+    natural_key: tuple[str, ...] = ("id",)
+
+    # Maximum ids per IN (...) list of bulk statements
+    bulk_chunk_size = 1000
+
     def __init__(self, model: type[ModelType]):
         """
         Initialize CRUD with model.
@@ -40,6 +74,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        self.invalidate_cache(db_obj.id)
         return db_obj
 
     def update(
@@ -54,6 +89,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        self.invalidate_cache(db_obj.id)
         return db_obj
 
     def remove(self, db: Session, id: Any) -> ModelType:
@@ -62,4 +98,599 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if obj:
             db.delete(obj)
             db.commit()
+            self.invalidate_cache(id)
         return obj
+
+    async def aget(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """Get record by ID (async)."""
+        return await db.get(self.model, id)
+
+    async def aget_multi(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100
+    ) -> List[ModelType]:
+        """Get multiple records with pagination (async)."""
+        result = await db.scalars(select(self.model).offset(skip).limit(limit))
+        return list(result.all())
+
+    async def acreate(self, db: AsyncSession, obj_in: Dict[str, Any]) -> ModelType:
+        """Create a new record (async)."""
+        db_obj = self.model(**obj_in)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        await self.ainvalidate_cache(db_obj.id)
+        return db_obj
+
+    async def aupdate(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        obj_in: Dict[str, Any],
+    ) -> ModelType:
+        """Update an existing record (async)."""
+        for field, value in obj_in.items():
+            setattr(db_obj, field, value)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        await self.ainvalidate_cache(db_obj.id)
+        return db_obj
+
+    async def aremove(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """Delete a record (async)."""
+        obj = await db.get(self.model, id)
+        if obj:
+            await db.delete(obj)
+            await db.commit()
+            await self.ainvalidate_cache(id)
+        return obj
+
+    def create_many(
+        self, db: Session, objs_in: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[ModelType]:
+        """
+        Create many records with one batched INSERT ... RETURNING.
+
+        Returned objects are populated from RETURNING, without a refresh per
+        row. When committing they are detached first so the commit does not
+        expire them.
+
+        Args:
+            db: Database session
+            objs_in: Column values of each new record
+            commit: Commit the transaction when done
+
+        Returns:
+            Created records, in input order
+        """
+        if not objs_in:
+            return []
+        objs = list(db.scalars(self._create_many_statement(), list(objs_in)))
+        self._finish_bulk_write(db, objs, commit)
+        return objs
+
+    def update_many(
+        self, db: Session, objs_in: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[ModelType]:
+        """
+        Update many records by primary key with one batched UPDATE.
+
+        Args:
+            db: Database session
+            objs_in: Changed column values of each record, including ``id``
+            commit: Commit the transaction when done
+
+        Returns:
+            Updated records, reloaded in chunks of ``bulk_chunk_size``
+        """
+        if not objs_in:
+            return []
+        previous = self._previous(db, ("id",), objs_in)
+        db.execute(update(self.model), list(objs_in))
+        ids = [obj_in["id"] for obj_in in objs_in]
+        objs: List[ModelType] = []
+        for statement in self._fetch_statements(ids):
+            objs.extend(db.scalars(statement))
+        self._finish_bulk_write(db, objs, commit, previous)
+        return objs
+
+    def upsert_many(
+        self,
+        db: Session,
+        objs_in: Sequence[Dict[str, Any]],
+        update_columns: Optional[Sequence[str]] = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        Insert or update many records keyed on ``natural_key``.
+
+        Uses INSERT ... ON CONFLICT (natural key) DO UPDATE; when the input
+        repeats a natural key, the last occurrence wins.
+
+        Args:
+            db: Database session
+            objs_in: Column values of each record, including the natural key
+            update_columns: Columns overwritten on conflict (default: all
+                given columns except the key)
+            commit: Commit the transaction when done
+
+        Returns:
+            Inserted and updated records
+        """
+        if not objs_in:
+            return []
+        rows = self._dedupe(objs_in)
+        previous = self._previous(db, self.natural_key, rows)
+        statement = self._upsert_many_statement(db, rows, update_columns)
+        objs = list(db.scalars(statement, rows))
+        self._finish_bulk_write(db, objs, commit, previous)
+        return objs
+
+    def remove_many(
+        self, db: Session, ids: Sequence[Any], commit: bool = True
+    ) -> List[ModelType]:
+        """
+        Delete many records by primary key with set-based DELETEs.
+
+        ORM relationship cascades are not applied; dependent rows must be
+        removed first.
+
+        Args:
+            db: Database session
+            ids: Primary keys to delete
+            commit: Commit the transaction when done
+
+        Returns:
+            Deleted records
+        """
+        objs: List[ModelType] = []
+        for statement in self._remove_statements(ids):
+            objs.extend(db.scalars(statement))
+        self._finish_bulk_write(db, objs, commit)
+        return objs
+
+    async def acreate_many(
+        self, db: AsyncSession, objs_in: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[ModelType]:
+        """Create many records (async); see ``create_many``."""
+        if not objs_in:
+            return []
+        objs = list(await db.scalars(self._create_many_statement(), list(objs_in)))
+        await self._afinish_bulk_write(db, objs, commit)
+        return objs
+
+    async def aupdate_many(
+        self, db: AsyncSession, objs_in: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> List[ModelType]:
+        """Update many records by primary key (async); see ``update_many``."""
+        if not objs_in:
+            return []
+        previous = await db.run_sync(self._previous, ("id",), objs_in)
+        await db.execute(update(self.model), list(objs_in))
+        ids = [obj_in["id"] for obj_in in objs_in]
+        objs: List[ModelType] = []
+        for statement in self._fetch_statements(ids):
+            objs.extend(await db.scalars(statement))
+        await self._afinish_bulk_write(db, objs, commit, previous)
+        return objs
+
+    async def aupsert_many(
+        self,
+        db: AsyncSession,
+        objs_in: Sequence[Dict[str, Any]],
+        update_columns: Optional[Sequence[str]] = None,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """Insert or update many records (async); see ``upsert_many``."""
+        if not objs_in:
+            return []
+        rows = self._dedupe(objs_in)
+        previous = await db.run_sync(self._previous, self.natural_key, rows)
+        statement = self._upsert_many_statement(db, rows, update_columns)
+        objs = list(await db.scalars(statement, rows))
+        await self._afinish_bulk_write(db, objs, commit, previous)
+        return objs
+
+    async def aremove_many(
+        self, db: AsyncSession, ids: Sequence[Any], commit: bool = True
+    ) -> List[ModelType]:
+        """Delete many records by primary key (async); see ``remove_many``."""
+        objs: List[ModelType] = []
+        for statement in self._remove_statements(ids):
+            objs.extend(await db.scalars(statement))
+        await self._afinish_bulk_write(db, objs, commit)
+        return objs
+
+    def insert_statement(self, db):
+        """
+        Dialect-specific INSERT supporting ON CONFLICT clauses.
+
+        Args:
+            db: Session (sync or async) whose dialect is targeted
+
+        Returns:
+            PostgreSQL or SQLite insert construct for the model
+
+        Raises:
+            NotImplementedError: On other database backends
+        """
+        dialect = self._dialect(db)
+        if dialect == "postgresql":
+            return postgresql.insert(self.model)
+        if dialect == "sqlite":
+            return sqlite.insert(self.model)
+        raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect}")
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Sequence[Any] = (),
+        count: CountMode = CountMode.NONE,
+    ) -> Page[ModelType]:
+        """
+        Get a page of records in keyset order.
+
+        With a cursor the page starts right after the cursor's row, so it
+        costs the same however deep it is; ``skip`` is only used without
+        a cursor.
+
+        Args:
+            db: Database session
+            cursor: ``next_cursor`` of the previous page
+            skip: Number of records to skip when no cursor is given
+            limit: Number of records to return
+            filters: SQLAlchemy filter expressions
+            count: Whether and how to compute the total
+
+        Returns:
+            Page with items, next cursor and optional total
+        """
+        statement = self._page_statement(cursor, skip, limit, filters)
+        rows = list(db.scalars(statement).all())
+
+        total, is_estimate = None, False
+        if count == CountMode.ESTIMATE and self._dialect(db) == "postgresql":
+            total = self._estimate_from_plan(
+                db.execute(text(self._estimate_sql(db, filters))).scalar()
+            )
+            is_estimate = total is not None
+        if count != CountMode.NONE and total is None:
+            total = db.scalar(self._count_statement(filters))
+        return self._make_page(rows, limit, total, is_estimate)
+
+    def get_page_rows(
+        self,
+        db: Session,
+        columns: Sequence[Any],
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Sequence[Any] = (),
+        count: CountMode = CountMode.NONE,
+    ) -> Page[RowMapping]:
+        """
+        Get a page of column values in keyset order; see ``get_page``.
+
+        Selecting plain columns skips building ORM instances, which
+        dominates the cost of large pages that are only serialized.
+
+        Args:
+            db: Database session
+            columns: Columns to select; keyset columns are added if missing
+            cursor: ``next_cursor`` of the previous page
+            skip: Number of records to skip when no cursor is given
+            limit: Number of records to return
+            filters: SQLAlchemy filter expressions
+            count: Whether and how to compute the total
+
+        Returns:
+            Page whose items are row mappings keyed by column name
+        """
+        statement = self._page_statement(cursor, skip, limit, filters, self._row_entities(columns))
+        rows = list(db.execute(statement).all())
+
+        total, is_estimate = None, False
+        if count == CountMode.ESTIMATE and self._dialect(db) == "postgresql":
+            total = self._estimate_from_plan(
+                db.execute(text(self._estimate_sql(db, filters))).scalar()
+            )
+            is_estimate = total is not None
+        if count != CountMode.NONE and total is None:
+            total = db.scalar(self._count_statement(filters))
+        return self._mapping_page(self._make_page(rows, limit, total, is_estimate))
+
+    async def aget_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Sequence[Any] = (),
+        count: CountMode = CountMode.NONE,
+    ) -> Page[ModelType]:
+        """Get a page of records in keyset order (async); see ``get_page``."""
+        statement = self._page_statement(cursor, skip, limit, filters)
+        rows = list((await db.scalars(statement)).all())
+
+        total, is_estimate = None, False
+        if count == CountMode.ESTIMATE and self._dialect(db) == "postgresql":
+            result = await db.execute(text(self._estimate_sql(db, filters)))
+            total = self._estimate_from_plan(result.scalar())
+            is_estimate = total is not None
+        if count != CountMode.NONE and total is None:
+            total = await db.scalar(self._count_statement(filters))
+        return self._make_page(rows, limit, total, is_estimate)
+
+    async def aget_page_rows(
+        self,
+        db: AsyncSession,
+        columns: Sequence[Any],
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Sequence[Any] = (),
+        count: CountMode = CountMode.NONE,
+    ) -> Page[RowMapping]:
+        """Get a page of column values in keyset order (async); see ``get_page_rows``."""
+        statement = self._page_statement(cursor, skip, limit, filters, self._row_entities(columns))
+        rows = list((await db.execute(statement)).all())
+
+        total, is_estimate = None, False
+        if count == CountMode.ESTIMATE and self._dialect(db) == "postgresql":
+            result = await db.execute(text(self._estimate_sql(db, filters)))
+            total = self._estimate_from_plan(result.scalar())
+            is_estimate = total is not None
+        if count != CountMode.NONE and total is None:
+            total = await db.scalar(self._count_statement(filters))
+        return self._mapping_page(self._make_page(rows, limit, total, is_estimate))
+
+    def _keyset(self) -> list:
+        """Keyset columns as SQLAlchemy attributes."""
+        return [getattr(self.model, name) for name in self.keyset_columns]
+
+    def _row_entities(self, columns: Sequence[Any]) -> list:
+        """Requested columns plus any keyset columns the cursor needs."""
+        names = {column.key for column in columns}
+        return [*columns, *(column for column in self._keyset() if column.key not in names)]
+
+    def _page_statement(
+        self,
+        cursor: Optional[str],
+        skip: int,
+        limit: int,
+        filters: Sequence[Any],
+        entities: Optional[Sequence[Any]] = None,
+    ):
+        """Select one row more than a page, in keyset order."""
+        columns = self._keyset()
+        statement = select(*(entities or [self.model])).where(*filters)
+        if cursor:
+            values = decode_cursor(cursor, len(columns))
+            statement = statement.where(tuple_(*columns) > tuple_(*values))
+        elif skip:
+            statement = statement.offset(skip)
+        return statement.order_by(*columns).limit(limit + 1)
+
+    def _count_statement(self, filters: Sequence[Any]):
+        """Exact count of the rows matching ``filters``."""
+        return select(func.count()).select_from(
+            select(self.model.id).where(*filters).subquery()
+        )
+
+    def _estimate_sql(self, db, filters: Sequence[Any]) -> str:
+        """EXPLAIN statement whose top plan node carries the row estimate."""
+        statement = select(self.model.id).where(*filters)
+        compiled = statement.compile(
+            dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+        )
+        return f"EXPLAIN (FORMAT JSON) {compiled}"
+
+    @staticmethod
+    def _estimate_from_plan(plan: Any) -> Optional[int]:
+        """Extract the planner's row estimate from EXPLAIN JSON output."""
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        try:
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except (TypeError, LookupError, ValueError):
+            return None
+
+    @staticmethod
+    def _dialect(db) -> str:
+        """Name of the database dialect behind a session."""
+        name: str = db.get_bind().dialect.name
+        return name
+
+    def _make_page(
+        self,
+        rows: List[ItemType],
+        limit: int,
+        total: Optional[int],
+        is_estimate: bool,
+    ) -> Page[ItemType]:
+        """Trim the look-ahead row and build the next cursor."""
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, name) for name in self.keyset_columns]
+            )
+        return Page(
+            items=rows,
+            next_cursor=next_cursor,
+            total=total,
+            total_is_estimate=is_estimate,
+        )
+
+    @staticmethod
+    def _mapping_page(page: Page) -> Page[RowMapping]:
+        """Expose a page of rows as mappings keyed by column name."""
+        page.items = [row._mapping for row in page.items]
+        return page
+
+    def _create_many_statement(self):
+        """Batched INSERT returning the new rows in parameter order."""
+        return insert(self.model).returning(self.model, sort_by_parameter_order=True)
+
+    def _upsert_many_statement(
+        self, db, rows: List[Dict[str, Any]], update_columns: Optional[Sequence[str]]
+    ):
+        """INSERT ... ON CONFLICT (natural key) DO UPDATE ... RETURNING."""
+        statement = self.insert_statement(db)
+        if update_columns is None:
+            update_columns = [
+                column
+                for column in rows[0]
+                if column not in self.natural_key and column not in ("id", "created_at")
+            ]
+        values = {column: statement.excluded[column] for column in update_columns}
+        if hasattr(self.model, "updated_at"):
+            values["updated_at"] = func.now()
+
+        if values:
+            statement = statement.on_conflict_do_update(
+                index_elements=list(self.natural_key), set_=values
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(
+                index_elements=list(self.natural_key)
+            )
+        return statement.returning(self.model).execution_options(populate_existing=True)
+
+    def _fetch_statements(self, ids: Sequence[Any]):
+        """Reload records by primary key, one statement per chunk."""
+        for start in range(0, len(ids), self.bulk_chunk_size):
+            chunk = list(ids[start:start + self.bulk_chunk_size])
+            yield (
+                select(self.model)
+                .where(self.model.id.in_(chunk))
+                .order_by(self.model.id)
+                .execution_options(populate_existing=True)
+            )
+
+    def _remove_statements(self, ids: Sequence[Any]):
+        """DELETE ... RETURNING by primary key, one statement per chunk."""
+        ids = list(ids)
+        for start in range(0, len(ids), self.bulk_chunk_size):
+            chunk = ids[start:start + self.bulk_chunk_size]
+            yield (
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .returning(self.model)
+            )
+
+    def _dedupe(self, objs_in: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the last row per natural key (ON CONFLICT cannot hit a row twice)."""
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for obj_in in objs_in:
+            rows[tuple(obj_in[column] for column in self.natural_key)] = obj_in
+        return list(rows.values())
+
+    def _previous(
+        self, db: Session, key_columns: Sequence[str], objs_in: Sequence[Dict[str, Any]]
+    ) -> List[ModelType]:
+        """
+        Load what decides the KPI keys of rows a bulk write is about to change.
+
+        Returns transient instances holding the id and pre-write values of
+        ``KEY_ATTRIBUTES``, so rows moved to another department or session
+        also dirty the keys they leave. Empty for untracked models.
+        """
+        attributes = KEY_ATTRIBUTES.get(self.model)
+        if attributes is None:
+            return []
+        match = tuple_(*(getattr(self.model, column) for column in key_columns))
+        columns = [self.model.id, *(getattr(self.model, name) for name in attributes)]
+        keys = [tuple(obj_in[column] for column in key_columns) for obj_in in objs_in]
+        previous: List[ModelType] = []
+        for start in range(0, len(keys), self.bulk_chunk_size):
+            statement = select(*columns).where(
+                match.in_(keys[start:start + self.bulk_chunk_size])
+            )
+            previous.extend(self.model(**row) for row in db.execute(statement).mappings())
+        return previous
+
+    def _finish_bulk_write(
+        self, db: Session, objs: List[ModelType], commit: bool, previous: Sequence[ModelType] = ()
+    ) -> None:
+        """
+        Mark KPI keys dirty, commit and invalidate caches after a bulk write.
+
+        Without ``commit`` the caches are invalidated when the caller's
+        transaction commits, so no reader can cache the old rows again in
+        between.
+        """
+        if self.model in TRACKED_MODELS:
+            mark_instances_dirty(db, bulk_changes(objs, previous))
+        ids = [obj.id for obj in objs]
+        if not commit:
+            self._invalidate_after_commit(db, ids)
+            return
+        self._detach(db, objs)
+        db.commit()
+        self.invalidate_cache_many(ids)
+
+    async def _afinish_bulk_write(
+        self,
+        db: AsyncSession,
+        objs: List[ModelType],
+        commit: bool,
+        previous: Sequence[ModelType] = (),
+    ) -> None:
+        """Mark KPI keys dirty, commit and invalidate caches (async)."""
+        if self.model in TRACKED_MODELS:
+            await db.run_sync(mark_instances_dirty, bulk_changes(objs, previous))
+        ids = [obj.id for obj in objs]
+        if not commit:
+            self._invalidate_after_commit(db.sync_session, ids)
+            return
+        self._detach(db, objs)
+        await db.commit()
+        await self.ainvalidate_cache_many(ids)
+
+    def _invalidate_after_commit(self, db: Session, ids: Sequence[Any]) -> None:
+        """Invalidate the caches of ``ids`` once the session's transaction commits."""
+        if self.cache_namespace is None or not ids:
+            return
+        event.listen(
+            db, "after_commit", lambda session: self.invalidate_cache_many(ids), once=True
+        )
+
+    @staticmethod
+    def _detach(db, objs: List[ModelType]) -> None:
+        """Expunge bulk results so committing does not expire them."""
+        for obj in objs:
+            if obj in db:
+                db.expunge(obj)
+
+    def cache_key(self, id: Any) -> str:
+        """Cache key of the single-record view of ``id``."""
+        return f"{self.cache_namespace}:{id}"
+
+    def invalidate_cache(self, id: Any) -> None:
+        """Drop cached views of a record after it was written."""
+        if self.cache_namespace is not None:
+            cache.delete(self.cache_key(id))
+
+    def invalidate_cache_many(self, ids: Sequence[Any]) -> None:
+        """Drop cached views of many records in one round trip."""
+        if self.cache_namespace is not None and ids:
+            cache.delete(*(self.cache_key(id) for id in ids))
+
+    async def ainvalidate_cache(self, id: Any) -> None:
+        """Async version of ``invalidate_cache``."""
+        if self.cache_namespace is not None:
+            await cache.adelete(self.cache_key(id))
+
+    async def ainvalidate_cache_many(self, ids: Sequence[Any]) -> None:
+        """Async version of ``invalidate_cache_many``."""
+        if self.cache_namespace is not None and ids:
+            await cache.adelete(*(self.cache_key(id) for id in ids))
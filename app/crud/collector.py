@@ -0,0 +1,115 @@
+"""Collector sync state CRUD operations."""
+
+from typing import Any, Dict, Iterable, Optional, Sequence, cast
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.collector import CollectorSyncRun, CollectorSyncState
+
+
+class CRUDCollectorSyncState(CRUDBase[CollectorSyncState, dict, dict]):
+    """CRUD operations for CollectorSyncState model."""
+
+    natural_key = ("source", "entity")
+
+    def get_states(
+        self, db: Session, source: str, entities: Optional[Iterable[str]] = None
+    ) -> Dict[str, CollectorSyncState]:
+        """
+        Get sync states of a source keyed by entity.
+
+        Args:
+            db: Database session
+            source: Collector source name
+            entities: Restrict to these entities (default: all of the source)
+
+        Returns:
+            Mapping of entity to its state
+        """
+        statement = select(self.model).where(self.model.source == source)
+        if entities is None:
+            return {cast(str, state.entity): state for state in db.scalars(statement)}
+
+        entities = list(entities)
+        states: Dict[str, CollectorSyncState] = {}
+        for start in range(0, len(entities), self.bulk_chunk_size):
+            chunk = entities[start:start + self.bulk_chunk_size]
+            for state in db.scalars(statement.where(self.model.entity.in_(chunk))):
+                states[cast(str, state.entity)] = state
+        return states
+
+    def save_states(
+        self, db: Session, source: str, states: Sequence[Dict[str, Any]], commit: bool = True
+    ) -> int:
+        """
+        Upsert sync states of a source; later states of an entity win.
+
+        Args:
+            db: Database session
+            source: Collector source name
+            states: ``entity``, ``watermark``, ``etag`` and ``page_token`` of
+                each state
+            commit: Commit the transaction when done
+
+        Returns:
+            Number of entities written
+        """
+        rows = [{"source": source, **state} for state in states]
+        return len(self.upsert_many(db, rows, commit=commit))
+
+
+class CRUDCollectorSyncRun(CRUDBase[CollectorSyncRun, dict, dict]):
+    """CRUD operations for CollectorSyncRun model."""
+
+    def start(self, db: Session, source: str) -> CollectorSyncRun:
+        """Record the start of a run."""
+        return self.create(db, {"source": source, "status": "running"})
+
+    def finish(
+        self,
+        db: Session,
+        run: CollectorSyncRun,
+        counts: Dict[str, int],
+        stats: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> CollectorSyncRun:
+        """
+        Record the outcome of a run.
+
+        Args:
+            db: Database session
+            run: Run started by ``start``
+            counts: Values of the ``items_*`` and ``checkpoints`` columns
+            stats: Detailed statistics stored as JSON
+            error: Error message of a failed run
+
+        Returns:
+            Updated run
+        """
+        return self.update(
+            db,
+            run,
+            {
+                **counts,
+                "status": "failed" if error else "succeeded",
+                "finished_at": func.now(),
+                "stats": stats,
+                "error": error[:1000] if error else None,
+            },
+        )
+
+    def get_latest(
+        self, db: Session, source: str, status: Optional[str] = None
+    ) -> Optional[CollectorSyncRun]:
+        """Get the most recent run of a source, optionally with a given status."""
+        statement = select(self.model).where(self.model.source == source)
+        if status is not None:
+            statement = statement.where(self.model.status == status)
+        return db.scalar(statement.order_by(self.model.id.desc()).limit(1))
+
+
+# Create CRUD instances
+crud_collector_sync_state = CRUDCollectorSyncState(CollectorSyncState)
+crud_collector_sync_run = CRUDCollectorSyncRun(CollectorSyncRun)
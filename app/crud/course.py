@@ -0,0 +1,31 @@
+"""Course CRUD operations."""
+
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.course import Course
+
+
+class CRUDCourse(CRUDBase[Course, dict, dict]):
+    """CRUD operations for Course model."""
+
+    natural_key = ("course_code",)
+
+    def get_by_code(self, db: Session, course_code: str) -> Optional[Course]:
+        """Get course by course code."""
+        return db.query(self.model).filter(self.model.course_code == course_code).first()
+
+    async def aget_by_code(self, db: AsyncSession, course_code: str) -> Optional[Course]:
+        """Get course by course code (async)."""
+        course: Optional[Course] = await db.scalar(
+            select(self.model).where(self.model.course_code == course_code)
+        )
+        return course
+
+
+# Create CRUD instance
+crud_course = CRUDCourse(Course)
@@ -0,0 +1,319 @@
+"""KPI snapshot CRUD operations."""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, cast
+
+from sqlalchemy import case, delete, func, insert, select, union_all
+from sqlalchemy.engine import CursorResult, RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache
+from app.crud.base import CRUDBase
+from app.models.kpi import KPIDailyRollup, KPISessionRollup, KPISnapshot, KPISnapshotHistory
+
+# Columns identifying the metric a history row belongs to
+HISTORY_KEY = ("academic_session_id", "department_id", "pillar_name", "metric_name")
+
+
+class CRUDKPISnapshot(CRUDBase[KPISnapshot, dict, dict]):
+    """CRUD operations for KPISnapshot model."""
+
+    cache_namespace = "kpi"
+    natural_key = ("academic_session_id", "department_id", "pillar_name", "metric_name")
+
+    def get_department_summary(
+        self,
+        db: Session,
+        department_id: int,
+        academic_session_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a department's KPI snapshots grouped by session and pillar.
+
+        Results are served through the cache and invalidated whenever the
+        department's snapshots are recomputed.
+
+        Args:
+            db: Database session
+            department_id: Department ID
+            academic_session_id: Restrict to one academic session
+
+        Returns:
+            One summary per academic session, newest session first
+        """
+        key = self.department_cache_key(department_id, academic_session_id)
+        statement = self._department_statement(department_id, academic_session_id)
+        summaries: List[Dict[str, Any]] = cache.get_or_set(
+            key,
+            lambda: self._summarize(department_id, db.scalars(statement).all()),
+        )
+        return summaries
+
+    async def aget_department_summary(
+        self,
+        db: AsyncSession,
+        department_id: int,
+        academic_session_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get a department's KPI summary (async); see ``get_department_summary``."""
+        key = self.department_cache_key(department_id, academic_session_id)
+        statement = self._department_statement(department_id, academic_session_id)
+
+        async def load() -> List[Dict[str, Any]]:
+            rows = (await db.scalars(statement)).all()
+            return self._summarize(department_id, rows)
+
+        summaries: List[Dict[str, Any]] = await cache.aget_or_set(key, load)
+        return summaries
+
+    def department_cache_key(
+        self, department_id: int, academic_session_id: Optional[int] = None
+    ) -> str:
+        """Cache key of a department summary view."""
+        session_part = "all" if academic_session_id is None else academic_session_id
+        return f"{self.cache_namespace}:department:{department_id}:{session_part}"
+
+    def invalidate_departments(self, department_ids: Iterable[int]) -> None:
+        """Drop cached summaries of the given departments."""
+        for department_id in set(department_ids):
+            cache.delete_prefix(f"{self.cache_namespace}:department:{department_id}:")
+
+    def _department_statement(
+        self, department_id: int, academic_session_id: Optional[int]
+    ):
+        """Select a department's snapshots, newest session first."""
+        statement = select(self.model).where(self.model.department_id == department_id)
+        if academic_session_id is not None:
+            statement = statement.where(
+                self.model.academic_session_id == academic_session_id
+            )
+        return statement.order_by(
+            self.model.academic_session_id.desc(),
+            self.model.pillar_name,
+            self.model.metric_name,
+        )
+
+    @staticmethod
+    def _summarize(department_id: int, rows) -> List[Dict[str, Any]]:
+        """Shape snapshot rows like ``schemas.kpi.KPISnapshot``."""
+        summaries: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            summary = summaries.setdefault(
+                row.academic_session_id,
+                {
+                    "academic_session_id": row.academic_session_id,
+                    "department_id": department_id,
+                    "timestamp": row.updated_at,
+                    "pillars": {},
+                    "percentages": [],
+                },
+            )
+            summary["timestamp"] = max(summary["timestamp"], row.updated_at)
+            pillar = summary["pillars"].setdefault(
+                row.pillar_name, {"pillar_name": row.pillar_name, "metrics": []}
+            )
+            pillar["metrics"].append(
+                {
+                    "metric_name": row.metric_name,
+                    "calculated_value": row.calculated_value,
+                    "target_value": row.target_value,
+                    "percentage_achieved": row.percentage_achieved,
+                    "status": row.status,
+                }
+            )
+            summary["percentages"].append(row.percentage_achieved)
+
+        result = []
+        for summary in summaries.values():
+            percentages = summary.pop("percentages")
+            summary["overall_score"] = round(sum(percentages) / len(percentages), 2)
+            summary["timestamp"] = summary["timestamp"].isoformat()
+            result.append(summary)
+        return result
+
+
+class CRUDKPIHistory(CRUDBase[KPISnapshotHistory, dict, dict]):
+    """Snapshot history: trend queries and rollups of old rows."""
+
+    def rollup(self, db: Session, before: datetime, commit: bool = True) -> int:
+        """
+        Fold history rows older than ``before`` into daily and session rollups.
+
+        Rows are summarized per day and metric into ``kpi_daily_rollups``
+        (merged with any rollup of the same day), the session rollups of
+        every affected session are rebuilt from the daily ones, and the
+        raw rows are deleted, all in one transaction.
+
+        Args:
+            db: Database session
+            before: Rows created before this instant are rolled up; pass a
+                midnight so each day is rolled up whole
+            commit: Commit the transaction when done
+
+        Returns:
+            Number of history rows rolled up
+        """
+        history = self.model
+        old = history.created_at < before
+        sessions = list(db.scalars(select(history.academic_session_id).where(old).distinct()))
+        if not sessions:
+            return 0
+
+        daily = KPIDailyRollup
+        day = func.date(history.created_at)
+        keys = [getattr(history, name) for name in HISTORY_KEY]
+        grouped = (
+            select(
+                day,
+                *keys,
+                func.count(),
+                func.min(history.calculated_value),
+                func.max(history.calculated_value),
+                func.avg(history.calculated_value),
+                func.avg(history.percentage_achieved),
+            )
+            .where(old)
+            .group_by(day, *keys)
+        )
+        statement = crud_kpi_daily_rollup.insert_statement(db).from_select(
+            ["day", *HISTORY_KEY, "samples", "min_value", "max_value", "avg_value", "avg_percentage"],
+            grouped,
+        )
+        excluded = statement.excluded
+        samples = daily.samples + excluded.samples
+        statement = statement.on_conflict_do_update(
+            index_elements=crud_kpi_daily_rollup.natural_key,
+            set_={
+                "samples": samples,
+                "min_value": case((excluded.min_value < daily.min_value, excluded.min_value), else_=daily.min_value),
+                "max_value": case((excluded.max_value > daily.max_value, excluded.max_value), else_=daily.max_value),
+                "avg_value": (daily.avg_value * daily.samples + excluded.avg_value * excluded.samples) / samples,
+                "avg_percentage": (
+                    daily.avg_percentage * daily.samples + excluded.avg_percentage * excluded.samples
+                ) / samples,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(statement)
+
+        rollup_keys = [getattr(daily, name) for name in HISTORY_KEY]
+        db.execute(delete(KPISessionRollup).where(KPISessionRollup.academic_session_id.in_(sessions)))
+        db.execute(
+            insert(KPISessionRollup).from_select(
+                [
+                    *HISTORY_KEY,
+                    "first_day",
+                    "last_day",
+                    "samples",
+                    "min_value",
+                    "max_value",
+                    "avg_value",
+                    "avg_percentage",
+                ],
+                select(
+                    *rollup_keys,
+                    func.min(daily.day),
+                    func.max(daily.day),
+                    func.sum(daily.samples),
+                    func.min(daily.min_value),
+                    func.max(daily.max_value),
+                    func.sum(daily.avg_value * daily.samples) / func.sum(daily.samples),
+                    func.sum(daily.avg_percentage * daily.samples) / func.sum(daily.samples),
+                )
+                .where(daily.academic_session_id.in_(sessions))
+                .group_by(*rollup_keys),
+            )
+        )
+
+        deleted = cast(CursorResult, db.execute(delete(history).where(old)))
+        rolled: int = deleted.rowcount
+        if commit:
+            db.commit()
+        return rolled
+
+    async def aget_trend(
+        self,
+        db: AsyncSession,
+        department_id: int,
+        metric_name: str,
+        since: date,
+        academic_session_id: Optional[int] = None,
+    ) -> List[RowMapping]:
+        """
+        Daily values of a department's metric since a date, per session.
+
+        Days already rolled up are read from ``kpi_daily_rollups``; recent
+        days are summarized from the raw history on the fly.
+
+        Args:
+            db: Database session
+            department_id: Department ID
+            metric_name: Metric to trace
+            since: First day included
+            academic_session_id: Restrict to one academic session
+
+        Returns:
+            One row per day and academic session, oldest first
+        """
+        statement = self._trend_statement(department_id, metric_name, since, academic_session_id)
+        return list((await db.execute(statement)).mappings())
+
+    def _trend_statement(
+        self,
+        department_id: int,
+        metric_name: str,
+        since: date,
+        academic_session_id: Optional[int],
+    ):
+        """Union of rolled up and raw history days."""
+        daily = KPIDailyRollup
+        history = self.model
+        day = func.date(history.created_at)
+        # A day's rows are rolled up together, so the two parts never overlap
+        rolled = select(
+            daily.day.label("day"),
+            daily.academic_session_id.label("academic_session_id"),
+            daily.samples.label("samples"),
+            daily.min_value.label("min_value"),
+            daily.max_value.label("max_value"),
+            daily.avg_value.label("avg_value"),
+            daily.avg_percentage.label("avg_percentage"),
+        ).where(
+            daily.department_id == department_id,
+            daily.metric_name == metric_name,
+            daily.day >= since,
+        )
+        raw = (
+            select(
+                day,
+                history.academic_session_id,
+                func.count(),
+                func.min(history.calculated_value),
+                func.max(history.calculated_value),
+                func.avg(history.calculated_value),
+                func.avg(history.percentage_achieved),
+            )
+            .where(
+                history.department_id == department_id,
+                history.metric_name == metric_name,
+                history.created_at >= datetime.combine(since, datetime.min.time()),
+            )
+            .group_by(day, history.academic_session_id)
+        )
+        if academic_session_id is not None:
+            rolled = rolled.where(daily.academic_session_id == academic_session_id)
+            raw = raw.where(history.academic_session_id == academic_session_id)
+        return union_all(rolled, raw).order_by("day", "academic_session_id")
+
+
+class CRUDKPIDailyRollup(CRUDBase[KPIDailyRollup, dict, dict]):
+    """CRUD operations for KPIDailyRollup model."""
+
+    natural_key = ("department_id", "metric_name", "day", "academic_session_id", "pillar_name")
+
+
+# Create CRUD instance
+crud_kpi_snapshot = CRUDKPISnapshot(KPISnapshot)
+crud_kpi_history = CRUDKPIHistory(KPISnapshotHistory)
+crud_kpi_daily_rollup = CRUDKPIDailyRollup(KPIDailyRollup)
@@ -0,0 +1,72 @@
+"""
+Keyset (cursor) pagination helpers.
+Cursors are opaque, URL-safe encodings of the last row's keyset values.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from app.core.exceptions import ValidationException
+
+ItemType = TypeVar("ItemType")
+
+
+class CountMode(str, Enum):
+    """How the total row count of a page request is computed."""
+
+    NONE = "none"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+@dataclass
+class Page(Generic[ItemType]):
+    """One page of results."""
+
+    items: List[ItemType]
+    next_cursor: Optional[str]
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode keyset values into an opaque cursor.
+
+    Args:
+        values: Keyset column values of the last row on a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+        size: Expected number of keyset values
+
+    Returns:
+        List of keyset values
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationException("Invalid pagination cursor", {"cursor": cursor})
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationException("Invalid pagination cursor", {"cursor": cursor})
+    return values
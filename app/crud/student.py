@@ -1,16 +1,33 @@
 """Student CRUD operations."""
 
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Sequence, cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.exceptions import ValidationException
 from app.crud.base import CRUDBase
+from app.models.event import EventParticipant
 from app.models.student import Student
 
+# Related collections of a student profile and how each is loaded; every
+# section costs one extra query however many students are loaded
+PROFILE_SECTIONS = {
+    "projects": selectinload(Student.projects),
+    "internships": selectinload(Student.internships),
+    "feedback": selectinload(Student.feedback),
+    "event_participations": selectinload(Student.event_participations).selectinload(EventParticipant.event),
+}
+
 
 class CRUDStudent(CRUDBase[Student, dict, dict]):
     """CRUD operations for Student model."""
 
+    cache_namespace = "students"
+    keyset_columns = ("department_id", "id")
+    natural_key = ("matric_number",)
+
     def get_by_matric(self, db: Session, matric_number: str) -> Optional[Student]:
         """Get student by matric number."""
         return db.query(self.model).filter(
@@ -27,6 +44,75 @@ class CRUDStudent(CRUDBase[Student, dict, dict]):
             self.model.github_username == github_username
         ).first()
 
+    async def aget_by_matric(
+        self, db: AsyncSession, matric_number: str
+    ) -> Optional[Student]:
+        """Get student by matric number (async)."""
+        student: Optional[Student] = await db.scalar(
+            select(self.model).where(self.model.matric_number == matric_number)
+        )
+        return student
+
+    async def aget_by_email(self, db: AsyncSession, email: str) -> Optional[Student]:
+        """Get student by email (async)."""
+        student: Optional[Student] = await db.scalar(
+            select(self.model).where(self.model.email == email)
+        )
+        return student
+
+    @staticmethod
+    def profile_sections(include: Optional[str]) -> List[str]:
+        """
+        Parse a comma-separated profile section selector.
+
+        Args:
+            include: Section names, or None for all sections
+
+        Returns:
+            Selected sections
+
+        Raises:
+            ValidationException: If a section is unknown
+        """
+        if include is None:
+            return list(PROFILE_SECTIONS)
+        sections = [name.strip() for name in include.split(",") if name.strip()]
+        unknown = sorted(set(sections) - set(PROFILE_SECTIONS))
+        if unknown:
+            raise ValidationException(
+                "Unknown profile sections",
+                {"unknown": unknown, "allowed": list(PROFILE_SECTIONS)},
+            )
+        return list(dict.fromkeys(sections))
+
+    async def aget_profiles(
+        self, db: AsyncSession, ids: Iterable[int], sections: Sequence[str]
+    ) -> Dict[int, Student]:
+        """
+        Get students with the selected related collections loaded.
+
+        Collections are loaded with one SELECT ... IN per section, so the
+        number of queries does not grow with the number of students or the
+        size of their history. Sections not selected stay unloaded.
+
+        Args:
+            db: Database session
+            ids: Student IDs
+            sections: Keys of ``PROFILE_SECTIONS`` to load
+
+        Returns:
+            Mapping of ID to student, for the IDs that exist
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        statement = (
+            select(self.model)
+            .where(self.model.id.in_(ids))
+            .options(*(PROFILE_SECTIONS[section] for section in sections))
+        )
+        return {cast(int, student.id): student for student in await db.scalars(statement)}
+
 
 # Create CRUD instance
 crud_student = CRUDStudent(Student)
@@ -1,9 +1,12 @@
 """User CRUD operations."""
 
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache
 from app.crud.base import CRUDBase
 from app.models.user import User
 
@@ -11,6 +14,20 @@ from app.models.user import User
 class CRUDUser(CRUDBase[User, dict, dict]):
     """CRUD operations for User model."""
 
+    cache_namespace = "principals"
+    natural_key = ("email",)
+
+    # Columns cached for authenticated principals (never the password hash)
+    principal_columns = (
+        "id",
+        "email",
+        "username",
+        "full_name",
+        "is_active",
+        "is_superuser",
+        "department_id",
+    )
+
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
         """Get user by email."""
         return db.query(self.model).filter(self.model.email == email).first()
@@ -19,6 +36,54 @@ class CRUDUser(CRUDBase[User, dict, dict]):
         """Get user by username."""
         return db.query(self.model).filter(self.model.username == username).first()
 
+    async def aget_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
+        """Get user by email (async)."""
+        user: Optional[User] = await db.scalar(
+            select(self.model).where(self.model.email == email)
+        )
+        return user
+
+    async def aget_by_username(self, db: AsyncSession, username: str) -> Optional[User]:
+        """Get user by username (async)."""
+        user: Optional[User] = await db.scalar(
+            select(self.model).where(self.model.username == username)
+        )
+        return user
+
+    def principal_cache_key(self, user_id: Any, issued_at: Any) -> str:
+        """Cache key of a user's principal for tokens issued at ``issued_at``."""
+        return f"{self.cache_namespace}:{user_id}:{issued_at}"
+
+    def invalidate_cache(self, id: Any) -> None:
+        """Drop the cached principals of a user for every token."""
+        cache.delete_prefix(f"{self.cache_namespace}:{id}:")
+
+    def invalidate_cache_many(self, ids: Sequence[Any]) -> None:
+        """Drop cached principals after a bulk write (all of them for many ids)."""
+        if len(ids) == 1:
+            self.invalidate_cache(ids[0])
+        elif ids:
+            cache.delete_prefix(f"{self.cache_namespace}:")
+
+    async def ainvalidate_cache(self, id: Any) -> None:
+        """Async version of ``invalidate_cache``."""
+        await cache.adelete_prefix(f"{self.cache_namespace}:{id}:")
+
+    async def ainvalidate_cache_many(self, ids: Sequence[Any]) -> None:
+        """Async version of ``invalidate_cache_many``."""
+        if len(ids) == 1:
+            await self.ainvalidate_cache(ids[0])
+        elif ids:
+            await cache.adelete_prefix(f"{self.cache_namespace}:")
+
+    def to_principal(self, user: User) -> Dict[str, Any]:
+        """Serialize the authorization-relevant columns of a user."""
+        return {column: getattr(user, column) for column in self.principal_columns}
+
+    def from_principal(self, data: Dict[str, Any]) -> User:
+        """Rebuild a detached, read-only User from a cached principal."""
+        return self.model(**data)
+
 
 # Create CRUD instance
 crud_user = CRUDUser(User)
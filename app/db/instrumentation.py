@@ -0,0 +1,274 @@
+"""
+Database instrumentation.
+Times every statement and connection checkout, attributes query counts
+and database time to the request being served, logs slow statements and
+flags repeated statement shapes (N+1 queries).
+"""
+
+import re
+import time
+from collections import Counter as CounterDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event, exc, pool
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing SQL statements",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent obtaining a connection from the pool",
+    ["pool"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Connection checkouts that timed out because the pool was exhausted",
+    ["pool"],
+)
+
+OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+# A parenthesised list of bind placeholders in any DBAPI paramstyle
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|\$\d+|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_REPEATED_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Longest parameter repr written to the slow query log
+MAX_LOGGED_PARAMETERS = 500
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in strict mode when a request runs more statements than its budget."""
+
+
+@dataclass
+class QueryStats:
+    """Statements executed on behalf of one unit of work."""
+
+    count: int = 0
+    seconds: float = 0.0
+    shapes: "CounterDict[str]" = field(default_factory=CounterDict)
+    # Enclosing tracked block, which is charged the same statements
+    parent: Optional["QueryStats"] = field(default=None, repr=False)
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """
+        Statement shapes executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum executions of a shape
+
+        Returns:
+            Mapping of shape to executions, most frequent first
+        """
+        return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+
+# Stats of the request (or task) currently running, if it is being tracked
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed inside the block.
+
+    The stats object is shared with the threads and tasks started from the
+    block, since they inherit a copy of the current context.
+
+    Yields:
+        Stats updated as statements complete
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the block being tracked, if any."""
+    return _current_stats.get()
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a statement so executions differing only in the length of
+    ``IN`` lists or multi-row ``VALUES`` share one shape.
+
+    Args:
+        statement: SQL sent to the driver
+
+    Returns:
+        Normalized statement
+    """
+    shape = _PLACEHOLDER_LIST.sub("(...)", statement)
+    shape = _REPEATED_LISTS.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _operation(statement: str) -> str:
+    keyword = statement.lstrip()[:6].upper()
+    return keyword if keyword in OPERATIONS else "OTHER"
+
+
+def _explain(conn, statement: str, parameters: Any) -> Optional[str]:
+    # EXPLAIN ANALYZE runs the statement again, so only read-only ones
+    if conn.dialect.name != "postgresql" or _operation(statement) != "SELECT":
+        return None
+    # A raw cursor keeps the plan's statement out of the instrumentation
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN ANALYZE {statement}", parameters)
+        return "\n".join(row[0] for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(conn, statement: str, parameters: Any, elapsed: float) -> None:
+    plan = None
+    if settings.SLOW_QUERY_EXPLAIN:
+        try:
+            plan = _explain(conn, statement, parameters)
+        except Exception as e:
+            logger.warning(f"EXPLAIN of slow query failed: {str(e)}")
+    logger.warning(
+        f"Slow query ({elapsed * 1000:.1f} ms): {_WHITESPACE.sub(' ', statement).strip()} "
+        f"parameters={repr(parameters)[:MAX_LOGGED_PARAMETERS]}"
+        + (f"\n{plan}" if plan else "")
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    DB_QUERY_SECONDS.labels(_operation(statement)).observe(elapsed)
+    if 0 < settings.SLOW_QUERY_SECONDS <= elapsed:
+        _log_slow_query(conn, statement, parameters, elapsed)
+
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    shape = statement_shape(statement)
+    while stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        stats.shapes[shape] += 1
+        stats = stats.parent
+
+
+def _handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time the statements of an engine.
+
+    Pass ``AsyncEngine.sync_engine`` for async engines.
+
+    Args:
+        engine: Engine to instrument
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declare the statement budget of a route, overriding
+    ``QUERY_BUDGET_DEFAULT``.
+
+    Args:
+        max_queries: Statements a request may execute
+
+    Returns:
+        Decorator for the endpoint function
+    """
+
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, "query_budget", max_queries)
+        return endpoint
+
+    return decorator
+
+
+def check_query_budget(stats: QueryStats, route: str, budget: int, strict: bool = False) -> None:
+    """
+    Report N+1 patterns and budget overruns of a finished request.
+
+    Args:
+        stats: Statements the request executed
+        route: Route template, for the log message
+        budget: Statements the route may execute
+        strict: Raise instead of logging when the budget is exceeded
+
+    Raises:
+        QueryBudgetExceeded: If strict and the budget was exceeded
+    """
+    repeated = stats.repeated(settings.N_PLUS_ONE_THRESHOLD)
+    for shape, count in repeated.items():
+        logger.warning(f"Possible N+1 query on {route}: executed {count} times: {shape}")
+
+    if stats.count <= budget:
+        return
+    message = f"{route} executed {stats.count} statements, budget is {budget}"
+    if repeated:
+        message += "; repeated: " + "; ".join(f"{count}x {shape}" for shape, count in repeated.items())
+    if strict:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+class _TimedCheckout(pool.QueuePool):
+    """Pool mixin recording how long each checkout waits for a connection."""
+
+    # Value of the ``pool`` label
+    metrics_name = "sync"
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(self.metrics_name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.metrics_name).observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedCheckout, pool.QueuePool):
+    """QueuePool that records checkout wait time."""
+
+
+class TimedAsyncQueuePool(_TimedCheckout, pool.AsyncAdaptedQueuePool):
+    """Async-adapted QueuePool that records checkout wait time."""
+
+    metrics_name = "async"
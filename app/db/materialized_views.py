@@ -0,0 +1,83 @@
+"""
+Materialized KPI aggregate views.
+Per-(department, session) aggregates of the KPI source tables, created by
+migration d4a8e17c2b56 and refreshed concurrently by a Celery task.
+"""
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, text
+from sqlalchemy.engine import Connection
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Kept apart from Base.metadata so create_all never builds them as tables
+metadata = MetaData()
+
+
+def _view(name: str, *columns: Column) -> Table:
+    """Describe a view keyed by (department_id, academic_session_id)."""
+    return Table(
+        name,
+        metadata,
+        Column("department_id", Integer, primary_key=True),
+        Column("academic_session_id", Integer, primary_key=True),
+        *columns,
+    )
+
+
+feedback_aggregates = _view(
+    "kpi_feedback_aggregates",
+    Column("feedback_count", Integer),
+    Column("feedback_respondents", Integer),
+    Column("rating_sum", Float),
+    Column("rating_avg", Float),
+)
+
+internship_aggregates = _view(
+    "kpi_internship_aggregates",
+    Column("internship_students", Integer),
+    Column("internship_weeks_sum", Float),
+    Column("internship_weeks_count", Integer),
+    Column("internship_weeks_avg", Float),
+)
+
+project_aggregates = _view(
+    "kpi_project_aggregates",
+    Column("project_count", Integer),
+    Column("deployed_projects", Integer),
+    Column("deployed_ratio", Float),
+    Column("project_quality_sum", Float),
+    Column("project_quality_count", Integer),
+)
+
+event_aggregates = _view(
+    "kpi_event_aggregates",
+    Column("event_participations", Integer),
+    Column("event_students", Integer),
+)
+
+AGGREGATE_VIEWS = (
+    feedback_aggregates,
+    internship_aggregates,
+    project_aggregates,
+    event_aggregates,
+)
+
+
+def refresh_materialized_views(connection: Connection, concurrently: bool = True) -> None:
+    """
+    Refresh every aggregate view.
+
+    A concurrent refresh does not block readers; it relies on the unique
+    (department_id, academic_session_id) index of each view.
+
+    Args:
+        connection: Connection to refresh on; each view is committed separately
+        concurrently: Use REFRESH ... CONCURRENTLY
+    """
+    mode = "CONCURRENTLY " if concurrently else ""
+    for view in AGGREGATE_VIEWS:
+        connection.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{view.name}"))
+        connection.commit()
+        logger.info(f"Refreshed materialized view {view.name}")
@@ -0,0 +1,99 @@
+"""
+KPI snapshot partitions.
+On PostgreSQL ``kpi_snapshots`` is LIST-partitioned by academic session
+(migration a7e2c94b1d60). Each session gets its own partition before its
+first snapshots are written; rows of sessions without one land in the
+default partition and are moved when it is created.
+"""
+
+from typing import Iterable, List, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PARTITIONED_TABLE = "kpi_snapshots"
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+
+# Sessions seen with a partition already attached, to skip the catalog lookup
+_attached: Set[int] = set()
+
+
+def partition_name(academic_session_id: int) -> str:
+    """Name of a session's snapshot partition."""
+    return f"{PARTITIONED_TABLE}_s{int(academic_session_id)}"
+
+
+def is_partitioned(connection: Connection) -> bool:
+    """Whether ``kpi_snapshots`` is a partitioned table on this database."""
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+            {"table": PARTITIONED_TABLE},
+        )
+    )
+
+
+def attached_partitions(connection: Connection) -> Set[str]:
+    """Names of the partitions attached to ``kpi_snapshots``."""
+    return set(
+        connection.scalars(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:table)"
+            ),
+            {"table": PARTITIONED_TABLE},
+        )
+    )
+
+
+def ensure_snapshot_partitions(connection: Connection, academic_session_ids: Iterable[int]) -> List[str]:
+    """
+    Create the partitions of sessions that do not have one yet.
+
+    Runs in the caller's transaction. A new partition is built detached,
+    filled with the session's rows from the default partition and then
+    attached, so rows written before it existed are not stranded.
+
+    Args:
+        connection: Connection (of the transaction about to write snapshots)
+        academic_session_ids: Sessions about to be written
+
+    Returns:
+        Names of the partitions created
+    """
+    missing = {int(session_id) for session_id in academic_session_ids} - _attached
+    if not missing or not is_partitioned(connection):
+        return []
+
+    # Serialize with other writers creating the same partitions
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext(:table))"), {"table": PARTITIONED_TABLE})
+    attached = attached_partitions(connection)
+    created = []
+    for session_id in sorted(missing):
+        name = partition_name(session_id)
+        if name in attached:
+            # Only cache partitions known to be committed
+            _attached.add(session_id)
+            continue
+        connection.execute(
+            text(f"CREATE TABLE {name} (LIKE {PARTITIONED_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        )
+        connection.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE academic_session_id = :session_id "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {"session_id": session_id},
+        )
+        connection.execute(
+            text(f"ALTER TABLE {PARTITIONED_TABLE} ATTACH PARTITION {name} FOR VALUES IN ({session_id})")
+        )
+        created.append(name)
+        logger.info(f"Created KPI snapshot partition {name}")
+    return created
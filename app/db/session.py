@@ -3,17 +3,20 @@ Database session management.
 Provides singleton database engine and session factory.
 """
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine, pool
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
+from app.db.instrumentation import TimedAsyncQueuePool, TimedQueuePool, instrument_engine
+from app.services.calculators.change_tracker import register_change_tracking
 
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
-    poolclass=pool.QueuePool,
+    poolclass=TimedQueuePool,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=10,
     echo=settings.DATABASE_ECHO,
@@ -28,6 +31,29 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Create async database engine (asyncpg) for the API request path
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncQueuePool,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=10,
+    echo=settings.DATABASE_ECHO,
+)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Time statements and attribute them to the current request
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+# Mark KPI snapshots stale whenever their source rows are written
+register_change_tracking()
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -41,3 +67,27 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting an async database session in API endpoints.
+
+    Yields:
+        SQLAlchemy AsyncSession instance
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency for handlers that open sessions themselves.
+
+    Streaming responses run after request dependencies are torn down, so
+    they must create their own session from this factory.
+
+    Returns:
+        Async session factory
+    """
+    return AsyncSessionLocal
@@ -8,13 +8,21 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
-from app.core.logging import setup_logging, get_logger
+from app.core.logging import LogContextMiddleware, setup_logging, shutdown_logging, get_logger
 from app.core.exceptions import KPISystemException
+from app.core.metrics import (
+    PrometheusMiddleware,
+    QueryBudgetMiddleware,
+    metrics_endpoint,
+    register_pool_metrics,
+)
+from app.core.security import password_hash_pool
 from app.api.v1.router import api_router
 from app.db.base import Base
-from app.db.session import engine
+from app.db.session import engine, async_engine
 
 
 # Setup logging
@@ -41,6 +49,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await async_engine.dispose()
+    password_hash_pool.shutdown()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -49,6 +60,7 @@ app = FastAPI(
     description="Departmental Performance KPI Management System",
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware
@@ -60,16 +72,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Flag N+1 queries and routes over their query budget
+app.add_middleware(QueryBudgetMiddleware)
+
+# Record per-route latency, response size and database usage
+if settings.ENABLE_METRICS:
+    app.add_middleware(PrometheusMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    register_pool_metrics({"sync": engine, "async": async_engine.sync_engine}, password_hash_pool)
+
+# Bind the request id and route to log records
+app.add_middleware(LogContextMiddleware)
+
 
 @app.exception_handler(KPISystemException)
 async def kpi_exception_handler(request, exc: KPISystemException):
     """Handle KPI system exceptions."""
-    return {
-        "error_code": exc.error_code,
-        "message": exc.message,
-        "details": exc.details,
-        "status_code": exc.status_code,
-    }
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={
+            "error_code": exc.error_code,
+            "message": exc.message,
+            "details": exc.details,
+            "status_code": exc.status_code,
+        },
+    )
 
 
 # Include API v1 router
@@ -9,7 +9,14 @@ from app.models.lecturer import Lecturer
 from app.models.internship import InternshipRecord
 from app.models.feedback import StudentFeedback
 from app.models.event import Event, EventParticipant
-from app.models.kpi import KPISnapshot
+from app.models.kpi import (
+    KPISnapshot,
+    KPIDirtyKey,
+    KPISnapshotHistory,
+    KPIDailyRollup,
+    KPISessionRollup,
+)
+from app.models.collector import CollectorSyncState, CollectorSyncRun
 
 __all__ = [
     "BaseModel",
@@ -27,4 +34,10 @@ __all__ = [
     "Event",
     "EventParticipant",
     "KPISnapshot",
+    "KPIDirtyKey",
+    "KPISnapshotHistory",
+    "KPIDailyRollup",
+    "KPISessionRollup",
+    "CollectorSyncState",
+    "CollectorSyncRun",
 ]
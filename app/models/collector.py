@@ -0,0 +1,47 @@
+"""Collector sync state and run history models."""
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, UniqueConstraint
+
+from app.models.base import BaseModel
+
+
+class CollectorSyncState(BaseModel):
+    """Incremental sync position of one entity of a collector source."""
+
+    __tablename__ = "collector_sync_states"
+    __table_args__ = (
+        UniqueConstraint("source", "entity", name="uq_collector_sync_states_source_entity"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(50), nullable=False)  # github, ...
+    entity = Column(String(255), nullable=False)  # e.g. repos:<username>
+    watermark = Column(String(100), nullable=True)  # Last updated_at / since cursor ingested
+    etag = Column(String(255), nullable=True)  # ETag of the last complete fetch
+    page_token = Column(String(1000), nullable=True)  # Next page of an interrupted fetch
+
+    def __repr__(self) -> str:
+        return f"<CollectorSyncState(source={self.source}, entity={self.entity}, watermark={self.watermark})>"
+
+
+class CollectorSyncRun(BaseModel):
+    """Statistics of one collector run."""
+
+    __tablename__ = "collector_sync_runs"
+    __table_args__ = (
+        Index("ix_collector_sync_runs_source_created_at", "source", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="running")  # running, succeeded, failed
+    finished_at = Column(DateTime, nullable=True)
+    items_collected = Column(Integer, nullable=False, default=0)
+    items_valid = Column(Integer, nullable=False, default=0)
+    items_persisted = Column(Integer, nullable=False, default=0)
+    checkpoints = Column(Integer, nullable=False, default=0)
+    stats = Column(JSON, nullable=True)  # Pipeline report and collector counters
+    error = Column(String(1000), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<CollectorSyncRun(id={self.id}, source={self.source}, status={self.status})>"
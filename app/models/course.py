@@ -1,6 +1,6 @@
 """Course and CourseOutline models."""
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -10,6 +10,10 @@ class Course(BaseModel):
     """Course model representing an academic course."""
 
     __tablename__ = "courses"
+    __table_args__ = (
+        # Feedback aggregation joins courses per department
+        Index("ix_courses_department_id", "department_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     course_code = Column(String(50), nullable=False, unique=True, index=True)
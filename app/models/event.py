@@ -1,6 +1,6 @@
 """Event and participation models."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -10,6 +10,10 @@ class Event(BaseModel):
     """Event model (workshops, hackathons, seminars, guest sessions)."""
 
     __tablename__ = "events"
+    __table_args__ = (
+        # Per-session event participation aggregation
+        Index("ix_events_academic_session_id", "academic_session_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_name = Column(String(255), nullable=False)
@@ -32,6 +36,11 @@ class EventParticipant(BaseModel):
     """Event participation record."""
 
     __tablename__ = "event_participants"
+    __table_args__ = (
+        # Participation lookups by event and by student
+        Index("ix_event_participants_event_id_student_id", "event_id", "student_id"),
+        Index("ix_event_participants_student_id", "student_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
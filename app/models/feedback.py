@@ -1,6 +1,6 @@
 """Student feedback model."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -10,6 +10,12 @@ class StudentFeedback(BaseModel):
     """Student feedback on courses and teaching effectiveness."""
 
     __tablename__ = "student_feedback"
+    __table_args__ = (
+        # Per-department, per-session feedback aggregation (joined via courses)
+        Index("ix_student_feedback_course_id_academic_session_id", "course_id", "academic_session_id"),
+        # Feedback of one student, e.g. profile loading
+        Index("ix_student_feedback_student_id", "student_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
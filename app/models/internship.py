@@ -1,6 +1,6 @@
 """Internship and work experience models."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -10,6 +10,10 @@ class InternshipRecord(BaseModel):
     """Internship/SIWES participation record."""
 
     __tablename__ = "internship_records"
+    __table_args__ = (
+        # Per-department, per-session internship aggregation (joined via students)
+        Index("ix_internship_records_student_id_academic_session_id", "student_id", "academic_session_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
@@ -1,15 +1,34 @@
 """KPI snapshot and calculation models."""
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Date, Integer, String, Float, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
 
 
 class KPISnapshot(BaseModel):
-    """Snapshot of calculated KPI values for a session."""
+    """
+    Latest calculated value of each KPI metric for a session.
+
+    Rows are upserted on (session, department, pillar, metric); earlier
+    values are kept in ``KPISnapshotHistory``. On PostgreSQL the table is
+    LIST-partitioned by academic session (migration a7e2c94b1d60, partitions
+    added by ``app.db.partitions``), where its primary key is
+    (id, academic_session_id).
+    """
 
     __tablename__ = "kpi_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "academic_session_id",
+            "department_id",
+            "pillar_name",
+            "metric_name",
+            name="uq_kpi_snapshots_key",
+        ),
+        # Department/session summaries and per-key snapshot replacement
+        Index("ix_kpi_snapshots_key", "department_id", "academic_session_id", "pillar_name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     academic_session_id = Column(Integer, ForeignKey("academic_sessions.id"), nullable=False)
@@ -27,3 +46,122 @@ class KPISnapshot(BaseModel):
 
     def __repr__(self) -> str:
         return f"<KPISnapshot(id={self.id}, pillar={self.pillar_name}, metric={self.metric_name})>"
+
+
+class KPIDirtyKey(BaseModel):
+    """Marker for a (department, session, pillar) whose snapshots are stale."""
+
+    __tablename__ = "kpi_dirty_keys"
+    __table_args__ = (
+        Index("ix_kpi_dirty_keys_key", "department_id", "academic_session_id", "pillar_name"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    academic_session_id = Column(Integer, ForeignKey("academic_sessions.id"), nullable=False)
+    pillar_name = Column(String(100), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<KPIDirtyKey(department_id={self.department_id}, "
+            f"session_id={self.academic_session_id}, pillar={self.pillar_name})>"
+        )
+
+
+class KPISnapshotHistory(BaseModel):
+    """Append-only record of every change to a KPI snapshot value."""
+
+    __tablename__ = "kpi_snapshot_history"
+    __table_args__ = (
+        # Rows arrive in created_at order, so a BRIN index stays tiny and
+        # still prunes the time range of trend queries and rollups
+        Index("ix_kpi_snapshot_history_created_at", "created_at", postgresql_using="brin"),
+        Index(
+            "ix_kpi_snapshot_history_metric",
+            "department_id",
+            "metric_name",
+            "created_at",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    academic_session_id = Column(Integer, ForeignKey("academic_sessions.id"), nullable=False)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    pillar_name = Column(String(100), nullable=False)
+    metric_name = Column(String(255), nullable=False)
+    calculated_value = Column(Float, nullable=False)
+    target_value = Column(Float, nullable=False)
+    percentage_achieved = Column(Float, nullable=False)
+    status = Column(String(50), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<KPISnapshotHistory(id={self.id}, metric={self.metric_name}, "
+            f"value={self.calculated_value}, created_at={self.created_at})>"
+        )
+
+
+class KPIDailyRollup(BaseModel):
+    """Per-day summary of a metric's history, kept after raw rows expire."""
+
+    __tablename__ = "kpi_daily_rollups"
+    __table_args__ = (
+        # Leads with the columns trend queries filter on
+        UniqueConstraint(
+            "department_id",
+            "metric_name",
+            "day",
+            "academic_session_id",
+            "pillar_name",
+            name="uq_kpi_daily_rollups_key",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)
+    academic_session_id = Column(Integer, ForeignKey("academic_sessions.id"), nullable=False)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    pillar_name = Column(String(100), nullable=False)
+    metric_name = Column(String(255), nullable=False)
+    samples = Column(Integer, nullable=False)  # History rows summarized
+    min_value = Column(Float, nullable=False)
+    max_value = Column(Float, nullable=False)
+    avg_value = Column(Float, nullable=False)
+    avg_percentage = Column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<KPIDailyRollup(day={self.day}, metric={self.metric_name}, avg={self.avg_value})>"
+
+
+class KPISessionRollup(BaseModel):
+    """Per-session summary of a metric's rolled up history."""
+
+    __tablename__ = "kpi_session_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "academic_session_id",
+            "department_id",
+            "pillar_name",
+            "metric_name",
+            name="uq_kpi_session_rollups_key",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    academic_session_id = Column(Integer, ForeignKey("academic_sessions.id"), nullable=False)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
+    pillar_name = Column(String(100), nullable=False)
+    metric_name = Column(String(255), nullable=False)
+    first_day = Column(Date, nullable=False)
+    last_day = Column(Date, nullable=False)
+    samples = Column(Integer, nullable=False)
+    min_value = Column(Float, nullable=False)
+    max_value = Column(Float, nullable=False)
+    avg_value = Column(Float, nullable=False)
+    avg_percentage = Column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<KPISessionRollup(session_id={self.academic_session_id}, "
+            f"metric={self.metric_name}, avg={self.avg_value})>"
+        )
@@ -1,6 +1,6 @@
 """Student and StudentProject models."""
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -10,6 +10,10 @@ class Student(BaseModel):
     """Student model representing a department student."""
 
     __tablename__ = "students"
+    __table_args__ = (
+        # Keyset pagination order of student listings
+        Index("ix_students_department_id_id", "department_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     matric_number = Column(String(50), unique=True, nullable=False, index=True)
@@ -36,6 +40,10 @@ class StudentProject(BaseModel):
     """Student project model tracking capstone/final projects."""
 
     __tablename__ = "student_projects"
+    __table_args__ = (
+        # Per-department, per-session project aggregation (joined via students)
+        Index("ix_student_projects_student_id_academic_session_id", "student_id", "academic_session_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
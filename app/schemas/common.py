@@ -26,9 +26,11 @@ class PaginationParams(BaseModel):
 class PaginatedResponse(BaseModel):
     """Generic paginated response."""
 
-    total: int = Field(..., description="Total number of records")
+    total: Optional[int] = Field(None, description="Total number of records, if counted")
+    total_is_estimate: bool = Field(False, description="Whether total is a planner estimate")
     skip: int = Field(..., description="Number of records skipped")
     limit: int = Field(..., description="Number of records returned")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if any")
     items: list = Field(..., description="List of items")
 
 
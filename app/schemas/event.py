@@ -0,0 +1,34 @@
+"""Event schemas for API requests/responses."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class EventResponse(BaseModel):
+    """Event response."""
+
+    id: int
+    event_name: str
+    event_type: str
+    organizer: str
+    event_date: str
+    academic_session_id: int
+    description: Optional[str] = None
+    location: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class EventParticipationResponse(BaseModel):
+    """A student's participation in an event."""
+
+    id: int
+    event_id: int
+    student_id: int
+    participation_date: str
+    event: EventResponse
+
+    class Config:
+        from_attributes = True
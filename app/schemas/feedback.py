@@ -0,0 +1,20 @@
+"""Student feedback schemas for API requests/responses."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StudentFeedbackResponse(BaseModel):
+    """Student feedback response."""
+
+    id: int
+    course_id: int
+    student_id: int
+    academic_session_id: int
+    rating: int
+    comments: Optional[str] = None
+    is_anonymous: bool
+
+    class Config:
+        from_attributes = True
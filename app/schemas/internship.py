@@ -0,0 +1,24 @@
+"""Internship schemas for API requests/responses."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class InternshipRecordResponse(BaseModel):
+    """Internship record response."""
+
+    id: int
+    student_id: int
+    company_name: str
+    company_location: Optional[str] = None
+    internship_type: str
+    start_date: str
+    end_date: str
+    academic_session_id: int
+    duration_weeks: Optional[int] = None
+    supervisor_name: Optional[str] = None
+    performance_rating: Optional[int] = None
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,7 @@
 """KPI schemas for API requests/responses."""
 
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field
 
@@ -34,3 +34,18 @@ class KPISnapshot(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class KPITrendPoint(BaseModel):
+    """A metric's values over one day of one academic session."""
+
+    day: date = Field(..., description="Day of the recomputations")
+    academic_session_id: int
+    samples: int = Field(..., description="Value changes recorded that day")
+    min_value: float
+    max_value: float
+    avg_value: float
+    avg_percentage: float = Field(..., description="Average percentage of target achieved")
+
+    class Config:
+        from_attributes = True
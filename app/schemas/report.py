@@ -0,0 +1,25 @@
+"""Report schemas for API requests/responses."""
+
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.services.reports.kpi_report import ReportFormat
+
+
+class ReportRequest(BaseModel):
+    """KPI report to generate."""
+
+    department_id: int = Field(..., description="Department reported on")
+    academic_session_id: Optional[int] = Field(default=None, description="Limit to one academic session")
+    format: ReportFormat = Field(ReportFormat.XLSX, description="Report format")
+
+
+class ReportStatus(BaseModel):
+    """State of a report: ready to download, or being rendered."""
+
+    status: Literal["ready", "pending", "failed"] = Field(..., description="Report state")
+    key: Optional[str] = Field(default=None, description="Content hash identifying the artifact")
+    format: Optional[ReportFormat] = Field(default=None, description="Report format")
+    task_id: Optional[str] = Field(default=None, description="Rendering task, while pending")
+    download_url: Optional[str] = Field(default=None, description="Where to download the report once ready")
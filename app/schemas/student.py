@@ -3,9 +3,12 @@
 from typing import Optional
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.schemas.common import TimestampSchema
+from app.schemas.common import PaginatedResponse, TimestampSchema
+from app.schemas.event import EventParticipationResponse
+from app.schemas.feedback import StudentFeedbackResponse
+from app.schemas.internship import InternshipRecordResponse
 
 
 class StudentBase(BaseModel):
@@ -47,6 +50,36 @@ class StudentResponse(StudentBase, TimestampSchema):
         from_attributes = True
 
 
+class StudentPage(PaginatedResponse):
+    """Paginated student list response."""
+
+    items: list[StudentResponse] = Field(..., description="List of students")
+
+
+# Validates pages built from plain row mappings and dumps them to JSON bytes
+# in pydantic-core, bypassing FastAPI's generic response encoding
+student_page_adapter: TypeAdapter[StudentPage] = TypeAdapter(StudentPage)
+
+
+class StudentImportError(BaseModel):
+    """Problems found with one imported row."""
+
+    row: int = Field(..., description="Line number in the uploaded file")
+    matric_number: Optional[str] = None
+    errors: list[str] = Field(..., description="Error messages")
+
+
+class StudentImportReport(BaseModel):
+    """Bulk student import result."""
+
+    total_rows: int = Field(..., description="Number of data rows read")
+    imported: int = Field(..., description="Number of students created")
+    skipped: int = Field(..., description="Rows matching an existing student")
+    failed: int = Field(..., description="Rows that failed validation")
+    errors: list[StudentImportError] = Field(..., description="Per-row errors")
+    errors_truncated: bool = Field(False, description="Whether errors were cut off")
+
+
 class StudentProjectResponse(BaseModel):
     """Student project response."""
 
@@ -62,3 +95,12 @@ class StudentProjectResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class StudentProfile(StudentResponse):
+    """Student with related records; sections not requested are null."""
+
+    projects: Optional[list[StudentProjectResponse]] = None
+    internships: Optional[list[InternshipRecordResponse]] = None
+    feedback: Optional[list[StudentFeedbackResponse]] = None
+    event_participations: Optional[list[EventParticipationResponse]] = None
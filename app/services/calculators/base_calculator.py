@@ -6,6 +6,7 @@ All specific KPI calculators should inherit from this.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 
@@ -68,3 +69,37 @@ class BaseCalculator(ABC):
             return "meets"
         else:
             return "below"
+
+    def _get_percentages(self, actual: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        Vectorized variant of ``_get_percentage``.
+
+        Args:
+            actual: Array of actual values
+            target: Array (or scalar) of target values
+
+        Returns:
+            Array of percentages; 0.0 wherever the target is 0
+        """
+        actual = np.asarray(actual, dtype=float)
+        target = np.broadcast_to(np.asarray(target, dtype=float), actual.shape)
+        ratio: np.ndarray = np.divide(actual, target, out=np.zeros_like(actual), where=target != 0)
+        return ratio * 100
+
+    def _get_statuses(self, percentages: np.ndarray, threshold: float = 100) -> np.ndarray:
+        """
+        Vectorized variant of ``_get_status``.
+
+        Args:
+            percentages: Array of percentages achieved
+            threshold: Threshold percentage (default 100%)
+
+        Returns:
+            Array of statuses: "exceeds", "meets", or "below"
+        """
+        percentages = np.asarray(percentages, dtype=float)
+        return np.select(
+            [percentages >= 110, percentages >= threshold],
+            ["exceeds", "meets"],
+            default="below",
+        )
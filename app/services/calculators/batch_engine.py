@@ -0,0 +1,632 @@
+"""
+Batch KPI calculation engine.
+Computes every pillar for many (department, session) pairs in one pass
+using pandas/NumPy instead of one calculator call per pair.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, delete, func, insert, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.crud.kpi import crud_kpi_snapshot
+from app.db.materialized_views import AGGREGATE_VIEWS
+from app.db.partitions import ensure_snapshot_partitions
+from app.models.course import Course
+from app.models.department import AcademicSession, Department
+from app.models.event import Event, EventParticipant
+from app.models.feedback import StudentFeedback
+from app.models.internship import InternshipRecord
+from app.models.kpi import KPIDirtyKey, KPISnapshot, KPISnapshotHistory
+from app.models.student import Student, StudentProject
+from app.services.calculators.base_calculator import BaseCalculator
+
+KEY_COLUMNS = ["department_id", "academic_session_id"]
+
+# Per-(department, session) aggregates every metric is derived from
+AGGREGATE_COLUMNS = [
+    "active_students",
+    "feedback_count",
+    "feedback_respondents",
+    "rating_sum",
+    "internship_students",
+    "internship_weeks_sum",
+    "internship_weeks_count",
+    "project_count",
+    "deployed_projects",
+    "project_quality_sum",
+    "project_quality_count",
+    "event_participations",
+    "event_students",
+]
+
+SNAPSHOT_COLUMNS = [
+    "department_id",
+    "academic_session_id",
+    "pillar_name",
+    "metric_name",
+    "calculated_value",
+    "target_value",
+    "percentage_achieved",
+    "status",
+]
+
+# Snapshot values an upsert replaces
+SNAPSHOT_VALUES = ["calculated_value", "target_value", "percentage_achieved", "status"]
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """Definition of a KPI metric as a ratio of two aggregate columns."""
+
+    pillar_name: str
+    metric_name: str
+    target_value: float
+    numerator: str
+    denominator: str
+    scale: float = 1.0
+
+
+METRIC_DEFINITIONS: tuple[MetricDefinition, ...] = (
+    MetricDefinition("academic_quality", "average_course_rating", 4.0, "rating_sum", "feedback_count"),
+    MetricDefinition("academic_quality", "feedback_response_rate", 60.0, "feedback_respondents", "active_students", 100),
+    MetricDefinition("employability", "internship_participation_rate", 70.0, "internship_students", "active_students", 100),
+    MetricDefinition("employability", "average_internship_weeks", 12.0, "internship_weeks_sum", "internship_weeks_count"),
+    MetricDefinition("practical_skills", "deployed_project_rate", 50.0, "deployed_projects", "project_count", 100),
+    MetricDefinition("practical_skills", "average_project_quality", 70.0, "project_quality_sum", "project_quality_count"),
+    MetricDefinition("student_engagement", "event_participation_rate", 60.0, "event_students", "active_students", 100),
+    MetricDefinition("student_engagement", "events_per_student", 2.0, "event_participations", "active_students"),
+)
+
+PILLARS: tuple[str, ...] = tuple(dict.fromkeys(m.pillar_name for m in METRIC_DEFINITIONS))
+
+
+class BatchKPIEngine(BaseCalculator):
+    """Vectorized calculator for all pillars across departments and sessions."""
+
+    def __init__(
+        self,
+        session: Session,
+        metrics: Sequence[MetricDefinition] = METRIC_DEFINITIONS,
+        use_materialized_views: bool = False,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            session: Database session
+            metrics: Metric definitions to compute
+            use_materialized_views: Read aggregates from the materialized
+                views (PostgreSQL) instead of the source tables
+        """
+        super().__init__(session)
+        self.definitions = tuple(metrics)
+        self.use_materialized_views = use_materialized_views
+
+    def calculate(self, department_id: int, session_id: int) -> Dict[str, Any]:
+        """
+        Calculate KPI metrics for a single department and session.
+
+        Args:
+            department_id: Department ID
+            session_id: Academic session ID
+
+        Returns:
+            Dictionary of metrics grouped by pillar
+        """
+        frame = self.calculate_all(
+            department_ids=[department_id], session_ids=[session_id]
+        )
+        result: Dict[str, Any] = {}
+        for row in frame.to_dict("records"):
+            result.setdefault(row["pillar_name"], {})[row["metric_name"]] = {
+                "calculated_value": row["calculated_value"],
+                "target_value": row["target_value"],
+                "percentage_achieved": row["percentage_achieved"],
+                "status": row["status"],
+            }
+        self.metrics = result
+        return result
+
+    def calculate_all(
+        self,
+        department_ids: Optional[Iterable[int]] = None,
+        session_ids: Optional[Iterable[int]] = None,
+        pillars: Optional[Iterable[str]] = None,
+        use_views: Optional[bool] = None,
+    ) -> pd.DataFrame:
+        """
+        Calculate metrics for every department x session pair.
+
+        Args:
+            department_ids: Restrict to these departments (default: all)
+            session_ids: Restrict to these academic sessions (default: all)
+            pillars: Restrict to these pillars (default: all)
+            use_views: Override ``use_materialized_views`` for this call
+
+        Returns:
+            DataFrame with one row per snapshot, columns as ``SNAPSHOT_COLUMNS``
+        """
+        definitions = self._select_definitions(pillars)
+        aggregates = self.load_aggregates(department_ids, session_ids, use_views)
+        return self.compute_metrics(aggregates, definitions)
+
+    def load_aggregates(
+        self,
+        department_ids: Optional[Iterable[int]] = None,
+        session_ids: Optional[Iterable[int]] = None,
+        use_views: Optional[bool] = None,
+    ) -> pd.DataFrame:
+        """
+        Load source rows once and reduce them to per-pair aggregates.
+
+        With materialized views the aggregates are read as precomputed rows,
+        as of the views' last refresh.
+
+        Args:
+            department_ids: Restrict to these departments (default: all)
+            session_ids: Restrict to these academic sessions (default: all)
+            use_views: Override ``use_materialized_views`` for this call
+
+        Returns:
+            DataFrame indexed by (department_id, academic_session_id)
+            with ``AGGREGATE_COLUMNS``
+        """
+        department_ids = self._ids(department_ids, Department.id)
+        session_ids = self._ids(session_ids, AcademicSession.id)
+        grid = pd.MultiIndex.from_product(
+            [department_ids, session_ids], names=KEY_COLUMNS
+        )
+        if len(grid) == 0:
+            return pd.DataFrame(0.0, index=grid, columns=AGGREGATE_COLUMNS)
+
+        statements = self.source_statements(department_ids, session_ids)
+        if self.use_materialized_views if use_views is None else use_views:
+            aggregates = self._view_aggregates(department_ids, session_ids)
+        else:
+            aggregates = self._source_aggregates(statements)
+
+        aggregates = aggregates.reindex(grid).astype(float).fillna(0.0)
+        students = self._frame(statements["students"])
+        active = students.set_index("department_id")["active_students"]
+        aggregates["active_students"] = (
+            grid.get_level_values("department_id").map(active).fillna(0).astype(float)
+        )
+        return aggregates[AGGREGATE_COLUMNS]
+
+    def _source_aggregates(self, statements: Dict[str, Any]) -> pd.DataFrame:
+        """Reduce source rows to aggregates of the pairs that have any."""
+        feedback = self._frame(statements["feedback"])
+        internships = self._frame(statements["internships"])
+        projects = self._frame(statements["projects"])
+        events = self._frame(statements["events"])
+
+        for frame, column in (
+            (feedback, "rating"),
+            (internships, "duration_weeks"),
+            (projects, "is_deployed"),
+            (projects, "project_quality_score"),
+        ):
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(float)
+
+        feedback_groups = feedback.groupby(KEY_COLUMNS)
+        internship_groups = internships.groupby(KEY_COLUMNS)
+        project_groups = projects.groupby(KEY_COLUMNS)
+        event_groups = events.groupby(KEY_COLUMNS)
+
+        return pd.DataFrame(
+            {
+                "feedback_count": feedback_groups.size(),
+                "feedback_respondents": feedback_groups["student_id"].nunique(),
+                "rating_sum": feedback_groups["rating"].sum(),
+                "internship_students": internship_groups["student_id"].nunique(),
+                "internship_weeks_sum": internship_groups["duration_weeks"].sum(),
+                "internship_weeks_count": internship_groups["duration_weeks"].count(),
+                "project_count": project_groups.size(),
+                "deployed_projects": project_groups["is_deployed"].sum(),
+                "project_quality_sum": project_groups["project_quality_score"].sum(),
+                "project_quality_count": project_groups["project_quality_score"].count(),
+                "event_participations": event_groups.size(),
+                "event_students": event_groups["student_id"].nunique(),
+            }
+        )
+
+    def _view_aggregates(
+        self, department_ids: Sequence[int], session_ids: Sequence[int]
+    ) -> pd.DataFrame:
+        """Read aggregates of the requested pairs from the materialized views."""
+        frames = []
+        for view in AGGREGATE_VIEWS:
+            columns = [view.c[name] for name in AGGREGATE_COLUMNS if name in view.c]
+            frame = self._frame(
+                select(view.c.department_id, view.c.academic_session_id, *columns).where(
+                    view.c.department_id.in_(department_ids),
+                    view.c.academic_session_id.in_(session_ids),
+                )
+            )
+            frames.append(frame.set_index(KEY_COLUMNS))
+        return pd.concat(frames, axis=1)
+
+    def source_statements(
+        self, department_ids: Sequence[int], session_ids: Sequence[int]
+    ) -> Dict[str, Any]:
+        """
+        Queries reading the source rows every aggregate is derived from.
+
+        Args:
+            department_ids: Departments to read
+            session_ids: Academic sessions to read
+
+        Returns:
+            Mapping of source name to select statement
+        """
+        return {
+            "feedback": (
+                select(
+                    Course.department_id,
+                    StudentFeedback.academic_session_id,
+                    StudentFeedback.student_id,
+                    StudentFeedback.rating,
+                )
+                .join(Course, Course.id == StudentFeedback.course_id)
+                .where(
+                    Course.department_id.in_(department_ids),
+                    StudentFeedback.academic_session_id.in_(session_ids),
+                )
+            ),
+            "internships": (
+                select(
+                    Student.department_id,
+                    InternshipRecord.academic_session_id,
+                    InternshipRecord.student_id,
+                    InternshipRecord.duration_weeks,
+                )
+                .join(Student, Student.id == InternshipRecord.student_id)
+                .where(
+                    Student.department_id.in_(department_ids),
+                    InternshipRecord.academic_session_id.in_(session_ids),
+                )
+            ),
+            "projects": (
+                select(
+                    Student.department_id,
+                    StudentProject.academic_session_id,
+                    StudentProject.is_deployed,
+                    StudentProject.project_quality_score,
+                )
+                .join(Student, Student.id == StudentProject.student_id)
+                .where(
+                    Student.department_id.in_(department_ids),
+                    StudentProject.academic_session_id.in_(session_ids),
+                )
+            ),
+            "events": (
+                select(
+                    Student.department_id,
+                    Event.academic_session_id,
+                    EventParticipant.student_id,
+                )
+                .join(Student, Student.id == EventParticipant.student_id)
+                .join(Event, Event.id == EventParticipant.event_id)
+                .where(
+                    Student.department_id.in_(department_ids),
+                    Event.academic_session_id.in_(session_ids),
+                )
+            ),
+            "students": (
+                select(
+                    Student.department_id,
+                    func.count(Student.id).label("active_students"),
+                )
+                .where(Student.is_active.is_(True), Student.department_id.in_(department_ids))
+                .group_by(Student.department_id)
+            ),
+        }
+
+    def compute_metrics(
+        self,
+        aggregates: pd.DataFrame,
+        definitions: Optional[Sequence[MetricDefinition]] = None,
+    ) -> pd.DataFrame:
+        """
+        Derive metric values, percentages and statuses from aggregates.
+
+        Args:
+            aggregates: Output of ``load_aggregates``
+            definitions: Metrics to compute (default: engine metrics)
+
+        Returns:
+            DataFrame with one row per snapshot, columns as ``SNAPSHOT_COLUMNS``
+        """
+        definitions = self.definitions if definitions is None else definitions
+        if aggregates.empty or not definitions:
+            return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+
+        keys = aggregates.index.to_frame(index=False)
+        frames = []
+        for definition in definitions:
+            numerator = aggregates[definition.numerator].to_numpy(dtype=float)
+            denominator = aggregates[definition.denominator].to_numpy(dtype=float)
+            values = np.divide(
+                numerator,
+                denominator,
+                out=np.zeros_like(numerator),
+                where=denominator > 0,
+            ) * definition.scale
+            frame = keys.copy()
+            frame["pillar_name"] = definition.pillar_name
+            frame["metric_name"] = definition.metric_name
+            frame["calculated_value"] = np.round(values, 4)
+            frame["target_value"] = definition.target_value
+            frames.append(frame)
+
+        result = pd.concat(frames, ignore_index=True)
+        percentages = self._get_percentages(
+            result["calculated_value"].to_numpy(), result["target_value"].to_numpy()
+        )
+        result["percentage_achieved"] = np.round(percentages, 2)
+        result["status"] = self._get_statuses(percentages)
+        return result[SNAPSHOT_COLUMNS]
+
+    def to_snapshots(self, frame: pd.DataFrame) -> List[KPISnapshot]:
+        """
+        Convert a metrics frame into (unsaved) KPISnapshot instances.
+
+        Args:
+            frame: Output of ``calculate_all``
+
+        Returns:
+            List of KPISnapshot objects
+        """
+        return [KPISnapshot(**record) for record in self.to_records(frame)]
+
+    def persist(self, frame: pd.DataFrame, commit: bool = True) -> int:
+        """
+        Replace the snapshot rows covered by ``frame`` with its values.
+
+        Args:
+            frame: Output of ``calculate_all``
+            commit: Commit the transaction when done
+
+        Returns:
+            Number of snapshot rows written
+        """
+        return self.persist_records(self.to_records(frame), commit=commit)
+
+    def persist_records(
+        self,
+        records: List[Dict[str, Any]],
+        commit: bool = True,
+        computed_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Upsert snapshot rows from precomputed records.
+
+        Each record replaces the snapshot of its (session, department,
+        pillar, metric); values that actually changed are also appended to
+        the snapshot history. Metrics no longer computed for a written
+        (department, session, pillar) are removed.
+
+        Args:
+            records: Output of ``to_records``
+            commit: Commit the transaction when done
+            computed_at: When the records' source data was read; snapshots
+                written since then are newer and are left alone
+
+        Returns:
+            Number of snapshot rows written
+        """
+        if not records:
+            return 0
+
+        ensure_snapshot_partitions(
+            self.session.connection(), {r["academic_session_id"] for r in records}
+        )
+        changed = self.session.execute(self._upsert_statement(computed_at), records).mappings().all()
+        if changed:
+            self.session.execute(insert(KPISnapshotHistory), [dict(row) for row in changed])
+
+        # Metrics written per (pillar, department, session); keys computing the
+        # same metric set share one DELETE per chunk of (department, session)
+        metrics: Dict[Tuple[str, int, int], Set[str]] = defaultdict(set)
+        for r in records:
+            metrics[(r["pillar_name"], r["department_id"], r["academic_session_id"])].add(r["metric_name"])
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[int, int]]] = defaultdict(list)
+        for (pillar, department_id, session_id), written in metrics.items():
+            groups[(pillar, tuple(sorted(written)))].append((department_id, session_id))
+        pair_columns = tuple_(KPISnapshot.department_id, KPISnapshot.academic_session_id)
+        for (pillar, kept), group_pairs in groups.items():
+            ordered_pairs = sorted(group_pairs)
+            for start in range(0, len(ordered_pairs), 500):
+                statement = delete(KPISnapshot).where(
+                    KPISnapshot.pillar_name == pillar,
+                    pair_columns.in_(ordered_pairs[start:start + 500]),
+                    KPISnapshot.metric_name.not_in(kept),
+                )
+                if computed_at is not None:
+                    statement = statement.where(KPISnapshot.updated_at < computed_at)
+                self.session.execute(statement)
+
+        if commit:
+            self.session.commit()
+            crud_kpi_snapshot.invalidate_departments(r["department_id"] for r in records)
+        return len(records)
+
+    def _upsert_statement(self, computed_at: Optional[datetime] = None):
+        """
+        Insert snapshots, updating existing keys only when a value changed
+        (and, given ``computed_at``, only snapshots not written since).
+
+        Returns the rows inserted or changed, for the history.
+        """
+        statement = crud_kpi_snapshot.insert_statement(self.session)
+        excluded = statement.excluded
+        changed = or_(*(getattr(KPISnapshot, name) != excluded[name] for name in SNAPSHOT_VALUES))
+        if computed_at is not None:
+            changed = and_(changed, KPISnapshot.updated_at < computed_at)
+        return statement.on_conflict_do_update(
+            index_elements=crud_kpi_snapshot.natural_key,
+            set_={
+                **{name: excluded[name] for name in SNAPSHOT_VALUES},
+                "updated_at": func.now(),
+            },
+            where=changed,
+        ).returning(*(getattr(KPISnapshot, name) for name in SNAPSHOT_COLUMNS))
+
+    def run(
+        self,
+        department_ids: Optional[Iterable[int]] = None,
+        session_ids: Optional[Iterable[int]] = None,
+        pillars: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Recompute and persist snapshots.
+
+        Args:
+            department_ids: Restrict to these departments (default: all)
+            session_ids: Restrict to these academic sessions (default: all)
+            pillars: Restrict to these pillars (default: all)
+
+        Returns:
+            Number of snapshot rows written
+        """
+        frame = self.calculate_all(department_ids, session_ids, pillars)
+        return self.persist(frame)
+
+    def calculate_keys(
+        self, keys: Iterable[Tuple[int, int, str]], use_views: bool = False
+    ) -> pd.DataFrame:
+        """
+        Calculate metrics for specific (department, session, pillar) keys.
+
+        Args:
+            keys: (department_id, academic_session_id, pillar_name) keys
+            use_views: Read the materialized views; only correct right after
+                a refresh, as dirty keys reflect the source tables
+
+        Returns:
+            DataFrame with one row per snapshot of the requested keys
+        """
+        keys = set(keys)
+        if not keys:
+            return pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+
+        frame = self.calculate_all(
+            department_ids={k[0] for k in keys},
+            session_ids={k[1] for k in keys},
+            pillars={k[2] for k in keys},
+            use_views=use_views,
+        )
+        wanted = pd.MultiIndex.from_tuples(
+            sorted(keys), names=[*KEY_COLUMNS, "pillar_name"]
+        )
+        mask = pd.MultiIndex.from_frame(frame[[*KEY_COLUMNS, "pillar_name"]]).isin(wanted)
+        return frame[mask].reset_index(drop=True)
+
+    def keys(
+        self,
+        department_ids: Optional[Iterable[int]] = None,
+        session_ids: Optional[Iterable[int]] = None,
+        pillars: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[int, int, str]]:
+        """
+        List every (department, session, pillar) key in scope.
+
+        Args:
+            department_ids: Restrict to these departments (default: all)
+            session_ids: Restrict to these academic sessions (default: all)
+            pillars: Restrict to these pillars (default: all)
+
+        Returns:
+            Sorted keys, grouped by (department, session)
+        """
+        department_ids = self._ids(department_ids, Department.id)
+        session_ids = self._ids(session_ids, AcademicSession.id)
+        pillar_names = list(
+            dict.fromkeys(d.pillar_name for d in self._select_definitions(pillars))
+        )
+        return [
+            (department_id, session_id, pillar)
+            for department_id in department_ids
+            for session_id in session_ids
+            for pillar in pillar_names
+        ]
+
+    def recompute_dirty(self, limit: Optional[int] = None) -> int:
+        """
+        Rebuild only the snapshots whose keys were marked dirty.
+
+        Claimed markers are deleted in the same transaction as the new
+        snapshots are written; keys marked again meanwhile stay pending.
+
+        Args:
+            limit: Maximum number of dirty markers to process
+
+        Returns:
+            Number of snapshot rows written
+        """
+        statement = (
+            select(
+                KPIDirtyKey.id,
+                KPIDirtyKey.department_id,
+                KPIDirtyKey.academic_session_id,
+                KPIDirtyKey.pillar_name,
+            )
+            .order_by(KPIDirtyKey.id)
+            .with_for_update(skip_locked=True)
+        )
+        if limit is not None:
+            statement = statement.limit(limit)
+        claimed = self.session.execute(statement).all()
+        if not claimed:
+            self.session.commit()
+            return 0
+
+        frame = self.calculate_keys((row[1], row[2], row[3]) for row in claimed)
+        written = self.persist(frame, commit=False)
+        ids = [row[0] for row in claimed]
+        for start in range(0, len(ids), 500):
+            self.session.execute(
+                delete(KPIDirtyKey).where(KPIDirtyKey.id.in_(ids[start:start + 500]))
+            )
+        self.session.commit()
+        crud_kpi_snapshot.invalidate_departments(row[1] for row in claimed)
+        return written
+
+    def _select_definitions(
+        self, pillars: Optional[Iterable[str]]
+    ) -> tuple[MetricDefinition, ...]:
+        """Filter metric definitions by pillar."""
+        if pillars is None:
+            return self.definitions
+        wanted = set(pillars)
+        return tuple(d for d in self.definitions if d.pillar_name in wanted)
+
+    def _ids(self, ids: Optional[Iterable[int]], column) -> List[int]:
+        """Return the given IDs, or every ID of ``column`` when None."""
+        if ids is not None:
+            return sorted(set(ids))
+        return list(self.session.scalars(select(column).order_by(column)))
+
+    def _frame(self, statement) -> pd.DataFrame:
+        """Execute a statement and load the result into a DataFrame."""
+        result = self.session.execute(statement)
+        return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+    @staticmethod
+    def to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Convert a metrics frame to plain-Python (JSON-safe) snapshot rows."""
+        records: List[Dict[str, Any]] = frame[SNAPSHOT_COLUMNS].to_dict("records")
+        for record in records:
+            record["department_id"] = int(record["department_id"])
+            record["academic_session_id"] = int(record["academic_session_id"])
+            record["calculated_value"] = float(record["calculated_value"])
+            record["target_value"] = float(record["target_value"])
+            record["percentage_achieved"] = float(record["percentage_achieved"])
+            record["status"] = str(record["status"])
+        return records
@@ -0,0 +1,339 @@
+"""
+KPI change tracking.
+Marks (department, session, pillar) keys dirty whenever rows feeding a
+KPI pillar are written, so only those snapshots need recomputing.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, cast
+
+from sqlalchemy import event, inspect, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.course import Course
+from app.models.department import AcademicSession
+from app.models.event import Event, EventParticipant
+from app.models.feedback import StudentFeedback
+from app.models.internship import InternshipRecord
+from app.models.kpi import KPIDirtyKey
+from app.models.student import Student, StudentProject
+
+DirtyKey = Tuple[int, int, str]
+
+# Pillar recomputed when a row of each tracked model changes
+TRACKED_PILLARS: Dict[type, str] = {
+    StudentFeedback: "academic_quality",
+    InternshipRecord: "employability",
+    StudentProject: "practical_skills",
+    EventParticipant: "student_engagement",
+}
+
+# Student columns behind the active-student counts every pillar's rates are
+# computed from; changing one dirties all pillars of the department in
+# every session
+STUDENT_ATTRIBUTES = ("department_id", "is_active")
+
+# Course department behind its feedback's academic_quality keys
+COURSE_ATTRIBUTES = ("department_id",)
+
+# Event session behind its participants' student_engagement keys
+EVENT_ATTRIBUTES = ("academic_session_id",)
+
+# Models whose rows only affect KPIs through these attributes, so other
+# changes to them mark nothing
+MOVE_ATTRIBUTES: Dict[type, Tuple[str, ...]] = {
+    Student: STUDENT_ATTRIBUTES,
+    Course: COURSE_ATTRIBUTES,
+    Event: EVENT_ATTRIBUTES,
+}
+
+# Models whose writes are tracked
+TRACKED_MODELS = frozenset([*TRACKED_PILLARS, *MOVE_ATTRIBUTES])
+
+# Attributes of each tracked model that decide which keys its rows affect
+KEY_ATTRIBUTES: Dict[type, Tuple[str, ...]] = {
+    StudentFeedback: ("course_id", "academic_session_id"),
+    InternshipRecord: ("student_id", "academic_session_id"),
+    StudentProject: ("student_id", "academic_session_id"),
+    EventParticipant: ("student_id", "event_id"),
+    **MOVE_ATTRIBUTES,
+}
+
+# Session.info flag that disables tracking (e.g. for bulk loads)
+TRACKING_INFO_KEY = "kpi_change_tracking"
+
+# Session.info set of keys already marked in the current transaction; its
+# markers cannot be claimed before it commits, so marking them again is moot
+MARKED_INFO_KEY = "kpi_marked_keys"
+
+
+def _values(obj, attribute: str) -> Set[int]:
+    """Return current and pre-change values of an attribute."""
+    state = inspect(obj)
+    history = state.attrs[attribute].history
+    values = set(history.added) | set(history.unchanged) | set(history.deleted)
+    if not values:
+        values.add(state.attrs[attribute].value)
+    return {v for v in values if v is not None}
+
+
+def collect_dirty_keys(connection: Connection, instances: Iterable) -> Set[DirtyKey]:
+    """
+    Resolve the KPI keys affected by changes to the given instances.
+
+    Args:
+        connection: Connection used to look up departments and sessions
+        instances: Changed ORM instances; untracked types are ignored
+
+    Returns:
+        Set of (department_id, academic_session_id, pillar_name) keys
+    """
+    # (pillar, course_ids, student_ids, session_ids, event_ids) per instance
+    pending: List[Tuple[str, Set[int], Set[int], Set[int], Set[int]]] = []
+    course_ids: Set[int] = set()
+    student_ids: Set[int] = set()
+    event_ids: Set[int] = set()
+    # Departments whose active-student counts changed
+    student_departments: Set[int] = set()
+    # Old and new departments of moved courses, sessions of moved events
+    moved_courses: Dict[int, Set[int]] = {}
+    moved_events: Dict[int, Set[int]] = {}
+
+    for obj in instances:
+        if isinstance(obj, Student):
+            student_departments |= _values(obj, "department_id")
+            continue
+        if isinstance(obj, Course):
+            moved_courses.setdefault(cast(int, obj.id), set()).update(_values(obj, "department_id"))
+            continue
+        if isinstance(obj, Event):
+            moved_events.setdefault(cast(int, obj.id), set()).update(_values(obj, "academic_session_id"))
+            continue
+        pillar = TRACKED_PILLARS.get(type(obj))
+        if pillar is None:
+            continue
+        if isinstance(obj, StudentFeedback):
+            courses, students = _values(obj, "course_id"), set()
+        else:
+            courses, students = set(), _values(obj, "student_id")
+        if isinstance(obj, EventParticipant):
+            events, sessions = _values(obj, "event_id"), set()
+        else:
+            events, sessions = set(), _values(obj, "academic_session_id")
+        pending.append((pillar, courses, students, sessions, events))
+        course_ids |= courses
+        student_ids |= students
+        event_ids |= events
+
+    keys = department_keys(connection, student_departments)
+    keys |= _moved_keys(connection, moved_courses, moved_events)
+    if not pending:
+        return keys
+
+    course_departments = _lookup(connection, Course.id, Course.department_id, course_ids)
+    row_departments = _lookup(connection, Student.id, Student.department_id, student_ids)
+    event_sessions = _lookup(connection, Event.id, Event.academic_session_id, event_ids)
+
+    for pillar, courses, students, sessions, events in pending:
+        departments = {course_departments[c] for c in courses if c in course_departments}
+        departments |= {row_departments[s] for s in students if s in row_departments}
+        sessions = sessions | {event_sessions[e] for e in events if e in event_sessions}
+        keys |= {(d, s, pillar) for d in departments for s in sessions}
+    return keys
+
+
+def department_keys(connection: Connection, department_ids: Iterable[int]) -> Set[DirtyKey]:
+    """
+    Every key of some departments, for changes to their active students.
+
+    Args:
+        connection: Connection used to look up academic sessions
+        department_ids: Departments whose students changed
+
+    Returns:
+        Set of (department_id, academic_session_id, pillar_name) keys
+    """
+    department_ids = set(department_ids)
+    if not department_ids:
+        return set()
+    sessions = set(connection.scalars(select(AcademicSession.id)))
+    pillars = set(TRACKED_PILLARS.values())
+    return {(d, s, p) for d in department_ids for s in sessions for p in pillars}
+
+
+def _moved_keys(
+    connection: Connection,
+    moved_courses: Dict[int, Set[int]],
+    moved_events: Dict[int, Set[int]],
+) -> Set[DirtyKey]:
+    """Keys of the rows hanging off moved courses and events."""
+    keys: Set[DirtyKey] = set()
+    if moved_courses:
+        rows = connection.execute(
+            select(StudentFeedback.course_id, StudentFeedback.academic_session_id)
+            .where(StudentFeedback.course_id.in_(sorted(moved_courses)))
+            .distinct()
+        )
+        for course_id, session_id in rows:
+            keys |= {(d, session_id, "academic_quality") for d in moved_courses[course_id]}
+    if moved_events:
+        rows = connection.execute(
+            select(EventParticipant.event_id, Student.department_id)
+            .join(Student, Student.id == EventParticipant.student_id)
+            .where(EventParticipant.event_id.in_(sorted(moved_events)))
+            .distinct()
+        )
+        for event_id, department_id in rows:
+            keys |= {(department_id, s, "student_engagement") for s in moved_events[event_id]}
+    return keys
+
+
+def bulk_changes(objs: Sequence, previous: Sequence) -> List:
+    """
+    Instances of a bulk write whose KPI keys need marking.
+
+    Rows of pillar models always count. Students, courses and events only
+    count when inserted, deleted or changed in one of their
+    ``MOVE_ATTRIBUTES``; ``previous`` holds transient copies (with ``id``)
+    of rows as they were before the write.
+
+    Args:
+        objs: Written (or deleted) instances
+        previous: Pre-write copies of the rows that already existed
+
+    Returns:
+        Current and previous instances to pass to ``mark_instances_dirty``
+    """
+    attributes = MOVE_ATTRIBUTES.get(type(objs[0])) if objs else None
+    if attributes is None:
+        return [*objs, *previous]
+    before = {obj.id: obj for obj in previous}
+    changed = []
+    for obj in objs:
+        old = before.get(obj.id)
+        if old is None:
+            changed.append(obj)
+        elif any(getattr(old, a) != getattr(obj, a) for a in attributes):
+            changed.extend([obj, old])
+    return changed
+
+
+def mark_dirty(connection: Connection, keys: Iterable[DirtyKey]) -> int:
+    """
+    Insert a marker for each key.
+
+    A marker is inserted even when the key already has one: that marker
+    may be claimed by a running ``recompute_dirty``, which computed the key
+    from data older than this write and deletes the marker when it commits.
+
+    Args:
+        connection: Connection of the writing transaction
+        keys: (department_id, academic_session_id, pillar_name) keys
+
+    Returns:
+        Number of markers inserted
+    """
+    keys = sorted(set(keys))
+    if keys:
+        connection.execute(
+            insert(KPIDirtyKey),
+            [
+                {"department_id": d, "academic_session_id": s, "pillar_name": p}
+                for d, s, p in keys
+            ],
+        )
+    return len(keys)
+
+
+def mark_keys_dirty(session: Session, keys: Iterable[DirtyKey]) -> int:
+    """
+    Mark keys dirty in a session's transaction, once per transaction.
+
+    Args:
+        session: Session whose transaction the marks are written in
+        keys: (department_id, academic_session_id, pillar_name) keys
+
+    Returns:
+        Number of keys newly marked
+    """
+    if not session.info.get(TRACKING_INFO_KEY, True):
+        return 0
+    marked: Set[DirtyKey] = session.info.setdefault(MARKED_INFO_KEY, set())
+    keys = set(keys) - marked
+    marked |= keys
+    return mark_dirty(session.connection(), keys)
+
+
+def mark_instances_dirty(session: Session, instances: Iterable) -> int:
+    """
+    Mark the KPI keys affected by the given instances dirty.
+
+    Args:
+        session: Session whose transaction the marks are written in
+        instances: Changed ORM instances
+
+    Returns:
+        Number of keys newly marked
+    """
+    if not session.info.get(TRACKING_INFO_KEY, True):
+        return 0
+    return mark_keys_dirty(session, collect_dirty_keys(session.connection(), instances))
+
+
+def _lookup(connection: Connection, key_column, value_column, ids: Set[int]) -> Dict[int, int]:
+    """Map ids to a column value in one query."""
+    if not ids:
+        return {}
+    rows = connection.execute(
+        select(key_column, value_column).where(key_column.in_(sorted(ids)))
+    )
+    return {key: value for key, value in rows}
+
+
+def _modified(session: Session, obj) -> bool:
+    """Whether a dirty instance changed in a way that can affect KPIs."""
+    attributes = MOVE_ATTRIBUTES.get(type(obj))
+    if attributes is not None:
+        state = inspect(obj)
+        return any(state.attrs[a].history.has_changes() for a in attributes)
+    return session.is_modified(obj, include_collections=False)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Session hook: mark keys touched by the flushed instances dirty."""
+    changed = [
+        obj for obj in session.dirty if type(obj) in TRACKED_MODELS and _modified(session, obj)
+    ]
+    changed.extend(obj for obj in session.new if type(obj) in TRACKED_MODELS)
+    changed.extend(obj for obj in session.deleted if type(obj) in TRACKED_MODELS)
+    if changed:
+        mark_instances_dirty(session, changed)
+
+
+def _forget_marked(session: Session, transaction) -> None:
+    """Session hook: markers of an ended transaction no longer deduplicate."""
+    # Flushes run in subtransactions, which end without committing anything
+    if transaction.nested or transaction.parent is None:
+        session.info.pop(MARKED_INFO_KEY, None)
+
+
+def _keep_previous(target, value, oldvalue, initiator) -> None:
+    """Attribute hook whose only job is to make SQLAlchemy load old values."""
+
+
+def register_change_tracking() -> None:
+    """
+    Install the dirty-key hook on every ORM session (idempotent).
+
+    Key attributes also get active history, so assigning one of an expired
+    instance still records the value it replaces and the keys it leaves.
+    """
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+    if not event.contains(Session, "after_transaction_end", _forget_marked):
+        event.listen(Session, "after_transaction_end", _forget_marked)
+    for model, attributes in KEY_ATTRIBUTES.items():
+        for name in attributes:
+            attribute = getattr(model, name)
+            if not event.contains(attribute, "set", _keep_previous):
+                event.listen(attribute, "set", _keep_previous, active_history=True)
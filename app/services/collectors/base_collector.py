@@ -4,14 +4,48 @@ All data source integrations should inherit from this.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union, cast
 
 from sqlalchemy.orm import Session
 
+from app.crud.collector import crud_collector_sync_run, crud_collector_sync_state
+from app.models.collector import CollectorSyncRun, CollectorSyncState
+
+
+@dataclass
+class SyncCheckpoint:
+    """
+    Sync position of one entity, yielded by ``aiter_collect`` after the
+    entity's items.
+
+    The pipeline stores a checkpoint only once every item yielded before it
+    has been persisted, so a crashed run resumes from the last position
+    whose data is safely written.
+    """
+
+    entity: str
+    watermark: Optional[str] = None
+    etag: Optional[str] = None
+    page_token: Optional[str] = None
+
+    @classmethod
+    def from_state(cls, state: CollectorSyncState) -> "SyncCheckpoint":
+        """Plain copy of a stored sync state."""
+        return cls(
+            entity=cast(str, state.entity),
+            watermark=cast(Optional[str], state.watermark),
+            etag=cast(Optional[str], state.etag),
+            page_token=cast(Optional[str], state.page_token),
+        )
+
 
 class BaseCollector(ABC):
     """Abstract base class for data collectors."""
 
+    # Source name of the collector's sync states; None disables sync state
+    source: Optional[str] = None
+
     def __init__(self, session: Session):
         """
         Initialize collector.
@@ -43,3 +77,104 @@ class BaseCollector(ABC):
             True if valid, False otherwise
         """
         pass
+
+    async def aiter_collect(self, **kwargs) -> AsyncIterator[Union[Dict[str, Any], SyncCheckpoint]]:
+        """
+        Stream collected items.
+
+        The default yields the result of ``collect()``; collectors of large
+        sources override this to yield items as they are fetched, so the
+        collector pipeline runs in constant memory. Incremental collectors
+        also yield a ``SyncCheckpoint`` after each entity (or page) they
+        finish.
+        """
+        for item in self.collect(**kwargs):
+            yield item
+
+    def validate_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate a batch of items.
+
+        Args:
+            items: Collected items
+
+        Returns:
+            The valid items
+        """
+        return [item for item in items if self.validate(item)]
+
+    @abstractmethod
+    def persist_batch(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Write a batch of valid items and commit.
+
+        Args:
+            items: Validated items
+
+        Returns:
+            Number of items written
+        """
+        pass
+
+    def sync_states(self, entities: Optional[Iterable[str]] = None) -> Dict[str, CollectorSyncState]:
+        """
+        Load the committed sync states of this collector's source.
+
+        Args:
+            entities: Restrict to these entities (default: all)
+
+        Returns:
+            Mapping of entity to its state
+        """
+        if self.source is None:
+            return {}
+        return crud_collector_sync_state.get_states(self.session, self.source, entities)
+
+    def save_checkpoints(self, checkpoints: List[SyncCheckpoint]) -> int:
+        """
+        Commit sync states; the last checkpoint of an entity wins.
+
+        Args:
+            checkpoints: Checkpoints whose items have been persisted
+
+        Returns:
+            Number of entities written
+        """
+        if self.source is None or not checkpoints:
+            return 0
+        return crud_collector_sync_state.save_states(
+            self.session, self.source, [asdict(checkpoint) for checkpoint in checkpoints]
+        )
+
+    def run_stats(self) -> Dict[str, Any]:
+        """Collector-specific counters recorded with each sync run."""
+        return {}
+
+    def start_sync_run(self) -> Optional[CollectorSyncRun]:
+        """Record the start of a sync run, if the collector keeps sync state."""
+        if self.source is None:
+            return None
+        return crud_collector_sync_run.start(self.session, self.source)
+
+    def finish_sync_run(
+        self,
+        run: Optional[CollectorSyncRun],
+        counts: Dict[str, int],
+        stats: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the outcome of a sync run.
+
+        Args:
+            run: Run returned by ``start_sync_run``
+            counts: Item and checkpoint counts
+            stats: Detailed statistics
+            error: Error message of a failed run
+        """
+        if run is None:
+            return
+        if error:
+            # Discard the failed batch before recording the failure
+            self.session.rollback()
+        crud_collector_sync_run.finish(self.session, run, counts, stats, error)
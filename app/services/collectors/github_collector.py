@@ -0,0 +1,490 @@
+"""
+GitHub collector.
+Fetches students' repositories concurrently over a pooled async HTTP client,
+using conditional requests and GitHub's rate-limit headers to spend quota
+only on resources that changed.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.student import Student, StudentProject
+from app.services.collectors.base_collector import BaseCollector, SyncCheckpoint
+
+logger = get_logger(__name__)
+
+REPO_FIELDS = (
+    "name",
+    "full_name",
+    "html_url",
+    "description",
+    "language",
+    "stargazers_count",
+    "forks_count",
+    "fork",
+    "pushed_at",
+    "updated_at",
+)
+
+
+@dataclass
+class GitHubCollectStats:
+    """Counters for one collection run."""
+
+    users: int = 0
+    requests: int = 0
+    not_modified: int = 0
+    not_found: int = 0
+    failed: int = 0
+    retries: int = 0
+    rate_limit_waits: int = 0
+    waited_seconds: float = 0.0
+
+
+class RateLimiter:
+    """
+    Pause gate shared by all in-flight requests.
+
+    Every response updates the gate from its ``X-RateLimit-*`` headers; once
+    the remaining quota drops to ``reserve``, new requests wait until the
+    window resets instead of burning the rest of it on 403s.
+    """
+
+    def __init__(
+        self,
+        reserve: int = 0,
+        max_wait: float = 900.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            reserve: Requests to leave unused in each window
+            max_wait: Upper bound of a single wait in seconds
+            clock: Wall clock matching ``X-RateLimit-Reset`` epochs
+            sleep: Coroutine used to wait
+        """
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.clock = clock
+        self.sleep = sleep
+        self.resume_at = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the quota reported by a response."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        if int(remaining) <= self.reserve:
+            self.resume_at = max(self.resume_at, float(reset))
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for ``seconds`` from now."""
+        self.resume_at = max(self.resume_at, self.clock() + seconds)
+
+    async def wait(self) -> float:
+        """
+        Wait until requests may be sent again.
+
+        Returns:
+            Seconds waited
+        """
+        delay = min(self.resume_at - self.clock(), self.max_wait)
+        if delay <= 0:
+            return 0.0
+        await self.sleep(delay)
+        return delay
+
+
+class GitHubCollector(BaseCollector):
+    """
+    Collects the public repositories of students with a GitHub username.
+
+    Requests run concurrently on one pooled ``httpx.AsyncClient``, bounded by
+    ``max_concurrency``. Each user is an entity ``repos:<username>`` with a
+    sync state:
+
+    * the first page is requested with ``If-None-Match`` from the stored
+      ETag; a 304 costs no rate-limit quota and the user is skipped
+    * repositories are listed most recently updated first, so paging stops
+      at the first repository not newer than the stored ``updated_at``
+      watermark and only the delta is yielded
+    * a checkpoint after each page records the next page URL, so a crashed
+      run resumes where its last persisted page ended
+    """
+
+    source = "github"
+
+    # Above this many users, load the source's whole sync state in one query
+    sync_state_lookup_limit = 1000
+
+    def __init__(
+        self,
+        session: Session,
+        token: Optional[str] = settings.GITHUB_TOKEN,
+        base_url: str = settings.GITHUB_API_BASE_URL,
+        max_concurrency: int = settings.GITHUB_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            session: Database session
+            token: GitHub API token; unauthenticated requests get 60/hour
+            base_url: GitHub API base URL (a stand-in server in tests)
+            max_concurrency: Maximum requests in flight
+            rate_limiter: Rate-limit gate (default: a new one)
+            max_retries: Retries after rate limiting or server errors
+            backoff_seconds: Base delay of the exponential server-error backoff
+            timeout: Per-request timeout in seconds
+            transport: Optional httpx transport
+        """
+        super().__init__(session)
+        self.token = token
+        self.base_url = base_url
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.transport = transport
+        self.stats = GitHubCollectStats()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def collect(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Collect repositories synchronously.
+
+        Must not be called from a running event loop; use ``acollect`` there.
+        """
+        return asyncio.run(self.acollect(**kwargs))
+
+    async def acollect(
+        self, students: Optional[Iterable[Tuple[int, str]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect repositories of changed users into a list.
+
+        Args:
+            students: (student_id, github_username) pairs (default: every
+                active student with a GitHub username)
+
+        Returns:
+            One item per repository
+        """
+        return [
+            item
+            async for item in self.aiter_collect(students=students)
+            if not isinstance(item, SyncCheckpoint)
+        ]
+
+    async def aiter_collect(
+        self, students: Optional[Iterable[Tuple[int, str]]] = None, **kwargs: Any
+    ) -> AsyncIterator[Union[Dict[str, Any], SyncCheckpoint]]:
+        """
+        Stream new and updated repositories as each user completes.
+
+        ``max_concurrency`` workers share the list of users and hand their
+        results over a bounded queue, so a slow consumer pauses fetching.
+        Each user's items are followed by the checkpoints that advance its
+        sync state; run through ``CollectorPipeline`` to store them.
+
+        Args:
+            students: (student_id, github_username) pairs (default: every
+                active student with a GitHub username)
+            **kwargs: Other collector options (unused)
+
+        Yields:
+            One item per repository, and sync checkpoints
+        """
+        if students is None:
+            students = self.students()
+        students = list(students)
+        if len(students) > self.sync_state_lookup_limit:
+            rows = self.sync_states()
+        else:
+            rows = self.sync_states([self.entity(username) for _, username in students])
+        # Plain copies: the persist stage commits on the session from another thread
+        states = {entity: SyncCheckpoint.from_state(row) for entity, row in rows.items()}
+
+        self.stats = GitHubCollectStats(users=len(students))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = iter(students)
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency)
+        collected = 0
+
+        async with self.client() as client:
+
+            async def worker() -> None:
+                for student_id, username in pending:
+                    try:
+                        items = await self._collect_user(
+                            client, student_id, username, states.get(self.entity(username))
+                        )
+                    except Exception as e:
+                        self.stats.failed += 1
+                        logger.error(f"Error collecting GitHub repositories for {username}: {str(e)}")
+                        items = []
+                    await results.put(items)
+
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(students)))]
+            try:
+                # Every user produces exactly one result, even on failure
+                for _ in students:
+                    for item in await results.get():
+                        collected += not isinstance(item, SyncCheckpoint)
+                        yield item
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info(
+            f"Collected {collected} GitHub repositories for {self.stats.users} users "
+            f"({self.stats.requests} requests, {self.stats.not_modified} not modified, "
+            f"{self.stats.failed} failed)"
+        )
+
+    def validate(self, data: Dict[str, Any]) -> bool:
+        """Check a repository item has an owner and a GitHub URL."""
+        return (
+            bool(data.get("student_id"))
+            and bool(data.get("name"))
+            and str(data.get("html_url") or "").startswith("https://github.com/")
+        )
+
+    def persist_batch(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Enrich registered projects from their collected repositories.
+
+        Projects are matched on the owning student and ``github_url``; the
+        repository language is added to ``technologies_used`` and its
+        description fills an empty ``project_description``.
+
+        Args:
+            items: Validated repository items
+
+        Returns:
+            Number of projects updated
+        """
+        repos = {(item["student_id"], item["html_url"]): item for item in items}
+        rows = self.session.execute(
+            select(
+                StudentProject.id,
+                StudentProject.student_id,
+                StudentProject.github_url,
+                StudentProject.project_description,
+                StudentProject.technologies_used,
+            ).where(StudentProject.github_url.in_({url for _, url in repos}))
+        )
+
+        updates = []
+        for project_id, student_id, url, description, technologies in rows:
+            repo = repos.get((student_id, url))
+            if repo is None:
+                continue
+            values = {}
+            technologies = list(technologies or [])
+            if repo.get("language") and repo["language"] not in technologies:
+                values["technologies_used"] = technologies + [repo["language"]]
+            if not description and repo.get("description"):
+                values["project_description"] = repo["description"][:1000]
+            if values:
+                updates.append({"id": project_id, **values})
+
+        if updates:
+            self.session.execute(update(StudentProject), updates)
+        self.session.commit()
+        return len(updates)
+
+    def students(self) -> List[Tuple[int, str]]:
+        """Return (student_id, github_username) pairs to collect."""
+        rows = self.session.execute(
+            select(Student.id, Student.github_username)
+            .where(Student.github_username.isnot(None), Student.is_active.is_(True))
+            .order_by(Student.id)
+        )
+        return [(student_id, username) for student_id, username in rows if username]
+
+    def client(self) -> httpx.AsyncClient:
+        """Create the pooled API client."""
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": settings.APP_NAME,
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            transport=self.transport,
+        )
+
+    async def _collect_user(
+        self,
+        client: httpx.AsyncClient,
+        student_id: int,
+        username: str,
+        state: Optional[SyncCheckpoint] = None,
+    ) -> List[Union[Dict[str, Any], SyncCheckpoint]]:
+        """
+        Fetch one user's repositories updated since the stored watermark.
+
+        On errors the pages read so far, with their checkpoints, are still
+        returned so the next run resumes after them.
+        """
+        entity = self.entity(username)
+        watermark = state.watermark if state else None
+        etag = state.etag if state else None
+        output: List[Union[Dict[str, Any], SyncCheckpoint]] = []
+        try:
+            if state and state.page_token:
+                # Resume an interrupted fetch; its ETag would describe page 1 only
+                response = await self._get(client, state.page_token)
+                new_etag = None
+            else:
+                response = await self._get(
+                    client,
+                    f"/users/{username}/repos",
+                    params={"per_page": 100, "sort": "updated", "direction": "desc", "type": "owner"},
+                    etag=etag,
+                )
+                if response.status_code == 304:
+                    self.stats.not_modified += 1
+                    return []
+                new_etag = response.headers.get("ETag")
+            if response.status_code == 404:
+                self.stats.not_found += 1
+                logger.warning(f"GitHub user {username} not found")
+                return []
+
+            newest = watermark
+            while True:
+                response.raise_for_status()
+                repos = response.json()
+                fresh = [repo for repo in repos if self._newer(repo, watermark)]
+                output.extend(self._item(student_id, username, repo) for repo in fresh)
+                newest = max(
+                    [newest or "", *(repo.get("updated_at") or "" for repo in fresh)]
+                ) or None
+
+                next_url = response.links.get("next", {}).get("url")
+                # Older pages hold nothing newer than the watermark
+                if not next_url or len(fresh) < len(repos):
+                    break
+                output.append(SyncCheckpoint(entity, watermark, etag, page_token=next_url))
+                response = await self._get(client, next_url)
+        except (httpx.HTTPError, ValueError) as e:
+            self.stats.failed += 1
+            logger.error(f"Error collecting GitHub repositories for {username}: {str(e)}")
+            return output
+
+        output.append(SyncCheckpoint(entity, newest, new_etag))
+        return output
+
+    @staticmethod
+    def entity(username: str) -> str:
+        """Sync state entity of a user's repositories."""
+        return f"repos:{username}"
+
+    def run_stats(self) -> Dict[str, Any]:
+        """Request counters of the last run."""
+        return asdict(self.stats)
+
+    @staticmethod
+    def _newer(repo: Dict[str, Any], watermark: Optional[str]) -> bool:
+        """Whether a repository was updated after the watermark (ISO 8601 UTC)."""
+        return watermark is None or (repo.get("updated_at") or "") > watermark
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        etag: Optional[str] = None,
+    ) -> httpx.Response:
+        """GET with rate-limit waits and retries; returns the last response."""
+        headers = {"If-None-Match": etag} if etag else {}
+        for attempt in range(self.max_retries + 1):
+            waited = await self.rate_limiter.wait()
+            if waited:
+                self.stats.rate_limit_waits += 1
+                self.stats.waited_seconds += waited
+
+            if self._semaphore is None:
+                # Created per run by aiter_collect; direct callers get one here
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                response = await client.get(url, params=params, headers=headers)
+            self.stats.requests += 1
+            self.rate_limiter.update(response.headers)
+
+            if attempt == self.max_retries:
+                break
+            if self._rate_limited(response):
+                self.rate_limiter.pause(self._retry_after(response))
+            elif response.status_code >= 500:
+                self.rate_limiter.pause(self.backoff_seconds * 2**attempt)
+            else:
+                break
+            self.stats.retries += 1
+        return response
+
+    def _rate_limited(self, response: httpx.Response) -> bool:
+        """Primary (quota exhausted) or secondary (Retry-After) rate limit."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response.headers
+        )
+
+    def _retry_after(self, response: httpx.Response) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        if "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"])
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is not None:
+            return max(float(reset) - self.rate_limiter.clock(), 0.0)
+        return 60.0
+
+    @staticmethod
+    def _item(student_id: int, username: str, repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a repository payload into a collected item."""
+        item = {"student_id": student_id, "github_username": username, "repo_id": repo.get("id")}
+        item.update({field: repo.get(field) for field in REPO_FIELDS})
+        return item
@@ -0,0 +1,231 @@
+"""
+Collector pipeline.
+Streams a collector's items through batched validation and chunked
+persistence, with bounded buffers between the stages for backpressure.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.collectors.base_collector import BaseCollector, SyncCheckpoint
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Batch:
+    """Items travelling between stages, with the checkpoints they complete."""
+
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    checkpoints: List[SyncCheckpoint] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.items) + len(self.checkpoints)
+
+
+@dataclass
+class StageStats:
+    """Throughput counters of one pipeline stage."""
+
+    items_in: int = 0
+    items_out: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Items produced per second spent working (not waiting on buffers)."""
+        return self.items_out / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class PipelineReport:
+    """Outcome of one pipeline run."""
+
+    collect: StageStats = field(default_factory=StageStats)
+    validate: StageStats = field(default_factory=StageStats)
+    persist: StageStats = field(default_factory=StageStats)
+    checkpoints: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def invalid(self) -> int:
+        """Items rejected by validation."""
+        return self.validate.items_in - self.validate.items_out
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the report, including per-stage rates."""
+        report = asdict(self)
+        for stage in ("collect", "validate", "persist"):
+            report[stage]["items_per_second"] = getattr(self, stage).items_per_second
+        report["invalid"] = self.invalid
+        return report
+
+    def counts(self) -> Dict[str, int]:
+        """Item and checkpoint counts as recorded on a sync run."""
+        return {
+            "items_collected": self.collect.items_out,
+            "items_valid": self.validate.items_out,
+            "items_persisted": self.persist.items_out,
+            "checkpoints": self.checkpoints,
+        }
+
+
+class CollectorPipeline:
+    """
+    Runs collect -> validate -> persist as three concurrent stages.
+
+    Items from ``aiter_collect`` are grouped into batches of ``batch_size``
+    and handed between stages over queues holding at most
+    ``buffer_batches`` batches, so memory stays bounded regardless of the
+    source size and a slow writer throttles fetching. Persistence runs in a
+    worker thread, overlapping database writes with fetching.
+
+    ``SyncCheckpoint`` markers from the source travel with the batch being
+    assembled and are saved right after that batch's items, so sync state
+    never runs ahead of persisted data. Collectors with a ``source`` get a
+    sync run recorded with the report.
+    """
+
+    def __init__(
+        self,
+        collector: BaseCollector,
+        batch_size: int = settings.COLLECTOR_BATCH_SIZE,
+        buffer_batches: int = settings.COLLECTOR_BUFFER_BATCHES,
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            collector: Collector providing ``aiter_collect``, ``validate_batch``
+                and ``persist_batch``
+            batch_size: Items per validation and persistence batch
+            buffer_batches: Batches buffered between two stages
+        """
+        self.collector = collector
+        self.batch_size = max(1, batch_size)
+        self.buffer_batches = max(1, buffer_batches)
+        # Batch write running in a worker thread; cancelling the persist
+        # stage does not stop it, so it is awaited before touching the session
+        self._writing: Optional[asyncio.Future] = None
+
+    def run(self, **kwargs) -> PipelineReport:
+        """Run the pipeline to completion from synchronous code."""
+        return asyncio.run(self.arun(**kwargs))
+
+    async def arun(self, **kwargs) -> PipelineReport:
+        """
+        Run the pipeline to completion.
+
+        Args:
+            **kwargs: Passed to the collector's ``aiter_collect``
+
+        Returns:
+            Per-stage counters of the run
+
+        Raises:
+            Exception: The first error of any stage, after stopping the others
+        """
+        report = PipelineReport()
+        run = self.collector.start_sync_run()
+        collected: asyncio.Queue = asyncio.Queue(maxsize=self.buffer_batches)
+        validated: asyncio.Queue = asyncio.Queue(maxsize=self.buffer_batches)
+        started = time.perf_counter()
+        self._writing = None
+
+        tasks = [
+            asyncio.create_task(self._collect(collected, report.collect, kwargs)),
+            asyncio.create_task(self._validate(collected, validated, report.validate)),
+            asyncio.create_task(self._persist(validated, report)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException as e:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._writing is not None:
+                await asyncio.gather(self._writing, return_exceptions=True)
+            report.elapsed_seconds = time.perf_counter() - started
+            self._finish(run, report, error=str(e) or type(e).__name__)
+            raise
+
+        report.elapsed_seconds = time.perf_counter() - started
+        self._finish(run, report)
+        logger.info(
+            f"{type(self.collector).__name__} pipeline: {report.collect.items_out} collected, "
+            f"{report.validate.items_out} valid, {report.persist.items_out} persisted "
+            f"in {report.elapsed_seconds:.2f}s"
+        )
+        return report
+
+    def _finish(self, run: Any, report: PipelineReport, error: Optional[str] = None) -> None:
+        """Record the run's outcome on the collector's sync run."""
+        stats = {"pipeline": report.to_dict(), "collector": self.collector.run_stats()}
+        self.collector.finish_sync_run(run, report.counts(), stats, error)
+
+    async def _collect(
+        self, out: asyncio.Queue, stats: StageStats, kwargs: Dict[str, Any]
+    ) -> None:
+        """Batch items from the source; time blocked on ``out`` is not busy time."""
+        started = time.perf_counter()
+        blocked = 0.0
+        batch = Batch()
+
+        async for item in self.collector.aiter_collect(**kwargs):
+            if isinstance(item, SyncCheckpoint):
+                batch.checkpoints.append(item)
+            else:
+                batch.items.append(item)
+            if len(batch) >= self.batch_size:
+                blocked += await self._put(out, batch, stats)
+                batch = Batch()
+        if batch:
+            blocked += await self._put(out, batch, stats)
+
+        stats.items_in = stats.items_out
+        stats.busy_seconds = time.perf_counter() - started - blocked
+        await out.put(None)
+
+    async def _validate(self, source: asyncio.Queue, out: asyncio.Queue, stats: StageStats) -> None:
+        """Validate batches, dropping those left without items or checkpoints."""
+        while (batch := await source.get()) is not None:
+            started = time.perf_counter()
+            valid = self.collector.validate_batch(batch.items) if batch.items else []
+            stats.busy_seconds += time.perf_counter() - started
+            stats.items_in += len(batch.items)
+            if valid or batch.checkpoints:
+                await self._put(out, Batch(valid, batch.checkpoints), stats)
+        await out.put(None)
+
+    async def _persist(self, source: asyncio.Queue, report: PipelineReport) -> None:
+        """Write batches, then their checkpoints, one at a time in a worker thread."""
+        stats = report.persist
+        while (batch := await source.get()) is not None:
+            started = time.perf_counter()
+            self._writing = asyncio.ensure_future(asyncio.to_thread(self._write, batch))
+            written = await asyncio.shield(self._writing)
+            stats.busy_seconds += time.perf_counter() - started
+            stats.items_in += len(batch.items)
+            stats.items_out += written
+            stats.batches += 1
+            report.checkpoints += len(batch.checkpoints)
+
+    def _write(self, batch: Batch) -> int:
+        """Persist a batch's items and then save its checkpoints."""
+        written = self.collector.persist_batch(batch.items) if batch.items else 0
+        self.collector.save_checkpoints(batch.checkpoints)
+        return written
+
+    @staticmethod
+    async def _put(queue: asyncio.Queue, batch: Batch, stats: StageStats) -> float:
+        """Hand a batch downstream, returning the seconds spent blocked."""
+        stats.items_out += len(batch.items)
+        stats.batches += 1
+        started = time.perf_counter()
+        await queue.put(batch)
+        return time.perf_counter() - started
@@ -0,0 +1 @@
+"""Data Exporters package."""
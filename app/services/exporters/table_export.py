@@ -0,0 +1,143 @@
+"""
+Streaming table exports.
+Rows are read through a server-side cursor and encoded as NDJSON or CSV
+one batch at a time, so memory use does not grow with table size.
+"""
+
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Iterable, List, Mapping, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.kpi import KPISnapshot
+from app.models.student import Student
+
+
+class ExportFormat(str, Enum):
+    """Supported export encodings."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+STUDENT_COLUMNS: List[Any] = [
+    Student.id,
+    Student.matric_number,
+    Student.first_name,
+    Student.last_name,
+    Student.email,
+    Student.department_id,
+    Student.level,
+    Student.github_username,
+    Student.is_active,
+    Student.created_at,
+    Student.updated_at,
+]
+
+KPI_SNAPSHOT_COLUMNS: List[Any] = [
+    KPISnapshot.id,
+    KPISnapshot.academic_session_id,
+    KPISnapshot.department_id,
+    KPISnapshot.pillar_name,
+    KPISnapshot.metric_name,
+    KPISnapshot.calculated_value,
+    KPISnapshot.target_value,
+    KPISnapshot.percentage_achieved,
+    KPISnapshot.status,
+    KPISnapshot.created_at,
+    KPISnapshot.updated_at,
+]
+
+
+def students_statement(department_id: Optional[int] = None) -> Select:
+    """Select every student column in primary key order."""
+    statement = select(*STUDENT_COLUMNS).order_by(Student.id)
+    if department_id is not None:
+        statement = statement.where(Student.department_id == department_id)
+    return statement
+
+
+def kpi_snapshots_statement(
+    department_id: Optional[int] = None,
+    academic_session_id: Optional[int] = None,
+) -> Select:
+    """Select every KPI snapshot column in primary key order."""
+    statement = select(*KPI_SNAPSHOT_COLUMNS).order_by(KPISnapshot.id)
+    if department_id is not None:
+        statement = statement.where(KPISnapshot.department_id == department_id)
+    if academic_session_id is not None:
+        statement = statement.where(KPISnapshot.academic_session_id == academic_session_id)
+    return statement
+
+
+def _json_value(value: Any) -> Any:
+    """Encode values json.dumps cannot handle (datetimes)."""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def encode_ndjson(rows: Iterable[Mapping[Any, Any]]) -> str:
+    """Encode rows as newline-delimited JSON."""
+    return "".join(
+        json.dumps(dict(row), default=_json_value, separators=(",", ":")) + "\n"
+        for row in rows
+    )
+
+
+def encode_csv(rows: Iterable[Iterable[Any]]) -> str:
+    """Encode rows as CSV lines."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [value.isoformat() if hasattr(value, "isoformat") else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+async def stream_export(
+    statement: Select,
+    export_format: ExportFormat,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream the result of a query as encoded text chunks.
+
+    The export opens its own session because it outlives the request
+    handler that returns the ``StreamingResponse``. For CSV the header is
+    sent before the query runs, so the first byte goes out immediately.
+
+    Args:
+        statement: Core select of the columns to export
+        export_format: NDJSON or CSV
+        session_factory: Factory for the session holding the cursor
+        batch_size: Rows fetched and encoded per chunk
+
+    Yields:
+        One encoded chunk per batch of rows
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    columns: List[str] = [str(column.key) for column in statement.selected_columns]
+    if export_format == ExportFormat.CSV:
+        yield encode_csv([columns])
+
+    async with session_factory() as session:
+        result = await session.stream(
+            statement.execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            if export_format == ExportFormat.CSV:
+                yield encode_csv(partition)
+            else:
+                yield encode_ndjson(row._mapping for row in partition)
@@ -0,0 +1 @@
+"""Data Importers package."""
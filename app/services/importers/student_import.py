@@ -0,0 +1,319 @@
+"""
+Bulk student import.
+Streams CSV/XLSX rows in chunks, validates them and inserts each chunk
+with a single multi-row INSERT ... ON CONFLICT DO NOTHING.
+"""
+
+import csv
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import ValidationException
+from app.core.logging import get_logger
+from app.crud.student import crud_student
+from app.models.department import Department
+from app.models.student import Student
+from app.schemas.student import StudentCreate
+from app.services.calculators.change_tracker import department_keys, mark_keys_dirty
+from app.utils.validators import (
+    validate_email,
+    validate_github_username,
+    validate_matric_number,
+)
+
+logger = get_logger(__name__)
+
+REQUIRED_COLUMNS = [
+    "matric_number",
+    "first_name",
+    "last_name",
+    "email",
+    "level",
+    "department_id",
+]
+OPTIONAL_COLUMNS = ["github_username"]
+
+# Unique columns checked for duplicates within one file
+UNIQUE_COLUMNS = ["matric_number", "email", "github_username"]
+
+SUPPORTED_FORMATS = {".csv", ".xlsx"}
+
+Row = Tuple[int, Dict[str, Any]]
+
+
+@dataclass
+class RowError:
+    """Problems found with one input row."""
+
+    row: int
+    matric_number: Optional[str]
+    errors: List[str]
+
+
+@dataclass
+class ImportReport:
+    """Outcome of a bulk import."""
+
+    total_rows: int = 0
+    imported: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    errors_truncated: bool = False
+
+
+def _normalize_header(value: Any) -> str:
+    """Map a header cell to a column name (``Matric Number`` -> ``matric_number``)."""
+    return str(value or "").strip().lower().replace(" ", "_")
+
+
+def _clean(value: Any) -> Any:
+    """Strip strings and turn blank cells into None."""
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def _rows_from_table(rows: Iterable[Iterable[Any]]) -> Iterator[Row]:
+    """
+    Turn raw table rows into (line number, record) pairs.
+
+    Args:
+        rows: Header row followed by data rows
+
+    Yields:
+        1-based line number and a dict of known columns
+
+    Raises:
+        ValidationException: If required columns are missing
+    """
+    rows = iter(rows)
+    header = [_normalize_header(cell) for cell in next(rows, ())]
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValidationException(
+            "Import file is missing required columns", {"missing_columns": missing}
+        )
+
+    positions = {
+        column: header.index(column)
+        for column in REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+        if column in header
+    }
+    for line, cells in enumerate(rows, start=2):
+        cells = list(cells)
+        record = {
+            column: _clean(cells[index]) if index < len(cells) else None
+            for column, index in positions.items()
+        }
+        if all(value is None for value in record.values()):
+            continue
+        yield line, record
+
+
+def read_csv(stream: BinaryIO) -> Iterator[Row]:
+    """Stream records from a UTF-8 CSV file."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        yield from _rows_from_table(csv.reader(text))
+    finally:
+        text.detach()
+
+
+def read_xlsx(stream: BinaryIO) -> Iterator[Row]:
+    """Stream records from the first sheet of an XLSX workbook."""
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        yield from _rows_from_table(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def read_rows(stream: BinaryIO, filename: str) -> Iterator[Row]:
+    """
+    Stream records from an upload, picking the reader by file extension.
+
+    Args:
+        stream: Binary file object
+        filename: Original file name
+
+    Returns:
+        Iterator of (line number, record) pairs
+
+    Raises:
+        ValidationException: If the file type is not supported
+    """
+    suffix = Path(filename or "").suffix.lower()
+    if suffix not in SUPPORTED_FORMATS:
+        raise ValidationException(
+            "Unsupported import file type",
+            {"filename": filename, "supported": sorted(SUPPORTED_FORMATS)},
+        )
+    return read_csv(stream) if suffix == ".csv" else read_xlsx(stream)
+
+
+class StudentImporter:
+    """Validates and bulk-inserts student records."""
+
+    def __init__(self, db: Session, chunk_size: int = 1000, max_errors: int = 1000):
+        """
+        Initialize importer.
+
+        Each chunk is committed on its own; rows that already exist are
+        skipped, so a failed import can simply be re-run.
+
+        Args:
+            db: Database session
+            chunk_size: Rows per INSERT statement
+            max_errors: Maximum number of row errors kept in the report
+        """
+        self.db = db
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+    def import_file(self, stream: BinaryIO, filename: str) -> ImportReport:
+        """Import a CSV or XLSX file; see ``run``."""
+        return self.run(read_rows(stream, filename))
+
+    def run(self, rows: Iterable[Row]) -> ImportReport:
+        """
+        Import records.
+
+        Args:
+            rows: (line number, record) pairs
+
+        Returns:
+            Import report with counts and per-row errors
+        """
+        report = ImportReport()
+        department_ids = set(self.db.scalars(select(Department.id)))
+        seen: Dict[str, set] = {column: set() for column in UNIQUE_COLUMNS}
+        chunk: List[Row] = []
+
+        for line, record in rows:
+            report.total_rows += 1
+            values, errors = self.validate(record, department_ids, seen)
+            if values is None:
+                report.failed += 1
+                self._add_error(report, line, record, errors)
+                continue
+
+            chunk.append((line, values))
+            if len(chunk) >= self.chunk_size:
+                self._insert_chunk(chunk, report)
+                chunk = []
+
+        if chunk:
+            self._insert_chunk(chunk, report)
+
+        logger.info(
+            f"Student import: {report.imported} imported, {report.skipped} skipped, "
+            f"{report.failed} failed of {report.total_rows} rows"
+        )
+        return report
+
+    def validate(
+        self,
+        record: Dict[str, Any],
+        department_ids: set,
+        seen: Dict[str, set],
+    ) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """
+        Validate one record.
+
+        Args:
+            record: Raw record
+            department_ids: IDs of existing departments
+            seen: Unique values already accepted from this file
+
+        Returns:
+            Insert values (None when invalid) and a list of error messages
+        """
+        try:
+            student = StudentCreate.model_validate(record)
+        except ValidationError as e:
+            return None, [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ]
+
+        errors = []
+        if not validate_matric_number(student.matric_number):
+            errors.append("matric_number: invalid format")
+        if not validate_email(student.email):
+            errors.append("email: invalid format")
+        if student.github_username and not validate_github_username(
+            student.github_username
+        ):
+            errors.append("github_username: invalid format")
+        if student.department_id not in department_ids:
+            errors.append(f"department_id: department {student.department_id} not found")
+
+        values = student.model_dump()
+        for column in UNIQUE_COLUMNS:
+            if values[column] is not None and values[column] in seen[column]:
+                errors.append(f"{column}: duplicate in file")
+        if errors:
+            return None, errors
+
+        for column in UNIQUE_COLUMNS:
+            if values[column] is not None:
+                seen[column].add(values[column])
+        return values, []
+
+    def _insert_chunk(self, chunk: List[Row], report: ImportReport) -> None:
+        """
+        Insert one chunk, reporting rows that clash with existing students.
+
+        The Core insert bypasses the ORM change tracking hook, so the KPI
+        keys of departments that gained students are marked dirty here, in
+        the same transaction.
+        """
+        statement = (
+            crud_student.insert_statement(self.db)
+            .on_conflict_do_nothing()
+            .returning(Student.matric_number, Student.department_id)
+        )
+        rows = self.db.execute(statement, [values for _, values in chunk]).all()
+        mark_keys_dirty(self.db, department_keys(self.db.connection(), {row[1] for row in rows}))
+        self.db.commit()
+        inserted = {row[0] for row in rows}
+
+        report.imported += len(inserted)
+        for line, values in chunk:
+            if values["matric_number"] not in inserted:
+                report.skipped += 1
+                self._add_error(
+                    report,
+                    line,
+                    values,
+                    ["Student already exists (matric number, email or GitHub username taken)"],
+                )
+
+    def _add_error(
+        self,
+        report: ImportReport,
+        line: int,
+        record: Dict[str, Any],
+        errors: List[str],
+    ) -> None:
+        """Record a row error unless the report is already full."""
+        if len(report.errors) >= self.max_errors:
+            report.errors_truncated = True
+            return
+        matric_number = record.get("matric_number")
+        report.errors.append(
+            RowError(
+                row=line,
+                matric_number=None if matric_number is None else str(matric_number),
+                errors=errors,
+            )
+        )
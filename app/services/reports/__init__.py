@@ -0,0 +1 @@
+"""KPI Reports package."""
@@ -0,0 +1,258 @@
+"""
+KPI report generation.
+A report lists the KPI snapshots of a department, optionally limited to
+one academic session. Its artifact is keyed by a hash of the rows it is
+rendered from, so regenerating a report whose snapshots have not changed
+returns the stored file instead of rendering it again.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Type, Union
+
+import orjson
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.exceptions import ResourceNotFoundException
+from app.models.department import AcademicSession, Department
+from app.models.kpi import KPISnapshot
+from app.services.reports.renderers import ExcelReportWriter, PDFReportWriter
+from app.services.reports.store import ArtifactStore
+
+# Bump when the layout changes, so artifacts of the old layout are not reused
+REPORT_VERSION = 1
+
+
+class ReportFormat(str, Enum):
+    """Supported report formats."""
+
+    XLSX = "xlsx"
+    PDF = "pdf"
+
+
+ReportWriter = Union[ExcelReportWriter, PDFReportWriter]
+
+WRITERS: Dict[ReportFormat, Type[ReportWriter]] = {
+    ReportFormat.XLSX: ExcelReportWriter,
+    ReportFormat.PDF: PDFReportWriter,
+}
+
+MEDIA_TYPES = {report_format: writer.media_type for report_format, writer in WRITERS.items()}
+
+
+@dataclass
+class ReportArtifact:
+    """A rendered (or previously rendered) report."""
+
+    key: str
+    path: Path
+    format: ReportFormat
+    cached: bool
+    # Rows rendered; None when the artifact was already stored
+    rows: Optional[int] = None
+
+
+def report_statement(department_id: int, academic_session_id: Optional[int] = None) -> Select:
+    """Select the report rows of a department, newest session first."""
+    statement = (
+        select(
+            AcademicSession.session_name,
+            AcademicSession.semester,
+            KPISnapshot.pillar_name,
+            KPISnapshot.metric_name,
+            KPISnapshot.calculated_value,
+            KPISnapshot.target_value,
+            KPISnapshot.percentage_achieved,
+            KPISnapshot.status,
+        )
+        .join(AcademicSession, KPISnapshot.academic_session_id == AcademicSession.id)
+        .where(KPISnapshot.department_id == department_id)
+        .order_by(
+            KPISnapshot.academic_session_id.desc(),
+            KPISnapshot.pillar_name,
+            KPISnapshot.metric_name,
+            KPISnapshot.id,
+        )
+    )
+    if academic_session_id is not None:
+        statement = statement.where(KPISnapshot.academic_session_id == academic_session_id)
+    return statement
+
+
+def report_meta(department: Department, session: Optional[AcademicSession] = None) -> Dict[str, Any]:
+    """Title and subtitle of a report."""
+    if session is None:
+        subtitle = "All academic sessions"
+    else:
+        subtitle = f"Academic session {session.session_name}, semester {session.semester}"
+    return {"title": f"KPI report: {department.name} ({department.code})", "subtitle": subtitle}
+
+
+class ReportHasher:
+    """
+    SHA-256 of a report's metadata and rows, fed one batch at a time.
+
+    Only the values shown in the report are hashed, not ids or
+    timestamps, so recomputed snapshots with unchanged values keep the key.
+    """
+
+    def __init__(self, meta: Dict[str, Any]):
+        """
+        Initialize hasher.
+
+        Args:
+            meta: Report title and subtitle
+        """
+        self._digest = hashlib.sha256()
+        self._digest.update(orjson.dumps({"version": REPORT_VERSION, **meta}, option=orjson.OPT_SORT_KEYS))
+        self.rows = 0
+
+    def update(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Account for a batch of report rows."""
+        for row in rows:
+            self._digest.update(b"\n" + orjson.dumps(list(row)))
+            self.rows += 1
+
+    def hexdigest(self) -> str:
+        """Key of the rows seen so far."""
+        return self._digest.hexdigest()
+
+
+def _load_meta(
+    department: Optional[Department],
+    session: Optional[AcademicSession],
+    department_id: int,
+    academic_session_id: Optional[int],
+) -> Dict[str, Any]:
+    if department is None:
+        raise ResourceNotFoundException("Department", department_id)
+    if academic_session_id is not None and session is None:
+        raise ResourceNotFoundException("AcademicSession", academic_session_id)
+    return report_meta(department, session)
+
+
+def _meta(db: Session, department_id: int, academic_session_id: Optional[int]) -> Dict[str, Any]:
+    return _load_meta(
+        db.get(Department, department_id),
+        db.get(AcademicSession, academic_session_id) if academic_session_id is not None else None,
+        department_id,
+        academic_session_id,
+    )
+
+
+def report_key(db: Session, department_id: int, academic_session_id: Optional[int] = None) -> str:
+    """
+    Hash the current data of a report without rendering it.
+
+    Args:
+        db: Database session
+        department_id: Department reported on
+        academic_session_id: Limit to one academic session
+
+    Returns:
+        Artifact key
+
+    Raises:
+        ResourceNotFoundException: If the department or session does not exist
+    """
+    meta = _meta(db, department_id, academic_session_id)
+    hasher = ReportHasher(meta)
+    result = db.execute(
+        report_statement(department_id, academic_session_id).execution_options(
+            yield_per=settings.EXPORT_BATCH_SIZE
+        )
+    )
+    for partition in result.partitions():
+        hasher.update(partition)
+    return hasher.hexdigest()
+
+
+async def areport_key(
+    db: AsyncSession, department_id: int, academic_session_id: Optional[int] = None
+) -> str:
+    """Async version of ``report_key``."""
+    meta = _load_meta(
+        await db.get(Department, department_id),
+        await db.get(AcademicSession, academic_session_id) if academic_session_id is not None else None,
+        department_id,
+        academic_session_id,
+    )
+    hasher = ReportHasher(meta)
+    result = await db.stream(
+        report_statement(department_id, academic_session_id).execution_options(
+            yield_per=settings.EXPORT_BATCH_SIZE
+        )
+    )
+    async for partition in result.partitions():
+        hasher.update(partition)
+    return hasher.hexdigest()
+
+
+def _render(
+    db: Session,
+    store: ArtifactStore,
+    department_id: int,
+    academic_session_id: Optional[int],
+    report_format: ReportFormat,
+) -> Tuple[str, Path, int]:
+    """Render a report while hashing the rows it is rendered from."""
+    meta = _meta(db, department_id, academic_session_id)
+    hasher = ReportHasher(meta)
+    with store.writer() as handle:
+        writer = WRITERS[report_format](handle, meta)
+        result = db.execute(
+            report_statement(department_id, academic_session_id).execution_options(
+                yield_per=settings.EXPORT_BATCH_SIZE
+            )
+        )
+        for partition in result.partitions():
+            hasher.update(partition)
+            writer.write_rows(partition)
+        writer.close()
+        # Keyed by the rows actually rendered, which may have changed since
+        # the caller computed its key
+        key = hasher.hexdigest()
+        return key, store.commit(handle, key, report_format.value), hasher.rows
+
+
+def generate_kpi_report(
+    db: Session,
+    department_id: int,
+    academic_session_id: Optional[int] = None,
+    report_format: ReportFormat = ReportFormat.XLSX,
+    store: Optional[ArtifactStore] = None,
+) -> ReportArtifact:
+    """
+    Return the artifact of a report, rendering it only if its data changed.
+
+    Rows are streamed in batches of ``EXPORT_BATCH_SIZE`` into the writer,
+    so memory use does not grow with the number of snapshots.
+
+    Args:
+        db: Database session
+        department_id: Department reported on
+        academic_session_id: Limit to one academic session
+        report_format: Excel or PDF
+        store: Artifact store (default: one under REPORTS_DIR)
+
+    Returns:
+        The stored artifact
+
+    Raises:
+        ResourceNotFoundException: If the department or session does not exist
+    """
+    store = store or ArtifactStore()
+    report_format = ReportFormat(report_format)
+
+    key = report_key(db, department_id, academic_session_id)
+    path = store.get(key, report_format.value)
+    if path is not None:
+        return ReportArtifact(key=key, path=path, format=report_format, cached=True)
+
+    key, path, rows = _render(db, store, department_id, academic_session_id, report_format)
+    return ReportArtifact(key=key, path=path, format=report_format, cached=False, rows=rows)
@@ -0,0 +1,161 @@
+"""
+Streaming report renderers.
+Both writers take rows in batches and write them out as they arrive:
+Excel through an openpyxl write-only workbook, PDF by drawing table pages
+directly on a reportlab canvas instead of laying out one large table.
+"""
+
+from collections import OrderedDict
+from typing import IO, Any, Dict, Iterable, List, Sequence, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.units import mm
+from reportlab.pdfgen.canvas import Canvas
+
+HEADER = ["Session", "Semester", "Pillar", "Metric", "Value", "Target", "Achieved %", "Status"]
+SUMMARY_HEADER = ["Session", "Semester", "Pillar", "Metrics", "Average achieved %", "Below target"]
+
+# Index of the percentage achieved and status in a report row
+ACHIEVED, STATUS = 6, 7
+
+
+class PillarSummary:
+    """Running per-(session, pillar) averages, small whatever the row count."""
+
+    def __init__(self) -> None:
+        self._totals: "OrderedDict[Tuple[Any, Any, Any], List[float]]" = OrderedDict()
+
+    def add(self, row: Sequence[Any]) -> None:
+        """Account for one report row."""
+        totals = self._totals.setdefault((row[0], row[1], row[2]), [0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += row[ACHIEVED]
+        totals[2] += row[STATUS] == "below"
+
+    def rows(self) -> List[List[Any]]:
+        """One summary row per (session, pillar), in first-seen order."""
+        return [
+            [*key, count, round(total / count, 2), below]
+            for key, (count, total, below) in self._totals.items()
+        ]
+
+
+class ExcelReportWriter:
+    """Writes a summary sheet and a snapshot sheet in openpyxl write-only mode."""
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def __init__(self, handle: IO[bytes], meta: Dict[str, Any]):
+        """
+        Initialize writer.
+
+        Args:
+            handle: Binary file the workbook is saved to
+            meta: ``title`` and ``subtitle`` of the report
+        """
+        self.handle = handle
+        self.summary = PillarSummary()
+        self.workbook = Workbook(write_only=True)
+        self.summary_sheet = self.workbook.create_sheet("Summary")
+        self.rows_sheet = self.workbook.create_sheet("Snapshots")
+        self.summary_sheet.append(self._bold(self.summary_sheet, [meta["title"]]))
+        self.summary_sheet.append([meta["subtitle"]])
+        self.summary_sheet.append([])
+        self.summary_sheet.append(self._bold(self.summary_sheet, SUMMARY_HEADER))
+        self.rows_sheet.append(self._bold(self.rows_sheet, HEADER))
+
+    @staticmethod
+    def _bold(sheet: Any, values: Sequence[Any]) -> List[WriteOnlyCell]:
+        cells = [WriteOnlyCell(sheet, value) for value in values]
+        for cell in cells:
+            cell.font = Font(bold=True)
+        return cells
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Append a batch of report rows."""
+        for row in rows:
+            self.rows_sheet.append(list(row))
+            self.summary.add(row)
+
+    def close(self) -> None:
+        """Write the summary and save the workbook."""
+        for row in self.summary.rows():
+            self.summary_sheet.append(row)
+        self.workbook.save(self.handle)
+
+
+class PDFReportWriter:
+    """Draws the report table page by page as rows arrive."""
+
+    media_type = "application/pdf"
+
+    PAGE_SIZE = landscape(A4)
+    MARGIN = 15 * mm
+    LINE_HEIGHT = 5.5 * mm
+    # Left edge of each column, as a fraction of the printable width
+    COLUMNS = [0.0, 0.11, 0.18, 0.34, 0.66, 0.74, 0.82, 0.91]
+    # Characters shown per column before truncation
+    WIDTHS = [14, 8, 24, 50, 10, 10, 10, 10]
+
+    def __init__(self, handle: IO[bytes], meta: Dict[str, Any]):
+        """
+        Initialize writer.
+
+        Args:
+            handle: Binary file the PDF is written to
+            meta: ``title`` and ``subtitle`` of the report
+        """
+        self.meta = meta
+        self.summary = PillarSummary()
+        # Invariant output: the same rows always produce the same bytes
+        self.canvas = Canvas(handle, pagesize=self.PAGE_SIZE, invariant=1)
+        self.canvas.setTitle(meta["title"])
+        self.width = self.PAGE_SIZE[0] - 2 * self.MARGIN
+        self.page = 0
+        self._new_page(HEADER, with_title=True)
+
+    def _new_page(self, header: Sequence[str], with_title: bool = False) -> None:
+        if self.page:
+            self._footer()
+            self.canvas.showPage()
+        self.page += 1
+        self.y = self.PAGE_SIZE[1] - self.MARGIN
+        if with_title:
+            self.canvas.setFont("Helvetica-Bold", 14)
+            self.canvas.drawString(self.MARGIN, self.y, self.meta["title"])
+            self.y -= 7 * mm
+            self.canvas.setFont("Helvetica", 10)
+            self.canvas.drawString(self.MARGIN, self.y, self.meta["subtitle"])
+            self.y -= 10 * mm
+        self.header = header
+        self._line(header, bold=True)
+
+    def _footer(self) -> None:
+        self.canvas.setFont("Helvetica", 8)
+        self.canvas.drawRightString(self.PAGE_SIZE[0] - self.MARGIN, self.MARGIN / 2, f"Page {self.page}")
+
+    def _line(self, values: Sequence[Any], bold: bool = False) -> None:
+        if self.y < self.MARGIN + self.LINE_HEIGHT:
+            self._new_page(self.header)
+        self.canvas.setFont("Helvetica-Bold" if bold else "Helvetica", 8)
+        for left, width, value in zip(self.COLUMNS, self.WIDTHS, values):
+            text = f"{value:.2f}" if isinstance(value, float) else str(value)
+            self.canvas.drawString(self.MARGIN + left * self.width, self.y, text[:width])
+        self.y -= self.LINE_HEIGHT
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Draw a batch of report rows."""
+        for row in rows:
+            self._line(row)
+            self.summary.add(row)
+
+    def close(self) -> None:
+        """Draw the summary pages and finish the document."""
+        self._new_page(SUMMARY_HEADER)
+        for row in self.summary.rows():
+            self._line(row)
+        self._footer()
+        self.canvas.save()
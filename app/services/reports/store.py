@@ -0,0 +1,90 @@
+"""
+Content-addressed report artifact store.
+Artifacts live on local disk under the hash of the data they were rendered
+from, so a report whose data has not changed is served from disk.
+"""
+
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+from app.core.config import settings
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ArtifactStore:
+    """Files keyed by a SHA-256 hex digest and extension."""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize store.
+
+        Args:
+            root: Directory holding the artifacts (default: REPORTS_DIR)
+        """
+        self.root = Path(root or settings.REPORTS_DIR)
+
+    @staticmethod
+    def is_key(key: str) -> bool:
+        """Whether ``key`` is a well-formed artifact key."""
+        return bool(_KEY.match(key))
+
+    def path(self, key: str, extension: str) -> Path:
+        """
+        Location of an artifact, fanned out by the key's first byte.
+
+        Raises:
+            ValueError: If the key is malformed
+        """
+        if not self.is_key(key):
+            raise ValueError(f"Invalid artifact key: {key!r}")
+        return self.root / key[:2] / f"{key}.{extension}"
+
+    def get(self, key: str, extension: str) -> Optional[Path]:
+        """Path of a stored artifact, or None when it does not exist."""
+        path = self.path(key, extension)
+        return path if path.is_file() else None
+
+    @contextmanager
+    def writer(self) -> Iterator[IO[bytes]]:
+        """
+        Open a temporary file in the store for an artifact being rendered.
+
+        The file is removed unless ``commit`` moved it into place.
+
+        Yields:
+            Binary file object with a ``name``
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        handle = tempfile.NamedTemporaryFile(dir=self.root, prefix=".render-", delete=False)
+        try:
+            yield handle
+        finally:
+            handle.close()
+            if os.path.exists(handle.name):
+                os.unlink(handle.name)
+
+    def commit(self, handle: IO[bytes], key: str, extension: str) -> Path:
+        """
+        Move a rendered temporary file to its key.
+
+        The rename is atomic, so readers never see a partial artifact and
+        concurrent renders of the same data simply replace each other.
+
+        Args:
+            handle: File from ``writer``
+            key: Content hash
+            extension: File extension
+
+        Returns:
+            Path of the stored artifact
+        """
+        path = self.path(key, extension)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle.close()
+        os.replace(handle.name, path)
+        return path
@@ -4,6 +4,7 @@ Defines the Celery instance and configuration.
 """
 
 from celery import Celery
+from celery.schedules import crontab
 
 from app.core.config import settings
 
@@ -12,6 +13,7 @@ celery_app = Celery(
     "kpi_system",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.tasks.kpi_tasks", "app.tasks.report_tasks"],
 )
 
 # Configure Celery
@@ -25,3 +27,22 @@ celery_app.conf.update(
     task_time_limit=30 * 60,  # 30 minutes hard limit
     task_soft_time_limit=25 * 60,  # 25 minutes soft limit
 )
+
+# Periodic tasks (run by celery beat)
+celery_app.conf.beat_schedule = {
+    "recompute-dirty-kpis": {
+        "task": "kpi.recompute_dirty",
+        "schedule": settings.KPI_DIRTY_RECOMPUTE_SECONDS,
+    },
+    # Refreshes the materialized aggregate views first and reads from them;
+    # nothing else reads the views, so they have no schedule of their own
+    "recompute-all-kpis": {
+        "task": "kpi.recompute_all",
+        "schedule": crontab(hour=settings.KPI_FULL_RECOMPUTE_HOUR, minute=0),
+        "kwargs": {"from_views": True},
+    },
+    "rollup-kpi-history": {
+        "task": "kpi.rollup_history",
+        "schedule": crontab(hour=settings.KPI_HISTORY_ROLLUP_HOUR, minute=0),
+    },
+}
@@ -0,0 +1,209 @@
+"""
+KPI background tasks.
+Periodic jobs keeping KPI aggregates and snapshots up to date, and a
+fan-out pipeline that spreads snapshot recomputation across workers.
+"""
+
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from celery import chord
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.crud.kpi import crud_kpi_history
+from app.db.materialized_views import AGGREGATE_VIEWS, refresh_materialized_views
+from app.db.session import SessionLocal, engine
+from app.services.calculators.batch_engine import BatchKPIEngine
+from app.tasks.celery_app import celery_app
+
+logger = get_logger(__name__)
+
+
+def batch_keys(keys: Sequence[Sequence[Any]], size: int) -> List[List[List[Any]]]:
+    """
+    Split keys into subtask batches.
+
+    Keys come grouped by (department, session), so a batch of the four
+    pillars of one pair shares a single aggregate load.
+
+    Args:
+        keys: (department_id, academic_session_id, pillar_name) keys
+        size: Keys per batch
+
+    Returns:
+        JSON-serializable batches of keys
+    """
+    size = max(size, 1)
+    rows = [list(key) for key in keys]
+    return [rows[start:start + size] for start in range(0, len(rows), size)]
+
+
+@celery_app.task(name="kpi.compute_keys")
+def compute_kpi_keys(keys: List[List[Any]], use_views: bool = False) -> List[Dict[str, Any]]:
+    """
+    Compute the snapshots of some (department, session, pillar) keys.
+
+    Args:
+        keys: (department_id, academic_session_id, pillar_name) keys
+        use_views: Read aggregates from the materialized views
+
+    Returns:
+        Snapshot records, as produced by ``BatchKPIEngine.to_records``
+    """
+    db = SessionLocal()
+    try:
+        kpi_engine = BatchKPIEngine(db)
+        frame = kpi_engine.calculate_keys((tuple(key) for key in keys), use_views=use_views)
+        return kpi_engine.to_records(frame)
+    finally:
+        db.close()
+
+
+@celery_app.task(name="kpi.write_snapshots")
+def write_kpi_snapshots(
+    results: List[List[Dict[str, Any]]], dispatched_at: Optional[str] = None
+) -> int:
+    """
+    Chord callback: replace the snapshots of every computed key at once.
+
+    Snapshots written after the pipeline was dispatched (e.g. by
+    ``recompute_dirty`` while the subtasks ran) are newer than the results
+    and are kept.
+
+    Args:
+        results: Records returned by each ``compute_kpi_keys`` subtask
+        dispatched_at: ISO database time the pipeline read its data from
+
+    Returns:
+        Number of snapshot rows written
+    """
+    records = list(chain.from_iterable(results))
+    computed_at = datetime.fromisoformat(dispatched_at) if dispatched_at else None
+    db = SessionLocal()
+    try:
+        written = BatchKPIEngine(db).persist_records(records, computed_at=computed_at)
+        logger.info(f"KPI pipeline wrote {written} snapshot rows")
+        return written
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="kpi.recompute_all")
+def recompute_all_kpis(
+    department_ids: Optional[Iterable[int]] = None,
+    session_ids: Optional[Iterable[int]] = None,
+    pillars: Optional[Iterable[str]] = None,
+    keys_per_task: Optional[int] = None,
+    from_views: bool = False,
+) -> Optional[str]:
+    """
+    Fan KPI recomputation out over the workers.
+
+    Every (department, session, pillar) key in scope is computed by a
+    ``compute_kpi_keys`` subtask; a chord callback bulk-writes the results.
+
+    Args:
+        department_ids: Restrict to these departments (default: all)
+        session_ids: Restrict to these academic sessions (default: all)
+        pillars: Restrict to these pillars (default: all)
+        keys_per_task: Keys per subtask (default: KPI_PIPELINE_KEYS_PER_TASK)
+        from_views: Refresh the materialized aggregate views, then have the
+            subtasks read them instead of the source tables (PostgreSQL)
+
+    Returns:
+        ID of the chord callback result, or None when there is nothing to do
+    """
+    if from_views and engine.dialect.name != "postgresql":
+        logger.warning("Materialized views need PostgreSQL; reading the source tables")
+        from_views = False
+    db = SessionLocal()
+    try:
+        # Database time, comparable with the snapshots' updated_at; taken
+        # before the views are refreshed and the subtasks read any data
+        dispatched_at = db.execute(select(func.now())).scalar_one()
+        keys = BatchKPIEngine(db).keys(department_ids, session_ids, pillars)
+    finally:
+        db.close()
+
+    batches = batch_keys(keys, keys_per_task or settings.KPI_PIPELINE_KEYS_PER_TASK)
+    if not batches:
+        return None
+    if from_views:
+        refresh_aggregate_views()
+
+    result = chord([compute_kpi_keys.s(batch, use_views=from_views) for batch in batches])(
+        write_kpi_snapshots.s(dispatched_at=dispatched_at.isoformat())
+    )
+    logger.info(f"KPI pipeline dispatched {len(keys)} keys in {len(batches)} subtasks")
+    task_id: str = result.id
+    return task_id
+
+
+@celery_app.task(name="kpi.recompute_dirty")
+def recompute_dirty_kpis(limit: Optional[int] = None) -> int:
+    """
+    Recompute the snapshots whose keys were marked dirty.
+
+    Args:
+        limit: Maximum number of dirty markers to process
+
+    Returns:
+        Number of snapshot rows written
+    """
+    db = SessionLocal()
+    try:
+        return BatchKPIEngine(db).recompute_dirty(limit=limit)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="kpi.rollup_history")
+def rollup_kpi_history(raw_days: Optional[int] = None) -> int:
+    """
+    Roll snapshot history older than the raw retention into daily and
+    session summaries.
+
+    Args:
+        raw_days: Whole days of raw history kept (default: KPI_HISTORY_RAW_DAYS)
+
+    Returns:
+        Number of history rows rolled up
+    """
+    days = settings.KPI_HISTORY_RAW_DAYS if raw_days is None else raw_days
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    db = SessionLocal()
+    try:
+        rolled = crud_kpi_history.rollup(db, before=today - timedelta(days=days))
+        logger.info(f"Rolled up {rolled} KPI history rows")
+        return rolled
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="kpi.refresh_aggregate_views")
+def refresh_aggregate_views(concurrently: bool = True) -> int:
+    """
+    Refresh the materialized KPI aggregate views.
+
+    Args:
+        concurrently: Refresh without blocking readers
+
+    Returns:
+        Number of views refreshed
+    """
+    with engine.connect() as connection:
+        refresh_materialized_views(connection, concurrently=concurrently)
+    logger.info(f"Refreshed {len(AGGREGATE_VIEWS)} KPI aggregate views")
+    return len(AGGREGATE_VIEWS)
@@ -0,0 +1,42 @@
+"""
+Report background tasks.
+Renders KPI reports on the workers; artifacts whose data has not changed
+are returned from the store without rendering.
+"""
+
+from typing import Any, Dict, Optional
+
+from app.core.logging import get_logger
+from app.db.session import SessionLocal
+from app.services.reports.kpi_report import ReportFormat, generate_kpi_report
+from app.tasks.celery_app import celery_app
+
+logger = get_logger(__name__)
+
+
+@celery_app.task(name="reports.generate_kpi_report")
+def generate_kpi_report_task(
+    department_id: int,
+    academic_session_id: Optional[int] = None,
+    report_format: str = ReportFormat.XLSX.value,
+) -> Dict[str, Any]:
+    """
+    Render (or find) the KPI report of a department.
+
+    Args:
+        department_id: Department reported on
+        academic_session_id: Limit to one academic session
+        report_format: ``xlsx`` or ``pdf``
+
+    Returns:
+        Key, format and whether the artifact was already stored
+    """
+    db = SessionLocal()
+    try:
+        artifact = generate_kpi_report(db, department_id, academic_session_id, ReportFormat(report_format))
+    finally:
+        db.close()
+
+    if not artifact.cached:
+        logger.info(f"Rendered {artifact.format.value} KPI report {artifact.key} ({artifact.rows} rows)")
+    return {"key": artifact.key, "format": artifact.format.value, "cached": artifact.cached}
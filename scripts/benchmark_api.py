@@ -0,0 +1,409 @@
+"""
+API latency benchmark.
+Seeds a configurable dataset, drives the student and auth endpoints at a
+given concurrency through an in-process ASGI client, and reports latency
+percentiles and throughput per scenario. Results can be saved as a JSON
+baseline and compared against a previous one.
+
+Run against a dedicated benchmark database: the scenarios create, update
+and delete rows.
+
+Usage:
+    python scripts/benchmark_api.py --students 10000 --output baseline.json
+    python scripts/benchmark_api.py --database-url sqlite:///bench.db --students 1000
+    python scripts/benchmark_api.py --compare baseline.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import hash_password
+from app.crud.pagination import encode_cursor
+from app.db.base import Base
+from app.db.session import get_async_db, get_async_session_factory, get_db
+from app.main import app
+from app.models import Department, Student, User
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+# One log line per request would dominate the timings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+API = settings.API_V1_PREFIX
+PASSWORD = "benchmark-password"
+SEED_CHUNK_SIZE = 10_000
+PAGE_SIZE = 50
+
+
+@dataclass
+class BenchmarkContext:
+    """Dataset facts shared by the scenarios."""
+
+    total_students: int
+    student_ids: List[int]
+    department_ids: List[int]
+    user_emails: List[str]
+    deep_skip: int
+    deep_cursor: Optional[str]
+    run_id: str = field(default_factory=lambda: f"{int(time.time()) % 10**6:06d}")
+    created_ids: List[int] = field(default_factory=list)
+
+
+Request = Callable[[httpx.AsyncClient, BenchmarkContext, int], Awaitable[httpx.Response]]
+
+
+def _student_payload(ctx: BenchmarkContext, i: int) -> Dict[str, Any]:
+    return {
+        "matric_number": f"BEN/{ctx.run_id}/{i:07d}",
+        "first_name": "Bench",
+        "last_name": "Student",
+        "email": f"bench-{ctx.run_id}-{i}@example.com",
+        "level": 100 * (1 + i % 4),
+        "department_id": ctx.department_ids[i % len(ctx.department_ids)],
+    }
+
+
+async def create_student(client, ctx, i):
+    response = await client.post(f"{API}/students", json=_student_payload(ctx, i))
+    if response.status_code == 201:
+        ctx.created_ids.append(response.json()["id"])
+    return response
+
+
+async def get_student(client, ctx, i):
+    return await client.get(f"{API}/students/{random.choice(ctx.student_ids)}")
+
+
+async def list_students(client, ctx, i):
+    return await client.get(f"{API}/students", params={"limit": PAGE_SIZE})
+
+
+async def list_by_department(client, ctx, i):
+    params = {"limit": PAGE_SIZE, "department_id": random.choice(ctx.department_ids)}
+    return await client.get(f"{API}/students", params=params)
+
+
+async def list_deep_offset(client, ctx, i):
+    params = {"limit": PAGE_SIZE, "skip": ctx.deep_skip, "count": "none"}
+    return await client.get(f"{API}/students", params=params)
+
+
+async def list_deep_cursor(client, ctx, i):
+    params = {"limit": PAGE_SIZE, "count": "none"}
+    if ctx.deep_cursor:
+        params["cursor"] = ctx.deep_cursor
+    return await client.get(f"{API}/students", params=params)
+
+
+async def update_student(client, ctx, i):
+    payload = {"level": 100 * (1 + i % 4)}
+    return await client.put(f"{API}/students/{random.choice(ctx.student_ids)}", json=payload)
+
+
+async def delete_student(client, ctx, i):
+    if not ctx.created_ids:
+        return await client.delete(f"{API}/students/0")
+    return await client.delete(f"{API}/students/{ctx.created_ids.pop()}")
+
+
+async def register(client, ctx, i):
+    payload = {
+        "email": f"register-{ctx.run_id}-{i}@example.com",
+        "username": f"register_{ctx.run_id}_{i}",
+        "password": PASSWORD,
+        "full_name": "Bench User",
+    }
+    return await client.post(f"{API}/auth/register", json=payload)
+
+
+async def login(client, ctx, i):
+    payload = {"email": ctx.user_emails[i % len(ctx.user_emails)], "password": PASSWORD}
+    return await client.post(f"{API}/auth/login", json=payload)
+
+
+# Scenario order matters: delete removes students created by create
+REQUESTS: Dict[str, Request] = {
+    "students.create": create_student,
+    "students.get": get_student,
+    "students.list": list_students,
+    "students.list_by_department": list_by_department,
+    "students.list_deep_offset": list_deep_offset,
+    "students.list_deep_cursor": list_deep_cursor,
+    "students.update": update_student,
+    "students.delete": delete_student,
+    "auth.register": register,
+    "auth.login": login,
+}
+SCENARIOS = list(REQUESTS)
+
+
+def async_url(url: str) -> str:
+    """Async driver URL for a sync database URL."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:"):
+        return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    return url
+
+
+def use_database(url: str) -> Engine:
+    """Point the app's session dependencies at ``url``."""
+    engine = create_engine(url)
+    async_engine = create_async_engine(async_url(url))
+    factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_async_db():
+        async with factory() as db:
+            yield db
+
+    def override_db():
+        with Session(engine) as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_async_db
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_async_session_factory] = lambda: factory
+    return engine
+
+
+def seed(engine: Engine, students: int, departments: int, users: int) -> None:
+    """Top the dataset up to the requested sizes."""
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        existing = conn.scalar(select(func.count()).select_from(Department))
+        if existing < departments:
+            conn.execute(
+                insert(Department),
+                [
+                    {"name": f"Benchmark Department {i}", "code": f"BD{i:03d}", "faculty": "Benchmark"}
+                    for i in range(existing, departments)
+                ],
+            )
+        department_ids = list(conn.scalars(select(Department.id).order_by(Department.id)))
+
+        existing = conn.scalar(select(func.count()).select_from(User))
+        if existing < users:
+            hashed = hash_password(PASSWORD)
+            conn.execute(
+                insert(User),
+                [
+                    {
+                        "email": f"bench{i}@example.com",
+                        "username": f"bench{i}",
+                        "hashed_password": hashed,
+                        "full_name": "Bench User",
+                    }
+                    for i in range(existing, users)
+                ],
+            )
+
+    with engine.connect() as conn:
+        existing = conn.scalar(select(func.count()).select_from(Student))
+    if existing >= students:
+        logger.info(f"Dataset already has {existing} students")
+        return
+
+    logger.info(f"Seeding {students - existing} students...")
+    started = time.perf_counter()
+    for start in range(existing, students, SEED_CHUNK_SIZE):
+        rows = [
+            {
+                "matric_number": f"SEED/{i:08d}",
+                "first_name": "Seed",
+                "last_name": f"Student{i}",
+                "email": f"seed{i}@example.com",
+                "level": 100 * (1 + i % 4),
+                "department_id": department_ids[i % len(department_ids)],
+            }
+            for i in range(start, min(start + SEED_CHUNK_SIZE, students))
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(Student), rows)
+    logger.info(f"Seeded students in {time.perf_counter() - started:.1f}s")
+
+
+def load_context(engine: Engine, sample: int = 10_000) -> BenchmarkContext:
+    """Sample ids and build the deep-pagination positions."""
+    with engine.connect() as conn:
+        total = conn.scalar(select(func.count()).select_from(Student))
+        department_ids = list(conn.scalars(select(Department.id)))
+        student_ids = list(
+            conn.scalars(select(Student.id).order_by(func.random()).limit(sample))
+        )
+        user_emails = list(
+            conn.scalars(select(User.email).where(User.email.like("bench%@example.com")).limit(100))
+        )
+        deep_skip = max(total - total // 10 - PAGE_SIZE, 0)
+        row = conn.execute(
+            select(Student.department_id, Student.id)
+            .order_by(Student.department_id, Student.id)
+            .offset(deep_skip)
+            .limit(1)
+        ).first()
+
+    return BenchmarkContext(
+        total_students=total,
+        student_ids=student_ids,
+        department_ids=department_ids,
+        user_emails=user_emails,
+        deep_skip=deep_skip,
+        deep_cursor=encode_cursor(list(row)) if row else None,
+    )
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: BenchmarkContext,
+    request: Request,
+    requests: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """Issue ``requests`` requests from ``concurrency`` workers."""
+    latencies: List[float] = []
+    errors = 0
+    counter = itertools.count()
+
+    async def worker() -> None:
+        nonlocal errors
+        while (i := next(counter)) < requests:
+            started = time.perf_counter()
+            response = await request(client, ctx, i)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, errors, elapsed)
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    """Latency percentiles (ms) and throughput of one scenario."""
+    ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if len(ms) else (0.0, 0.0, 0.0)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": float(ms.mean()) if len(ms) else 0.0,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(ms.max()) if len(ms) else 0.0,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], max_regression: float) -> bool:
+    """
+    Log p95 and throughput changes against a baseline.
+
+    Returns:
+        True if no scenario's p95 grew by more than ``max_regression``
+    """
+    ok = True
+    for name, current in results.items():
+        previous = baseline["results"].get(name)
+        if not previous or not previous["p95_ms"]:
+            continue
+        change = current["p95_ms"] / previous["p95_ms"] - 1
+        regressed = change > max_regression
+        ok = ok and not regressed
+        logger.info(
+            f"{name:30s} p95 {previous['p95_ms']:8.2f} -> {current['p95_ms']:8.2f} ms ({change:+.0%})  "
+            f"rps {previous['rps']:8.1f} -> {current['rps']:8.1f}{'  REGRESSED' if regressed else ''}"
+        )
+    return ok
+
+
+def git_commit() -> Optional[str]:
+    """Current commit, recorded with the baseline."""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Seed, run every selected scenario and collect the results."""
+    engine = use_database(args.database_url)
+    if not args.skip_seed:
+        seed(engine, args.students, args.departments, args.users)
+    ctx = load_context(engine)
+    random.seed(args.seed)
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for name in args.scenarios:
+            requests = args.auth_requests if name.startswith("auth.") else args.requests
+            logger.info(f"Running {name}: {requests} requests, concurrency {args.concurrency}")
+            results[name] = await run_scenario(client, ctx, REQUESTS[name], requests, args.concurrency)
+            r = results[name]
+            logger.info(
+                f"  p50 {r['p50_ms']:.2f} ms  p95 {r['p95_ms']:.2f} ms  p99 {r['p99_ms']:.2f} ms  "
+                f"{r['rps']:.1f} req/s  {r['errors']} errors"
+            )
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": engine.dialect.name,
+            "students": ctx.total_students,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="Benchmark database")
+    parser.add_argument("--students", type=int, default=1000, help="Students to seed (1k to 1M)")
+    parser.add_argument("--departments", type=int, default=10, help="Departments to seed")
+    parser.add_argument("--users", type=int, default=100, help="Login users to seed")
+    parser.add_argument("--skip-seed", action="store_true", help="Use the existing dataset")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per student scenario")
+    parser.add_argument("--auth-requests", type=int, default=200, help="Requests per auth scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for request targets")
+    parser.add_argument("--output", default=None, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed p95 growth")
+    args = parser.parse_args()
+
+    report = asyncio.run(benchmark(args))
+
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2)
+        logger.info(f"Baseline written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(report["results"], baseline, args.max_regression):
+            sys.exit(1)
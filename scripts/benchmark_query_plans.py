@@ -0,0 +1,147 @@
+"""
+Query plan benchmark for KPI aggregation indexes.
+Runs EXPLAIN ANALYZE on the batch engine's source queries with the
+aggregation indexes dropped (inside a rolled-back transaction) and with
+them in place, and reports the scan types and execution times.
+
+Dropping the indexes locks the tables until the rollback, so run this
+against a staging or benchmark database, not production.
+
+Usage:
+    python scripts/benchmark_query_plans.py
+    python scripts/benchmark_query_plans.py --departments 5 --sessions 2 --output plans.json
+"""
+
+import argparse
+import json
+import logging
+from typing import Any, Dict, List
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.department import AcademicSession, Department
+from app.services.calculators.batch_engine import BatchKPIEngine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Indexes added by migration b7d2c41e9f03
+AGGREGATION_INDEXES = [
+    "ix_students_department_id_id",
+    "ix_courses_department_id",
+    "ix_student_feedback_course_id_academic_session_id",
+    "ix_internship_records_student_id_academic_session_id",
+    "ix_student_projects_student_id_academic_session_id",
+    "ix_events_academic_session_id",
+    "ix_event_participants_event_id_student_id",
+    "ix_event_participants_student_id",
+    "ix_kpi_snapshots_key",
+]
+
+AGGREGATION_TABLES = [
+    "students",
+    "courses",
+    "student_feedback",
+    "internship_records",
+    "student_projects",
+    "events",
+    "event_participants",
+    "kpi_snapshots",
+]
+
+
+def scan_nodes(plan: Dict[str, Any]) -> List[str]:
+    """List the scan nodes of a JSON plan tree, e.g. ``Index Scan on students``."""
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        target = plan.get("Index Name") or plan.get("Relation Name")
+        nodes.append(f"{plan['Node Type']} on {target}")
+    for child in plan.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def explain(db: Session, statements: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """EXPLAIN ANALYZE every statement."""
+    dialect = db.get_bind().dialect
+    results = {}
+    for name, statement in statements.items():
+        sql = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        plan = db.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        results[name] = {
+            "execution_ms": plan[0]["Execution Time"],
+            "scans": scan_nodes(plan[0]["Plan"]),
+        }
+    return results
+
+
+def benchmark_query_plans(departments: int, sessions: int, output: str | None = None) -> None:
+    """Compare aggregation plans without and with the indexes."""
+    db = SessionLocal()
+
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            raise RuntimeError("Query plan benchmark requires PostgreSQL")
+
+        department_ids = list(db.scalars(select(Department.id).order_by(Department.id).limit(departments)))
+        session_ids = list(
+            db.scalars(select(AcademicSession.id).order_by(AcademicSession.id.desc()).limit(sessions))
+        )
+        statements = BatchKPIEngine(db).source_statements(department_ids, session_ids)
+
+        for table in AGGREGATION_TABLES:
+            db.execute(text(f"ANALYZE {table}"))
+        db.commit()
+
+        logger.info("Explaining aggregation queries without indexes...")
+        for index in AGGREGATION_INDEXES:
+            db.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        without = explain(db, statements)
+        db.rollback()
+
+        logger.info("Explaining aggregation queries with indexes...")
+        with_indexes = explain(db, statements)
+        db.rollback()
+
+        for name in statements:
+            before, after = without[name], with_indexes[name]
+            logger.info(
+                f"{name}: {before['execution_ms']:.2f} ms -> {after['execution_ms']:.2f} ms\n"
+                f"  without: {', '.join(before['scans'])}\n"
+                f"  with:    {', '.join(after['scans'])}"
+            )
+
+        if output:
+            with open(output, "w") as out:
+                json.dump(
+                    {
+                        "department_ids": department_ids,
+                        "session_ids": session_ids,
+                        "without_indexes": without,
+                        "with_indexes": with_indexes,
+                    },
+                    out,
+                    indent=2,
+                )
+            logger.info(f"Plans written to {output}")
+
+    except Exception as e:
+        logger.error(f"Error benchmarking query plans: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--departments", type=int, default=1, help="Departments to aggregate")
+    parser.add_argument("--sessions", type=int, default=1, help="Latest sessions to aggregate")
+    parser.add_argument("--output", default=None, help="Write plans as JSON")
+    args = parser.parse_args()
+
+    benchmark_query_plans(args.departments, args.sessions, args.output)
@@ -0,0 +1,147 @@
+"""
+Student list serialization benchmark.
+Compares building a page of the student listing the generic way (ORM
+instances validated through the response model, encoded with stdlib
+json) with the fast path (plain column rows validated and dumped to
+JSON bytes by a TypeAdapter). Reports wall and CPU time per page, split
+into the query and the serialization.
+
+Usage:
+    python scripts/benchmark_serialization.py --database-url sqlite:///bench.db --students 20000
+    python scripts/benchmark_serialization.py --page-sizes 10 100 1000 --repeat 200
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.api.v1.endpoints.students import STUDENT_COLUMNS
+from app.core.config import settings
+from app.crud.student import crud_student
+from app.models import Student
+from app.schemas.student import student_page_adapter
+from scripts.generate_data import Scale, generate
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _payload(page: Any, limit: int) -> Dict[str, Any]:
+    return {
+        "total": page.total,
+        "total_is_estimate": page.total_is_estimate,
+        "skip": 0,
+        "limit": limit,
+        "next_cursor": page.next_cursor,
+        "items": page.items,
+    }
+
+
+def generic_path(db: Session, limit: int) -> Tuple[Any, Callable[[], bytes]]:
+    """ORM page, then response-model validation and stdlib encoding as FastAPI does."""
+    page = crud_student.get_page(db, limit=limit)
+
+    def serialize() -> bytes:
+        model = student_page_adapter.validate_python(_payload(page, limit), from_attributes=True)
+        content = student_page_adapter.dump_python(model, mode="json")
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+    return page, serialize
+
+
+def fast_path(db: Session, limit: int) -> Tuple[Any, Callable[[], bytes]]:
+    """Column rows, then TypeAdapter validation and dump straight to JSON bytes."""
+    page = crud_student.get_page_rows(db, STUDENT_COLUMNS, limit=limit)
+
+    def serialize() -> bytes:
+        return student_page_adapter.dump_json(student_page_adapter.validate_python(_payload(page, limit)))
+
+    return page, serialize
+
+
+PATHS = {"generic": generic_path, "fast": fast_path}
+
+
+def measure(db: Session, path: Callable, limit: int, repeat: int) -> Dict[str, float]:
+    """Average per-page wall and CPU milliseconds of the query and serialization."""
+    totals = dict.fromkeys(("query_ms", "serialize_ms", "serialize_cpu_ms"), 0.0)
+    size = 0
+    for _ in range(repeat):
+        # Fresh identity map, so ORM instances are built every time
+        db.expunge_all()
+        started = time.perf_counter()
+        _, serialize = path(db, limit)
+        queried = time.perf_counter()
+        cpu = time.process_time()
+        body = serialize()
+        totals["serialize_cpu_ms"] += (time.process_time() - cpu) * 1000
+        totals["serialize_ms"] += (time.perf_counter() - queried) * 1000
+        totals["query_ms"] += (queried - started) * 1000
+        size = len(body)
+    results = {name: value / repeat for name, value in totals.items()}
+    results["bytes"] = size
+    return results
+
+
+def ensure_students(url: str, students: int) -> None:
+    """Generate a student dataset unless the database already has one."""
+    engine = create_engine(url)
+    with Session(engine) as db:
+        existing = db.scalar(select(Student.id).limit(1))
+    engine.dispose()
+    if existing is None:
+        generate(
+            url,
+            Scale(
+                departments=10,
+                sessions=1,
+                lecturers_per_department=0,
+                courses_per_department=0,
+                students=students,
+                feedback=0,
+                internships=0,
+                projects=0,
+                events_per_session=0,
+                participants=0,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="Benchmark database")
+    parser.add_argument("--students", type=int, default=20_000, help="Students to generate if empty")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000], help="Page sizes")
+    parser.add_argument("--repeat", type=int, default=100, help="Pages built per measurement")
+    args = parser.parse_args()
+
+    ensure_students(args.database_url, args.students)
+    engine = create_engine(args.database_url)
+    try:
+        with Session(engine) as db:
+            for limit in args.page_sizes:
+                # Both paths must render the same document
+                generic = json.loads(generic_path(db, limit)[1]())
+                fast = json.loads(fast_path(db, limit)[1]())
+                if generic != fast:
+                    raise RuntimeError(f"Paths disagree at page size {limit}")
+
+                results = {name: measure(db, path, limit, args.repeat) for name, path in PATHS.items()}
+                for name, result in results.items():
+                    logger.info(
+                        f"limit={limit:<5} {name:<8} query {result['query_ms']:7.2f} ms  "
+                        f"serialize {result['serialize_ms']:7.2f} ms "
+                        f"(cpu {result['serialize_cpu_ms']:7.2f} ms)  {result['bytes']:,} bytes"
+                    )
+                speedup = (
+                    (results["generic"]["query_ms"] + results["generic"]["serialize_ms"])
+                    / (results["fast"]["query_ms"] + results["fast"]["serialize_ms"])
+                )
+                logger.info(f"limit={limit:<5} fast path is {speedup:.1f}x faster end to end")
+    finally:
+        engine.dispose()
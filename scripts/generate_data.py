@@ -0,0 +1,499 @@
+"""
+Synthetic data generator.
+Generates a referentially consistent dataset of any size (departments,
+sessions, lecturers, courses, students, feedback, internships, projects,
+events and participants) from a deterministic seed, and loads it with
+PostgreSQL COPY in parallel chunks.
+
+Ids are assigned by the generator, so target tables must be empty (pass
+--truncate to empty them first). Every chunk draws from its own random
+stream keyed by (seed, table, chunk start), so the same seed yields the
+same data whatever the worker count.
+
+Usage:
+    python scripts/generate_data.py --students 100000
+    python scripts/generate_data.py --students 1000000 --feedback 10000000 --workers 8 --truncate
+    python scripts/generate_data.py --database-url sqlite:///dev.db --students 2000
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import JSON, create_engine, text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+import app.models  # noqa: F401  (registers the tables)
+from app.db.base import Base
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FIRST_NAMES = np.array(
+    ["Adaeze", "Bola", "Chinedu", "Damilola", "Emeka", "Fatima", "Gbenga", "Halima",
+     "Ifeoma", "Jide", "Kemi", "Lanre", "Musa", "Ngozi", "Obinna", "Sade", "Tunde",
+     "Uche", "Yusuf", "Zainab"]
+)
+LAST_NAMES = np.array(
+    ["Abubakar", "Adeyemi", "Bello", "Chukwu", "Eze", "Hassan", "Ibrahim", "Nwosu",
+     "Ogunleye", "Okafor", "Okonkwo", "Olawale", "Onyeka", "Sani", "Usman", "Yakubu"]
+)
+COMPANIES = np.array(
+    ["Andela", "Flutterwave", "Interswitch", "Paystack", "MTN", "Konga", "Jumia",
+     "Microsoft ADC", "Google", "Moniepoint", "Kuda", "Opay"]
+)
+CITIES = np.array(["Lagos", "Abuja", "Ibadan", "Kano", "Port Harcourt", "Enugu"])
+INTERNSHIP_TYPES = np.array(["Internship", "SIWES", "Co-op"])
+EVENT_TYPES = np.array(["workshop", "hackathon", "seminar", "guest_session"])
+TOOLS = np.array(
+    ['["Python", "Git"]', '["Java", "UML"]', '["JavaScript", "React"]',
+     '["Go", "Docker"]', '["C++"]', '["SQL", "PostgreSQL"]']
+)
+
+# Load order; children reference the ids of earlier tables
+TABLES = [
+    "departments",
+    "academic_sessions",
+    "lecturers",
+    "courses",
+    "students",
+    "student_feedback",
+    "internship_records",
+    "student_projects",
+    "events",
+    "event_participants",
+]
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Row counts of a generated dataset."""
+
+    departments: int = 10
+    sessions: int = 6
+    lecturers_per_department: int = 15
+    courses_per_department: int = 40
+    students: int = 10_000
+    feedback: int = 100_000
+    internships: int = 5_000
+    projects: int = 10_000
+    events_per_session: int = 50
+    participants: int = 30_000
+
+    @classmethod
+    def for_students(cls, students: int, **overrides: Optional[int]) -> "Scale":
+        """Scale child tables in proportion to the student count."""
+        counts = {
+            "students": students,
+            "feedback": students * 10,
+            "internships": students // 2,
+            "projects": students,
+            "participants": students * 3,
+        }
+        counts.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**counts)
+
+    def rows(self, table: str) -> int:
+        """Number of rows generated for ``table``."""
+        return {
+            "departments": self.departments,
+            "academic_sessions": self.sessions,
+            "lecturers": self.departments * self.lecturers_per_department,
+            "courses": self.departments * self.courses_per_department,
+            "students": self.students,
+            "student_feedback": self.feedback,
+            "internship_records": self.internships,
+            "student_projects": self.projects,
+            "events": self.sessions * self.events_per_session,
+            "event_participants": self.participants,
+        }[table]
+
+
+def chunk_rng(seed: int, table: str, start: int) -> np.random.Generator:
+    """Independent random stream of one chunk."""
+    return np.random.default_rng([seed, TABLES.index(table), start])
+
+
+def table_rng(seed: int, table: str) -> np.random.Generator:
+    """Random stream of per-table facts shared by every chunk."""
+    return np.random.default_rng([seed, TABLES.index(table)])
+
+
+@lru_cache(maxsize=4)
+def student_departments(seed: int, scale: Scale) -> np.ndarray:
+    """Department id of every student (index = student id - 1)."""
+    rng = table_rng(seed, "students")
+    return rng.integers(1, scale.departments + 1, size=scale.students, dtype=np.int32)
+
+
+def session_starts(scale: Scale) -> np.ndarray:
+    """Start date of every session: two semesters per year from 2020/2021."""
+    k = np.arange(scale.sessions)
+    years = 2020 + k // 2
+    months = np.where(k % 2 == 0, 9, 3)
+    years = years + (months == 3)
+    return np.array([f"{y}-{m:02d}-01" for y, m in zip(years, months)], dtype="datetime64[D]")
+
+
+@lru_cache(maxsize=4)
+def event_dates(seed: int, scale: Scale) -> np.ndarray:
+    """Date of every event (index = event id - 1)."""
+    rng = table_rng(seed, "events")
+    sessions = np.arange(scale.rows("events")) // scale.events_per_session
+    return session_starts(scale)[sessions] + rng.integers(0, 150, size=sessions.size)
+
+
+def _dates(values: np.ndarray) -> np.ndarray:
+    return np.datetime_as_string(values, unit="D")
+
+
+def departments(rng, ids, scale, seed):
+    return pd.DataFrame({
+        "id": ids,
+        "name": [f"Department {i}" for i in ids],
+        "code": [f"D{i:03d}" for i in ids],
+        "faculty": [f"Faculty {1 + (i - 1) // 5}" for i in ids],
+        "head_of_department": [f"Prof. {LAST_NAMES[i % LAST_NAMES.size]}" for i in ids],
+    })
+
+
+def academic_sessions(rng, ids, scale, seed):
+    starts = session_starts(scale)[ids - 1]
+    years = 2020 + (ids - 1) // 2
+    return pd.DataFrame({
+        "id": ids,
+        "session_name": [f"{y}/{y + 1} S{1 + (i - 1) % 2}" for y, i in zip(years, ids)],
+        "start_date": _dates(starts),
+        "end_date": _dates(starts + 180),
+        "semester": 1 + (ids - 1) % 2,
+        "is_active": (ids == scale.sessions).astype(int),
+    })
+
+
+def lecturers(rng, ids, scale, seed):
+    return pd.DataFrame({
+        "id": ids,
+        "name": "Dr. " + rng.choice(FIRST_NAMES, ids.size) + " " + rng.choice(LAST_NAMES, ids.size),
+        "email": [f"lecturer{i}@university.edu" for i in ids],
+        "department_id": 1 + (ids - 1) // scale.lecturers_per_department,
+        "uses_lms": rng.random(ids.size) < 0.7,
+        "training_sessions_attended": rng.poisson(3, ids.size),
+        "is_active": rng.random(ids.size) < 0.95,
+    })
+
+
+def courses(rng, ids, scale, seed):
+    department_ids = 1 + (ids - 1) // scale.courses_per_department
+    practical = rng.random(ids.size) < 0.6
+    return pd.DataFrame({
+        "id": ids,
+        "course_code": [f"D{d:03d}-{100 + i}" for d, i in zip(department_ids, ids)],
+        "course_title": [f"Course {i}" for i in ids],
+        "department_id": department_ids,
+        "lecturer_id": (department_ids - 1) * scale.lecturers_per_department
+        + rng.integers(1, scale.lecturers_per_department + 1, ids.size),
+        "credits": rng.integers(2, 5, ids.size),
+        "has_practical_project": practical,
+        "practical_sessions_count": np.where(practical, rng.integers(5, 20, ids.size), 0),
+        "theoretical_sessions_count": rng.integers(15, 35, ids.size),
+        "tools_used": rng.choice(TOOLS, ids.size),
+    })
+
+
+def students(rng, ids, scale, seed):
+    department_ids = student_departments(seed, scale)[ids - 1]
+    github = rng.random(ids.size) < 0.4
+    return pd.DataFrame({
+        "id": ids,
+        "matric_number": [f"D{d:03d}/{2020 + i % 4}/{i:07d}" for d, i in zip(department_ids, ids)],
+        "first_name": rng.choice(FIRST_NAMES, ids.size),
+        "last_name": rng.choice(LAST_NAMES, ids.size),
+        "email": [f"student{i}@student.edu" for i in ids],
+        "department_id": department_ids,
+        "level": 100 * rng.integers(1, 5, ids.size),
+        "github_username": np.where(github, [f"gh-student{i}" for i in ids], None),
+        "is_active": rng.random(ids.size) < 0.97,
+    })
+
+
+def _students_and_sessions(rng, size, scale, seed):
+    student_ids = rng.integers(1, scale.students + 1, size)
+    session_ids = rng.integers(1, scale.sessions + 1, size)
+    return student_ids, session_ids
+
+
+def student_feedback(rng, ids, scale, seed):
+    student_ids, session_ids = _students_and_sessions(rng, ids.size, scale, seed)
+    # Students rate courses of their own department
+    department_ids = student_departments(seed, scale)[student_ids - 1]
+    course_ids = (department_ids - 1) * scale.courses_per_department + rng.integers(
+        1, scale.courses_per_department + 1, ids.size
+    )
+    return pd.DataFrame({
+        "id": ids,
+        "course_id": course_ids,
+        "student_id": student_ids,
+        "academic_session_id": session_ids,
+        "rating": rng.choice([1, 2, 3, 4, 5], ids.size, p=[0.05, 0.1, 0.25, 0.35, 0.25]),
+        "comments": None,
+        "is_anonymous": (rng.random(ids.size) < 0.8).astype(int),
+    })
+
+
+def internship_records(rng, ids, scale, seed):
+    student_ids, session_ids = _students_and_sessions(rng, ids.size, scale, seed)
+    weeks = rng.choice([6, 12, 24], ids.size, p=[0.3, 0.5, 0.2])
+    starts = session_starts(scale)[session_ids - 1] + rng.integers(0, 30, ids.size)
+    return pd.DataFrame({
+        "id": ids,
+        "student_id": student_ids,
+        "company_name": rng.choice(COMPANIES, ids.size),
+        "company_location": rng.choice(CITIES, ids.size),
+        "internship_type": rng.choice(INTERNSHIP_TYPES, ids.size, p=[0.4, 0.5, 0.1]),
+        "start_date": _dates(starts),
+        "end_date": _dates(starts + weeks * 7),
+        "academic_session_id": session_ids,
+        "duration_weeks": weeks,
+        "supervisor_name": None,
+        "performance_rating": rng.integers(1, 6, ids.size),
+    })
+
+
+def student_projects(rng, ids, scale, seed):
+    student_ids, session_ids = _students_and_sessions(rng, ids.size, scale, seed)
+    deployed = rng.random(ids.size) < 0.35
+    scored = rng.random(ids.size) < 0.8
+    return pd.DataFrame({
+        "id": ids,
+        "student_id": student_ids,
+        "project_name": [f"Project {i}" for i in ids],
+        "project_description": None,
+        "github_url": [f"https://github.com/gh-student{s}/project-{i}" for s, i in zip(student_ids, ids)],
+        "is_deployed": deployed,
+        "deployment_url": np.where(deployed, [f"https://project-{i}.example.com" for i in ids], None),
+        "technologies_used": rng.choice(TOOLS, ids.size),
+        "academic_session_id": session_ids,
+        "project_quality_score": np.where(scored, rng.integers(40, 101, ids.size), None),
+    })
+
+
+def events(rng, ids, scale, seed):
+    return pd.DataFrame({
+        "id": ids,
+        "event_name": [f"Event {i}" for i in ids],
+        "event_type": rng.choice(EVENT_TYPES, ids.size),
+        "organizer": rng.choice(["Department", "Student Union", "ACM Chapter", "Industry"], ids.size),
+        "event_date": _dates(event_dates(seed, scale)[ids - 1]),
+        "academic_session_id": 1 + (ids - 1) // scale.events_per_session,
+        "description": None,
+        "location": rng.choice(["Main Hall", "Lab 1", "Lab 2", "Online"], ids.size),
+    })
+
+
+def event_participants(rng, ids, scale, seed):
+    event_ids = rng.integers(1, scale.rows("events") + 1, ids.size)
+    return pd.DataFrame({
+        "id": ids,
+        "event_id": event_ids,
+        "student_id": rng.integers(1, scale.students + 1, ids.size),
+        "participation_date": _dates(event_dates(seed, scale)[event_ids - 1]),
+    })
+
+
+GENERATORS: Dict[str, Callable[..., pd.DataFrame]] = {
+    "departments": departments,
+    "academic_sessions": academic_sessions,
+    "lecturers": lecturers,
+    "courses": courses,
+    "students": students,
+    "student_feedback": student_feedback,
+    "internship_records": internship_records,
+    "student_projects": student_projects,
+    "events": events,
+    "event_participants": event_participants,
+}
+
+
+def generate_chunk(table: str, scale: Scale, seed: int, start: int, stop: int) -> pd.DataFrame:
+    """Rows with ids ``start + 1 .. stop`` of ``table``, timestamps included."""
+    ids = np.arange(start + 1, stop + 1)
+    frame = GENERATORS[table](chunk_rng(seed, table, start), ids, scale, seed)
+    now = datetime.now().replace(microsecond=0)
+    frame["created_at"] = now
+    frame["updated_at"] = now
+    return frame
+
+
+@lru_cache(maxsize=2)
+def _engine(url: str) -> Engine:
+    """One engine per worker process."""
+    return create_engine(url, pool_size=1)
+
+
+def copy_frame(engine: Engine, table: str, frame: pd.DataFrame) -> None:
+    """
+    Load a frame with COPY ... FROM STDIN (PostgreSQL).
+
+    Other databases fall back to a batched INSERT.
+    """
+    if engine.dialect.name != "postgresql":
+        target = Base.metadata.tables[table]
+        frame = frame.astype(object).where(frame.notna(), None)
+        for column in target.columns:
+            if isinstance(column.type, JSON) and column.name in frame:
+                frame[column.name] = frame[column.name].map(json.loads)
+        with engine.begin() as conn:
+            conn.execute(target.insert(), frame.to_dict("records"))
+        return
+
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    columns = ", ".join(frame.columns)
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def load_chunk(url: str, table: str, scale: Scale, seed: int, start: int, stop: int) -> int:
+    """Generate and load one chunk; runs in a worker process."""
+    copy_frame(_engine(url), table, generate_chunk(table, scale, seed, start, stop))
+    return stop - start
+
+
+def reset_sequences(engine: Engine) -> None:
+    """Move id sequences past the generated ids (PostgreSQL)."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for table in TABLES:
+            conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+                )
+            )
+            conn.execute(text(f"ANALYZE {table}"))
+
+
+def generate(
+    url: str,
+    scale: Scale,
+    seed: int = 42,
+    chunk_size: int = 200_000,
+    workers: int = 1,
+    truncate: bool = False,
+    tables: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Generate and load a dataset.
+
+    Args:
+        url: Database URL
+        scale: Row counts
+        seed: Random seed
+        chunk_size: Rows per COPY chunk
+        workers: Loader processes (forced to 1 for SQLite)
+        truncate: Empty the target tables first
+        tables: Tables to load (default: all, in dependency order)
+
+    Returns:
+        Rows loaded per table
+
+    Raises:
+        RuntimeError: If a target table already has rows
+    """
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    tables = [table for table in TABLES if tables is None or table in tables]
+    if engine.dialect.name == "sqlite":
+        workers = 1
+
+    with engine.begin() as conn:
+        if truncate:
+            if engine.dialect.name == "postgresql":
+                conn.execute(text(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE"))
+            else:
+                for table in reversed(tables):
+                    conn.execute(text(f"DELETE FROM {table}"))
+        for table in tables:
+            if conn.execute(text(f"SELECT 1 FROM {table} LIMIT 1")).first():
+                raise RuntimeError(f"Table {table} is not empty; pass truncate to replace it")
+
+    loaded = {}
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for table in tables:
+            rows = scale.rows(table)
+            started = time.perf_counter()
+            bounds = [(start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)]
+            if executor is None:
+                loaded[table] = sum(load_chunk(url, table, scale, seed, *b) for b in bounds)
+            else:
+                # Tables load one after another so foreign keys always resolve
+                futures = [executor.submit(load_chunk, url, table, scale, seed, *b) for b in bounds]
+                loaded[table] = sum(future.result() for future in futures)
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Loaded {loaded[table]:,} {table} in {elapsed:.1f}s "
+                f"({loaded[table] / elapsed if elapsed else 0:,.0f} rows/s)"
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    reset_sequences(engine)
+    engine.dispose()
+    return loaded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="Target database")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--students", type=int, default=10_000, help="Students")
+    parser.add_argument("--departments", type=int, default=10, help="Departments")
+    parser.add_argument("--sessions", type=int, default=6, help="Academic sessions (semesters)")
+    parser.add_argument("--lecturers-per-department", type=int, default=15)
+    parser.add_argument("--courses-per-department", type=int, default=40)
+    parser.add_argument("--events-per-session", type=int, default=50)
+    parser.add_argument("--feedback", type=int, default=None, help="Feedback rows (default: 10 per student)")
+    parser.add_argument("--internships", type=int, default=None, help="Internships (default: 1 per 2 students)")
+    parser.add_argument("--projects", type=int, default=None, help="Projects (default: 1 per student)")
+    parser.add_argument("--participants", type=int, default=None, help="Event participations (default: 3 per student)")
+    parser.add_argument("--chunk-size", type=int, default=200_000, help="Rows per COPY chunk")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Loader processes")
+    parser.add_argument("--truncate", action="store_true", help="Empty the target tables first")
+    args = parser.parse_args()
+
+    scale = Scale.for_students(
+        args.students,
+        departments=args.departments,
+        sessions=args.sessions,
+        lecturers_per_department=args.lecturers_per_department,
+        courses_per_department=args.courses_per_department,
+        events_per_session=args.events_per_session,
+        feedback=args.feedback,
+        internships=args.internships,
+        projects=args.projects,
+        participants=args.participants,
+    )
+    logger.info(f"Generating dataset with seed {args.seed}: {asdict(scale)}")
+    started = time.perf_counter()
+    generate(args.database_url, scale, args.seed, args.chunk_size, args.workers, args.truncate)
+    logger.info(f"Dataset generated in {time.perf_counter() - started:.1f}s")
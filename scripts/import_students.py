@@ -0,0 +1,61 @@
+"""
+Bulk student import script.
+Loads students from a CSV or XLSX file and prints the import report.
+
+Usage:
+    python scripts/import_students.py students.csv
+    python scripts/import_students.py intake.xlsx --report errors.json
+"""
+
+import argparse
+import json
+import logging
+import time
+from dataclasses import asdict
+
+from app.db.session import SessionLocal
+from app.services.importers.student_import import StudentImporter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def import_students(path: str, chunk_size: int = 1000, report_path: str | None = None) -> None:
+    """Import students from a file."""
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        logger.info(f"Importing students from {path}...")
+        with open(path, "rb") as stream:
+            report = StudentImporter(db, chunk_size=chunk_size).import_file(stream, path)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Imported {report.imported} of {report.total_rows} rows in {elapsed:.2f}s "
+            f"({report.skipped} skipped, {report.failed} failed)"
+        )
+        for error in report.errors[:20]:
+            logger.warning(f"Row {error.row} ({error.matric_number}): {'; '.join(error.errors)}")
+
+        if report_path:
+            with open(report_path, "w") as out:
+                json.dump(asdict(report), out, indent=2)
+            logger.info(f"Report written to {report_path}")
+
+    except Exception as e:
+        logger.error(f"Error importing students: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="CSV or XLSX file")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows per INSERT")
+    parser.add_argument("--report", default=None, help="Write the full report as JSON")
+    args = parser.parse_args()
+
+    import_students(args.path, chunk_size=args.chunk_size, report_path=args.report)
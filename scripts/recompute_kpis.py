@@ -0,0 +1,65 @@
+"""
+KPI recomputation script.
+Rebuilds KPI snapshots either in full or only for keys marked dirty.
+
+Usage:
+    python scripts/recompute_kpis.py            # dirty keys only
+    python scripts/recompute_kpis.py --full     # every department/session
+    python scripts/recompute_kpis.py --full --from-views
+"""
+
+import argparse
+import logging
+import time
+
+from app.db.materialized_views import refresh_materialized_views
+from app.db.session import SessionLocal, engine
+from app.services.calculators.batch_engine import BatchKPIEngine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def recompute_kpis(
+    full: bool = False, limit: int | None = None, from_views: bool = False
+) -> None:
+    """Recompute KPI snapshots."""
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        kpi_engine = BatchKPIEngine(db, use_materialized_views=from_views)
+        if full:
+            if from_views:
+                logger.info("Refreshing materialized aggregate views...")
+                with engine.connect() as connection:
+                    refresh_materialized_views(connection)
+            logger.info("Recomputing all KPI snapshots...")
+            written = kpi_engine.run()
+        else:
+            logger.info("Recomputing dirty KPI snapshots...")
+            written = kpi_engine.recompute_dirty(limit=limit)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Wrote {written} snapshot rows in {elapsed:.2f}s")
+
+    except Exception as e:
+        logger.error(f"Error recomputing KPIs: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full", action="store_true", help="Recompute every snapshot")
+    parser.add_argument("--limit", type=int, default=None, help="Max dirty keys to process")
+    parser.add_argument(
+        "--from-views",
+        action="store_true",
+        help="Refresh the materialized views and read aggregates from them (full recompute only)",
+    )
+    args = parser.parse_args()
+
+    recompute_kpis(full=args.full, limit=args.limit, from_views=args.from_views)
@@ -2,12 +2,32 @@
 Pytest configuration and shared fixtures for all tests.
 """
 
+import importlib.util
+from pathlib import Path
+
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
 from app.db.base import Base
+import app.db.session  # noqa: F401  (install the ORM change tracking hooks)
+from app.models import (
+    AcademicSession,
+    Course,
+    Department,
+    Event,
+    EventParticipant,
+    InternshipRecord,
+    Student,
+    StudentFeedback,
+    StudentProject,
+)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[1] / "alembic" / "versions"
 
 
 @pytest.fixture(scope="session")
@@ -42,6 +62,93 @@ def db_session(engine):
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest_asyncio.fixture
+async def async_db_session():
+    """Create async test database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    async with SessionLocal() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def kpi_data(db_session):
+    """Two departments, one session and a little activity in the first."""
+    cs = Department(name="Computer Science", code="CS", faculty="Engineering")
+    se = Department(name="Software Engineering", code="SE", faculty="Engineering")
+    term = AcademicSession(
+        session_name="2023/2024", start_date="2023-09-01", end_date="2024-02-28", semester=1
+    )
+    db_session.add_all([cs, se, term])
+    db_session.flush()
+
+    course = Course(course_code="CS101", course_title="Programming", department_id=cs.id)
+    students = [
+        Student(
+            matric_number=f"CSC/2021/00{i}",
+            first_name="Test",
+            last_name="Student",
+            email=f"student{i}@example.com",
+            department_id=cs.id,
+            level=300,
+        )
+        for i in range(1, 5)
+    ]
+    event = Event(
+        event_name="Hackathon",
+        event_type="hackathon",
+        organizer="CS",
+        event_date="2023-10-01",
+        academic_session_id=term.id,
+    )
+    db_session.add_all([course, event, *students])
+    db_session.flush()
+
+    db_session.add_all(
+        [
+            StudentFeedback(course_id=course.id, student_id=students[0].id, academic_session_id=term.id, rating=5),
+            StudentFeedback(course_id=course.id, student_id=students[1].id, academic_session_id=term.id, rating=3),
+            InternshipRecord(
+                student_id=students[0].id,
+                company_name="Acme",
+                internship_type="SIWES",
+                start_date="2023-06-01",
+                end_date="2023-09-01",
+                academic_session_id=term.id,
+                duration_weeks=12,
+            ),
+            StudentProject(
+                student_id=students[0].id,
+                project_name="Portfolio",
+                is_deployed=True,
+                academic_session_id=term.id,
+                project_quality_score=80,
+            ),
+            StudentProject(
+                student_id=students[1].id,
+                project_name="Todo",
+                is_deployed=False,
+                academic_session_id=term.id,
+            ),
+            EventParticipant(event_id=event.id, student_id=students[0].id, participation_date="2023-10-01"),
+            EventParticipant(event_id=event.id, student_id=students[1].id, participation_date="2023-10-01"),
+        ]
+    )
+    db_session.commit()
+    return {"cs": cs, "se": se, "term": term, "course": course, "event": event, "students": students}
+
+
+@pytest.fixture(autouse=True)
+def strict_query_budgets(monkeypatch):
+    """Fail any request that runs more statements than its route's budget."""
+    monkeypatch.setattr(settings, "QUERY_BUDGET_STRICT", True)
+
+
 @pytest.fixture
 def mock_settings(monkeypatch):
     """Provide mock settings for tests."""
@@ -56,3 +163,17 @@ def mock_settings(monkeypatch):
 
     for key, value in test_settings.items():
         monkeypatch.setenv(key, str(value))
+
+
+@pytest.fixture
+def load_migration():
+    """Provide a loader for Alembic migration modules by revision id."""
+
+    def load(revision: str):
+        path = next(MIGRATIONS_DIR.glob(f"{revision}_*.py"))
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
@@ -0,0 +1,83 @@
+"""Tests for the batch KPI calculation engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from app.db import materialized_views
+from app.models import KPISnapshot
+from app.services.calculators.batch_engine import BatchKPIEngine, METRIC_DEFINITIONS
+
+
+class TestVectorizedHelpers:
+    """Tests for the array variants of the percentage/status helpers."""
+
+    def test_matches_scalar_helpers(self, db_session):
+        """Test array helpers agree with the scalar ones."""
+        engine = BatchKPIEngine(db_session)
+        actual = np.array([0.0, 50.0, 100.0, 120.0, 5.0])
+        target = np.array([10.0, 100.0, 100.0, 100.0, 0.0])
+
+        percentages = engine._get_percentages(actual, target)
+        statuses = engine._get_statuses(percentages)
+
+        for a, t, p, s in zip(actual, target, percentages, statuses):
+            assert p == pytest.approx(engine._get_percentage(a, t))
+            assert s == engine._get_status(p)
+
+
+class TestBatchKPIEngine:
+    """Tests for BatchKPIEngine."""
+
+    def test_calculate_all_covers_grid(self, db_session, kpi_data):
+        """Test every department x session x metric gets a row."""
+        frame = BatchKPIEngine(db_session).calculate_all()
+
+        assert len(frame) == 2 * 1 * len(METRIC_DEFINITIONS)
+
+    def test_metric_values(self, db_session, kpi_data):
+        """Test metric values for the department with activity."""
+        metrics = BatchKPIEngine(db_session).calculate(kpi_data["cs"].id, kpi_data["term"].id)
+
+        assert metrics["academic_quality"]["average_course_rating"]["calculated_value"] == 4.0
+        assert metrics["academic_quality"]["average_course_rating"]["status"] == "meets"
+        assert metrics["employability"]["internship_participation_rate"]["calculated_value"] == 25.0
+        assert metrics["practical_skills"]["deployed_project_rate"]["calculated_value"] == 50.0
+        assert metrics["practical_skills"]["average_project_quality"]["calculated_value"] == 80.0
+        assert metrics["student_engagement"]["events_per_student"]["calculated_value"] == 0.5
+
+    def test_empty_department_is_zero(self, db_session, kpi_data):
+        """Test a department without data gets zero values, not errors."""
+        metrics = BatchKPIEngine(db_session).calculate(kpi_data["se"].id, kpi_data["term"].id)
+
+        rating = metrics["academic_quality"]["average_course_rating"]
+        assert rating["calculated_value"] == 0.0
+        assert rating["status"] == "below"
+
+    def test_persist_replaces_existing_rows(self, db_session, kpi_data):
+        """Test running twice does not duplicate snapshots."""
+        engine = BatchKPIEngine(db_session)
+        engine.run(pillars=["academic_quality"])
+        written = engine.run(pillars=["academic_quality"])
+
+        assert written == 4
+        assert db_session.query(KPISnapshot).count() == 4
+
+    def test_materialized_views_match_source_tables(
+        self, db_session, kpi_data, load_migration
+    ):
+        """Test aggregates read from the views equal those computed from raw rows."""
+        connection = db_session.connection()
+        materialized_views.metadata.create_all(connection)
+        try:
+            for name, query in load_migration("d4a8e17c2b56").VIEWS.items():
+                connection.execute(text(f"INSERT INTO {name} {query}"))
+
+            engine = BatchKPIEngine(db_session)
+            from_tables = engine.load_aggregates()
+            from_views = engine.load_aggregates(use_views=True)
+        finally:
+            materialized_views.metadata.drop_all(connection)
+
+        pd.testing.assert_frame_equal(from_views, from_tables)
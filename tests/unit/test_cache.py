@@ -0,0 +1,148 @@
+"""Tests for the caching layer."""
+
+import pytest
+
+from app.core.cache import Cache, LRUCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Tests for the in-process LRU tier."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted first."""
+        lru = LRUCache(max_entries=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        assert lru.get("a") == 1
+        assert lru.get("b") is None
+        assert lru.get("c") == 3
+
+    def test_entries_expire(self):
+        """Test entries are dropped after their TTL."""
+        clock = FakeClock()
+        lru = LRUCache(ttl_seconds=10, clock=clock)
+        lru.set("a", 1)
+
+        clock.now = 9.9
+        assert lru.get("a") == 1
+        clock.now = 10.0
+        assert lru.get("a") is None
+
+    def test_ttl_is_capped_by_local_ttl(self):
+        """Test a longer requested TTL does not outlive the local TTL."""
+        clock = FakeClock()
+        lru = LRUCache(ttl_seconds=5, clock=clock)
+        lru.set("a", 1, ttl=3600)
+
+        clock.now = 5.0
+        assert lru.get("a") is None
+
+    def test_delete_prefix(self):
+        """Test prefix invalidation."""
+        lru = LRUCache()
+        lru.set("kpi:department:1:all", 1)
+        lru.set("kpi:department:1:7", 2)
+        lru.set("kpi:department:10:all", 3)
+
+        lru.delete_prefix("kpi:department:1:")
+
+        assert len(lru) == 1
+        assert lru.get("kpi:department:10:all") == 3
+
+
+class TestCache:
+    """Tests for the two-tier cache without Redis."""
+
+    def test_get_or_set_loads_once(self):
+        """Test the loader runs only on a miss."""
+        cache = Cache(redis_url=None, default_ttl=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {"id": 1}
+
+        assert cache.get_or_set("students:1", loader) == {"id": 1}
+        assert cache.get_or_set("students:1", loader) == {"id": 1}
+        assert len(calls) == 1
+
+    def test_none_is_not_cached(self):
+        """Test missing records are looked up again."""
+        cache = Cache(redis_url=None, default_ttl=60)
+
+        assert cache.get_or_set("students:1", lambda: None) is None
+        assert cache.get_or_set("students:1", lambda: {"id": 1}) == {"id": 1}
+
+    def test_delete_invalidates(self):
+        """Test explicit invalidation."""
+        cache = Cache(redis_url=None, default_ttl=60)
+        cache.set("students:1", {"id": 1})
+
+        cache.delete("students:1")
+
+        assert cache.get("students:1") is None
+
+    def test_disabled_cache_always_loads(self):
+        """Test ENABLE_CACHING=False bypasses both tiers."""
+        cache = Cache(redis_url=None, default_ttl=60, enabled=False)
+        cache.set("students:1", {"id": 1})
+
+        assert cache.get("students:1") is None
+        assert cache.get_or_set("students:1", lambda: {"id": 2}) == {"id": 2}
+
+    def test_zero_local_ttl_skips_local_tier(self):
+        """Test values with a local TTL of 0 are never held in process."""
+        cache = Cache(redis_url=None, default_ttl=60)
+
+        cache.set("users:1:0", {"id": 1}, local_ttl=0)
+
+        assert cache.get("users:1:0") is None
+        assert len(cache.local) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_get_or_set_and_delete(self):
+        """Test the async read-through lookup and invalidation."""
+        cache = Cache(redis_url=None, default_ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return {"id": len(calls)}
+
+        assert await cache.aget_or_set("students:1", loader) == {"id": 1}
+        assert await cache.aget_or_set("students:1", loader) == {"id": 1}
+        await cache.adelete("students:1")
+        assert await cache.aget_or_set("students:1", loader) == {"id": 2}
+        await cache.adelete_prefix("students:")
+        assert await cache.aget("students:1") is None
+
+    @pytest.mark.asyncio
+    async def test_async_methods_skip_sync_client(self, monkeypatch):
+        """Test the async methods never reach the blocking Redis client."""
+        cache = Cache(redis_url="redis://localhost:1/0", default_ttl=60)
+
+        def fail():
+            raise AssertionError("sync Redis client used on the event loop")
+
+        monkeypatch.setattr(cache, "_client", fail)
+
+        assert await cache.aget_or_set("students:1", _async_value) == {"id": 1}
+        await cache.adelete("students:1")
+        await cache.adelete_prefix("students:")
+
+
+async def _async_value():
+    return {"id": 1}
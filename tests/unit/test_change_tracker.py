@@ -0,0 +1,172 @@
+"""Tests for KPI change tracking and incremental recomputation."""
+
+import pytest
+
+from app.models import (
+    AcademicSession,
+    KPIDirtyKey,
+    KPISnapshot,
+    StudentFeedback,
+    StudentProject,
+)
+from app.services.calculators.batch_engine import BatchKPIEngine
+from app.services.calculators.change_tracker import TRACKING_INFO_KEY
+
+
+@pytest.fixture
+def tracked_data(db_session, kpi_data):
+    """``kpi_data`` without the keys its own writes marked dirty."""
+    db_session.query(KPIDirtyKey).delete()
+    db_session.commit()
+    return kpi_data
+
+
+PILLARS = {"academic_quality", "employability", "practical_skills", "student_engagement"}
+
+
+def _dirty_keys(db_session):
+    return {
+        (k.department_id, k.academic_session_id, k.pillar_name)
+        for k in db_session.query(KPIDirtyKey)
+    }
+
+
+class TestChangeTracking:
+    """Tests for the after-flush dirty key hook."""
+
+    def test_insert_marks_pillar_dirty(self, db_session, tracked_data):
+        """Test a new feedback row marks academic_quality dirty once per transaction."""
+        ids = (tracked_data["cs"].id, tracked_data["term"].id)
+        for ratings in ((4, 5), (3,)):
+            for rating in ratings:
+                db_session.add(
+                    StudentFeedback(
+                        course_id=tracked_data["course"].id,
+                        student_id=tracked_data["students"][2].id,
+                        academic_session_id=ids[1],
+                        rating=rating,
+                    )
+                )
+                db_session.flush()
+            db_session.commit()
+
+        assert _dirty_keys(db_session) == {(*ids, "academic_quality")}
+        assert db_session.query(KPIDirtyKey).count() == 2
+
+    def test_untracked_write_marks_nothing(self, db_session, tracked_data):
+        """Test writes to untracked models leave no markers."""
+        tracked_data["students"][0].first_name = "Renamed"
+        tracked_data["course"].course_title = "Programming I"
+        tracked_data["event"].location = "Main hall"
+        db_session.commit()
+
+        assert _dirty_keys(db_session) == set()
+
+    def test_student_move_marks_both_departments(self, db_session, tracked_data):
+        """Test moving a student dirties every pillar of its old and new department."""
+        tracked_data["students"][0].department_id = tracked_data["se"].id
+        db_session.commit()
+
+        term = tracked_data["term"].id
+        assert _dirty_keys(db_session) == {
+            (dept.id, term, pillar) for dept in (tracked_data["cs"], tracked_data["se"]) for pillar in PILLARS
+        }
+
+    def test_course_move_marks_both_departments(self, db_session, tracked_data):
+        """Test moving a course dirties its feedback's pillar in the old and new department."""
+        tracked_data["course"].department_id = tracked_data["se"].id
+        db_session.commit()
+
+        term = tracked_data["term"].id
+        assert _dirty_keys(db_session) == {
+            (dept.id, term, "academic_quality") for dept in (tracked_data["cs"], tracked_data["se"])
+        }
+
+    def test_event_move_marks_both_sessions(self, db_session, tracked_data):
+        """Test moving an event dirties its participants' pillar in the old and new session."""
+        other = AcademicSession(
+            session_name="2024/2025", start_date="2024-09-01", end_date="2025-02-28", semester=1
+        )
+        db_session.add(other)
+        db_session.flush()
+
+        tracked_data["event"].academic_session_id = other.id
+        db_session.commit()
+
+        dept = tracked_data["cs"].id
+        assert _dirty_keys(db_session) == {
+            (dept, term, "student_engagement") for term in (tracked_data["term"].id, other.id)
+        }
+
+    def test_student_deactivation_marks_department(self, db_session, tracked_data):
+        """Test deactivating a student changes the rate denominators."""
+        tracked_data["students"][0].is_active = False
+        db_session.commit()
+
+        ids = (tracked_data["cs"].id, tracked_data["term"].id)
+        assert _dirty_keys(db_session) == {(*ids, pillar) for pillar in PILLARS}
+
+    def test_tracking_can_be_disabled(self, db_session, tracked_data):
+        """Test the session.info flag turns tracking off."""
+        db_session.info[TRACKING_INFO_KEY] = False
+        db_session.add(
+            StudentProject(
+                student_id=tracked_data["students"][2].id,
+                project_name="Portfolio",
+                academic_session_id=tracked_data["term"].id,
+            )
+        )
+        db_session.commit()
+
+        assert _dirty_keys(db_session) == set()
+
+
+class TestRecomputeDirty:
+    """Tests for incremental recomputation."""
+
+    def test_rebuilds_only_dirty_pillar(self, db_session, tracked_data):
+        """Test only the dirty pillar's snapshots are written."""
+        db_session.add(
+            StudentProject(
+                student_id=tracked_data["students"][2].id,
+                project_name="Portfolio",
+                is_deployed=True,
+                academic_session_id=tracked_data["term"].id,
+            )
+        )
+        db_session.commit()
+
+        written = BatchKPIEngine(db_session).recompute_dirty()
+
+        pillars = {s.pillar_name for s in db_session.query(KPISnapshot)}
+        assert written == 2
+        assert pillars == {"practical_skills"}
+        assert _dirty_keys(db_session) == set()
+
+    def test_write_during_recompute_stays_pending(self, db_session, tracked_data, monkeypatch):
+        """Test a key written after its marker was claimed is marked again."""
+        project = {
+            "student_id": tracked_data["students"][2].id,
+            "project_name": "Portfolio",
+            "academic_session_id": tracked_data["term"].id,
+        }
+        db_session.add(StudentProject(**project))
+        db_session.commit()
+        kpi_engine = BatchKPIEngine(db_session)
+        calculate_keys = kpi_engine.calculate_keys
+
+        def write_then_calculate(keys, **kwargs):
+            # Lands between claiming the marker and deleting it
+            db_session.add(StudentProject(**dict(project, project_name="Late")))
+            db_session.flush()
+            return calculate_keys(keys, **kwargs)
+
+        monkeypatch.setattr(kpi_engine, "calculate_keys", write_then_calculate)
+        kpi_engine.recompute_dirty()
+
+        ids = (tracked_data["cs"].id, tracked_data["term"].id)
+        assert _dirty_keys(db_session) == {(*ids, "practical_skills")}
+
+    def test_nothing_dirty(self, db_session, tracked_data):
+        """Test recompute is a no-op with no markers."""
+        assert BatchKPIEngine(db_session).recompute_dirty() == 0
@@ -0,0 +1,187 @@
+"""Tests for the streaming collector pipeline."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.crud.collector import crud_collector_sync_run, crud_collector_sync_state
+from app.services.collectors.base_collector import BaseCollector, SyncCheckpoint
+from app.services.collectors.pipeline import CollectorPipeline
+
+
+class CountingCollector(BaseCollector):
+    """Streams numbered items, rejecting odd ones, and records writes."""
+
+    def __init__(self, total, fail_at=None):
+        super().__init__(session=None)
+        self.total = total
+        self.fail_at = fail_at
+        self.produced = 0
+        self.persisted = 0
+        self.batches = []
+        self.max_in_flight = 0
+
+    def collect(self, **kwargs):
+        return [{"n": n} for n in range(self.total)]
+
+    def validate(self, data):
+        return data["n"] % 2 == 0
+
+    async def aiter_collect(self, **kwargs):
+        for n in range(self.total):
+            self.produced += 1
+            self.max_in_flight = max(self.max_in_flight, self.produced - self.persisted)
+            await asyncio.sleep(0)
+            yield {"n": n}
+
+    def persist_batch(self, items):
+        if self.fail_at is not None and self.persisted >= self.fail_at:
+            raise RuntimeError("database unavailable")
+        self.batches.append(len(items))
+        # Count both halves of the source consumed so far as persisted
+        self.persisted += len(items) * 2
+        return len(items)
+
+
+class CheckpointingCollector(BaseCollector):
+    """Yields pages of items per entity, each followed by a checkpoint."""
+
+    source = "test"
+
+    def __init__(self, session, pages, fail_on=None):
+        super().__init__(session)
+        self.pages = pages
+        self.fail_on = fail_on
+
+    def collect(self, **kwargs):
+        return []
+
+    def validate(self, data):
+        return True
+
+    async def aiter_collect(self, **kwargs):
+        for entity, page in self.pages:
+            for n in range(page):
+                yield {"entity": entity, "n": n}
+            yield SyncCheckpoint(entity, watermark=str(page))
+
+    def persist_batch(self, items):
+        if any(item["entity"] == self.fail_on for item in items):
+            raise RuntimeError(f"cannot write {self.fail_on}")
+        return len(items)
+
+
+class TestCollectorPipeline:
+    """Tests for CollectorPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_streams_validates_and_persists(self):
+        """Test every valid item is written in bounded batches."""
+        collector = CountingCollector(1000)
+
+        report = await CollectorPipeline(collector, batch_size=100, buffer_batches=2).arun()
+
+        assert report.collect.items_out == 1000
+        assert report.collect.batches == 10
+        assert report.validate.items_out == 500
+        assert report.invalid == 500
+        assert report.persist.items_out == 500
+        assert collector.batches == [50] * 10
+        assert report.to_dict()["persist"]["items_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_buffers_bound_items_in_flight(self):
+        """Test a slow writer throttles the source instead of buffering it all."""
+        collector = CountingCollector(5000)
+
+        await CollectorPipeline(collector, batch_size=50, buffer_batches=2).arun()
+
+        # Two full queues, one batch in each stage and one being assembled
+        assert collector.max_in_flight <= 50 * 8
+        assert collector.persisted == 5000
+
+    @pytest.mark.asyncio
+    async def test_persist_error_stops_pipeline(self):
+        """Test a failing stage cancels the others and re-raises."""
+        collector = CountingCollector(10_000, fail_at=1000)
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            await CollectorPipeline(collector, batch_size=100, buffer_batches=1).arun()
+
+        assert collector.produced < 10_000
+
+    @pytest.mark.asyncio
+    async def test_failure_waits_for_write_in_flight(self):
+        """Test the run is finished only after the worker thread's write returns."""
+        events = []
+        release = threading.Event()
+
+        class SlowWriter(CountingCollector):
+            async def aiter_collect(self, **kwargs):
+                yield {"n": 0}
+                await asyncio.sleep(0.05)
+                raise RuntimeError("source unavailable")
+
+            def persist_batch(self, items):
+                release.wait(5)
+                events.append("persisted")
+                return len(items)
+
+            def finish_sync_run(self, run, counts, stats=None, error=None):
+                events.append("finished")
+
+        async def release_later():
+            await asyncio.sleep(0.2)
+            release.set()
+
+        releaser = asyncio.create_task(release_later())
+        with pytest.raises(RuntimeError, match="source unavailable"):
+            await CollectorPipeline(SlowWriter(1), batch_size=1).arun()
+        await releaser
+
+        assert events == ["persisted", "finished"]
+
+    def test_default_stream_wraps_collect(self):
+        """Test collectors without a streaming source still run via collect()."""
+
+        class ListCollector(CountingCollector):
+            aiter_collect = BaseCollector.aiter_collect
+
+        collector = ListCollector(10)
+
+        report = CollectorPipeline(collector, batch_size=4).run()
+
+        assert report.collect.items_out == 10
+        assert report.persist.items_out == 5
+
+
+class TestSyncCheckpoints:
+    """Tests for watermark checkpoints and run records."""
+
+    def test_checkpoints_saved_with_their_items(self, db_session):
+        """Test every entity's watermark is committed and the run recorded."""
+        collector = CheckpointingCollector(db_session, [("a", 3), ("b", 5), ("c", 0)])
+
+        report = CollectorPipeline(collector, batch_size=4).run()
+
+        states = crud_collector_sync_state.get_states(db_session, "test")
+        watermarks = {entity: state.watermark for entity, state in states.items()}
+        assert watermarks == {"a": "3", "b": "5", "c": "0"}
+        run = crud_collector_sync_run.get_latest(db_session, "test")
+        assert run.status == "succeeded"
+        assert (run.items_persisted, run.checkpoints) == (8, 3)
+        assert (report.persist.items_out, report.checkpoints) == (8, 3)
+
+    def test_failed_batch_does_not_advance_watermark(self, db_session):
+        """Test a crash keeps the last committed watermark and marks the run failed."""
+        collector = CheckpointingCollector(db_session, [("a", 2), ("b", 2), ("c", 2)], fail_on="c")
+
+        with pytest.raises(RuntimeError):
+            CollectorPipeline(collector, batch_size=3).run()
+
+        states = crud_collector_sync_state.get_states(db_session, "test")
+        assert set(states) == {"a", "b"}
+        run = crud_collector_sync_run.get_latest(db_session, "test")
+        assert run.status == "failed"
+        assert run.error == "cannot write c"
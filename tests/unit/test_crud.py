@@ -0,0 +1,244 @@
+"""Tests for CRUD operations."""
+
+import pytest
+
+from app.crud.base import CRUDBase
+from app.crud.student import crud_student
+from app.models import AcademicSession, Department, KPIDirtyKey, Student, StudentProject
+
+
+def _student(department_id: int, number: int = 1) -> dict:
+    return {
+        "matric_number": f"CSC/2021/{number:03d}",
+        "first_name": "Test",
+        "last_name": "Student",
+        "email": f"student{number}@example.com",
+        "department_id": department_id,
+        "level": 300,
+    }
+
+
+class TestAsyncCRUD:
+    """Tests for the async CRUDBase variants."""
+
+    @pytest.mark.asyncio
+    async def test_create_get_update_remove(self, async_db_session):
+        """Test a full async round trip."""
+        dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+        async_db_session.add(dept)
+        await async_db_session.commit()
+
+        student = await crud_student.acreate(async_db_session, _student(dept.id))
+        assert (await crud_student.aget(async_db_session, student.id)).email == "student1@example.com"
+        assert (await crud_student.aget_by_matric(async_db_session, "CSC/2021/001")).id == student.id
+
+        updated = await crud_student.aupdate(async_db_session, student, {"level": 400})
+        assert updated.level == 400
+
+        await crud_student.aremove(async_db_session, student.id)
+        assert await crud_student.aget(async_db_session, student.id) is None
+
+    @pytest.mark.asyncio
+    async def test_get_multi(self, async_db_session):
+        """Test async pagination."""
+        dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+        async_db_session.add(dept)
+        await async_db_session.commit()
+        for number in range(1, 4):
+            await crud_student.acreate(async_db_session, _student(dept.id, number))
+
+        page = await crud_student.aget_multi(async_db_session, skip=1, limit=5)
+
+        assert len(page) == 2
+
+
+class TestBulkCRUD:
+    """Tests for the set-based bulk operations."""
+
+    def _department(self, db_session) -> Department:
+        dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+        db_session.add(dept)
+        db_session.commit()
+        return dept
+
+    def test_create_many(self, db_session):
+        """Test records come back in input order without a refresh."""
+        dept = self._department(db_session)
+
+        students = crud_student.create_many(
+            db_session, [_student(dept.id, number) for number in (3, 1, 2)]
+        )
+
+        assert [s.matric_number for s in students] == [
+            "CSC/2021/003",
+            "CSC/2021/001",
+            "CSC/2021/002",
+        ]
+        assert all(s.id is not None and s.is_active for s in students)
+        assert db_session.query(Student).count() == 3
+
+    def test_update_many(self, db_session):
+        """Test per-row values are applied by primary key."""
+        dept = self._department(db_session)
+        first, second = crud_student.create_many(
+            db_session, [_student(dept.id, 1), _student(dept.id, 2)]
+        )
+
+        updated = crud_student.update_many(
+            db_session,
+            [{"id": first.id, "level": 100}, {"id": second.id, "level": 400}],
+        )
+
+        assert [s.level for s in updated] == [100, 400]
+
+    def test_upsert_many_on_natural_key(self, db_session):
+        """Test existing matric numbers are updated and new ones inserted."""
+        dept = self._department(db_session)
+        (existing,) = crud_student.create_many(db_session, [_student(dept.id, 1)])
+
+        changed = dict(_student(dept.id, 1), first_name="Renamed")
+        result = crud_student.upsert_many(
+            db_session,
+            [changed, _student(dept.id, 2), dict(changed, level=100)],
+        )
+
+        assert len(result) == 2
+        assert db_session.query(Student).count() == 2
+        row = crud_student.get(db_session, existing.id)
+        assert (row.first_name, row.level) == ("Renamed", 100)
+
+    def test_remove_many(self, db_session):
+        """Test records are deleted in one pass."""
+        dept = self._department(db_session)
+        students = crud_student.create_many(
+            db_session, [_student(dept.id, number) for number in range(1, 4)]
+        )
+
+        removed = crud_student.remove_many(db_session, [s.id for s in students[:2]])
+
+        assert len(removed) == 2
+        assert db_session.query(Student).count() == 1
+
+    def test_uncommitted_write_invalidates_on_commit(self, db_session, monkeypatch):
+        """Test caches are invalidated when the caller commits, not before."""
+        dept = self._department(db_session)
+        invalidated = []
+        monkeypatch.setattr(crud_student, "invalidate_cache_many", invalidated.append)
+
+        (student,) = crud_student.create_many(db_session, [_student(dept.id)], commit=False)
+        assert invalidated == []
+
+        db_session.commit()
+        db_session.commit()
+        assert invalidated == [[student.id]]
+
+    def test_tracked_models_mark_kpi_keys_dirty(self, db_session):
+        """Test bulk writes of KPI source rows mark their keys dirty."""
+        dept = self._department(db_session)
+        session = AcademicSession(
+            session_name="2023/2024",
+            start_date="2023-09-01",
+            end_date="2024-07-31",
+            semester=1,
+        )
+        db_session.add(session)
+        (student,) = crud_student.create_many(db_session, [_student(dept.id)])
+        db_session.query(KPIDirtyKey).delete()
+        crud = CRUDBase(StudentProject)
+
+        crud.create_many(
+            db_session,
+            [
+                {
+                    "student_id": student.id,
+                    "project_name": "Capstone",
+                    "academic_session_id": session.id,
+                }
+            ],
+        )
+
+        keys = db_session.query(KPIDirtyKey).all()
+        assert [(k.department_id, k.academic_session_id, k.pillar_name) for k in keys] == [
+            (dept.id, session.id, "practical_skills")
+        ]
+
+    def test_moved_rows_mark_previous_keys_dirty(self, db_session):
+        """Test a bulk update moving a row between sessions dirties both sessions."""
+        dept = self._department(db_session)
+        first, second = (
+            AcademicSession(
+                session_name=name,
+                start_date=start,
+                end_date=end,
+                semester=1,
+            )
+            for name, start, end in (
+                ("2022/2023", "2022-09-01", "2023-07-31"),
+                ("2023/2024", "2023-09-01", "2024-07-31"),
+            )
+        )
+        db_session.add_all([first, second])
+        (student,) = crud_student.create_many(db_session, [_student(dept.id)])
+        crud = CRUDBase(StudentProject)
+        (project,) = crud.create_many(
+            db_session,
+            [{"student_id": student.id, "project_name": "Capstone", "academic_session_id": first.id}],
+        )
+        db_session.query(KPIDirtyKey).delete()
+        db_session.commit()
+
+        crud.update_many(db_session, [{"id": project.id, "academic_session_id": second.id}])
+
+        keys = db_session.query(KPIDirtyKey).order_by(KPIDirtyKey.academic_session_id).all()
+        assert [(k.department_id, k.academic_session_id, k.pillar_name) for k in keys] == [
+            (dept.id, first.id, "practical_skills"),
+            (dept.id, second.id, "practical_skills"),
+        ]
+
+    def test_bulk_student_writes_mark_only_moves(self, db_session):
+        """Test bulk student updates dirty keys only when the department changes."""
+        dept = self._department(db_session)
+        other = Department(name="Software Engineering", code="SE", faculty="Engineering")
+        session = AcademicSession(
+            session_name="2023/2024",
+            start_date="2023-09-01",
+            end_date="2024-07-31",
+            semester=1,
+        )
+        db_session.add_all([other, session])
+        first, second = crud_student.create_many(
+            db_session, [_student(dept.id, 1), _student(dept.id, 2)]
+        )
+        db_session.query(KPIDirtyKey).delete()
+        db_session.commit()
+
+        crud_student.update_many(db_session, [{"id": first.id, "level": 400}])
+        assert db_session.query(KPIDirtyKey).count() == 0
+
+        crud_student.update_many(db_session, [{"id": second.id, "department_id": other.id}])
+        keys = {(k.department_id, k.pillar_name) for k in db_session.query(KPIDirtyKey)}
+        assert {department_id for department_id, _ in keys} == {dept.id, other.id}
+        assert len(keys) == 8
+
+    @pytest.mark.asyncio
+    async def test_async_bulk_round_trip(self, async_db_session):
+        """Test the async bulk variants."""
+        dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+        async_db_session.add(dept)
+        await async_db_session.commit()
+
+        created = await crud_student.acreate_many(
+            async_db_session, [_student(dept.id, 1), _student(dept.id, 2)]
+        )
+        await crud_student.aupdate_many(
+            async_db_session, [{"id": created[0].id, "level": 100}]
+        )
+        upserted = await crud_student.aupsert_many(
+            async_db_session, [dict(_student(dept.id, 2), level=200)]
+        )
+        removed = await crud_student.aremove_many(async_db_session, [created[0].id])
+
+        assert upserted[0].level == 200
+        assert [s.level for s in removed] == [100]
+        remaining = await crud_student.aget_multi(async_db_session)
+        assert [s.id for s in remaining] == [upserted[0].id]
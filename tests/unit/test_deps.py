@@ -0,0 +1,109 @@
+"""Tests for API dependencies."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.deps import get_current_user
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.crud.user import crud_user
+
+
+@pytest.fixture
+def local_cache(monkeypatch):
+    """Use only the in-process cache tier, which then also holds principals."""
+    monkeypatch.setattr(cache, "_redis_url", None)
+    monkeypatch.setattr(settings, "PRINCIPAL_LOCAL_TTL_SECONDS", 30)
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def count_lookups(monkeypatch):
+    """Count user lookups hitting the database."""
+    calls = []
+    original = crud_user.aget
+
+    async def aget(db, id):
+        calls.append(id)
+        return await original(db, id)
+
+    monkeypatch.setattr(crud_user, "aget", aget)
+    return calls
+
+
+async def _user(db, **overrides):
+    values = {
+        "email": "admin@example.com",
+        "username": "admin",
+        "hashed_password": "x",
+        "is_superuser": True,
+    }
+    values.update(overrides)
+    return await crud_user.acreate(db, values)
+
+
+class TestGetCurrentUser:
+    """Tests for the cached principal lookup."""
+
+    @pytest.mark.asyncio
+    async def test_principal_is_cached(self, async_db_session, local_cache, count_lookups):
+        """Test repeated requests with one token query the user once."""
+        user = await _user(async_db_session)
+        token = create_access_token(str(user.id))
+
+        first = await get_current_user(token=token, db=async_db_session)
+        second = await get_current_user(token=token, db=async_db_session)
+
+        assert first.id == second.id == user.id
+        assert second.is_superuser is True
+        assert count_lookups == [user.id]
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_principal(
+        self, async_db_session, local_cache, count_lookups
+    ):
+        """Test deactivating a user is seen by the next request."""
+        user = await _user(async_db_session)
+        token = create_access_token(str(user.id))
+        await get_current_user(token=token, db=async_db_session)
+
+        await crud_user.aupdate(async_db_session, user, {"is_active": False})
+        principal = await get_current_user(token=token, db=async_db_session)
+
+        assert principal.is_active is False
+        assert len(count_lookups) == 2
+
+    @pytest.mark.asyncio
+    async def test_principals_skip_local_tier_by_default(
+        self, async_db_session, local_cache, count_lookups, monkeypatch
+    ):
+        """Test principals are not kept where other workers cannot invalidate them."""
+        monkeypatch.setattr(settings, "PRINCIPAL_LOCAL_TTL_SECONDS", 0)
+        user = await _user(async_db_session)
+        token = create_access_token(str(user.id))
+
+        await get_current_user(token=token, db=async_db_session)
+        await get_current_user(token=token, db=async_db_session)
+
+        assert len(local_cache.local) == 0
+        assert count_lookups == [user.id, user.id]
+
+    @pytest.mark.asyncio
+    async def test_password_hash_is_not_cached(self, async_db_session, local_cache):
+        """Test cached principals carry no credentials."""
+        user = await _user(async_db_session)
+        token = create_access_token(str(user.id))
+
+        principal = await get_current_user(token=token, db=async_db_session)
+
+        assert principal.hashed_password is None
+        assert "hashed_password" not in crud_user.principal_columns
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_rejected(self, async_db_session, local_cache):
+        """Test tokens of missing users are refused."""
+        with pytest.raises(HTTPException):
+            await get_current_user(token=create_access_token("999"), db=async_db_session)
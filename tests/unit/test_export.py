@@ -0,0 +1,83 @@
+"""Tests for streaming table exports."""
+
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models import Department, Student
+from app.services.exporters.table_export import (
+    ExportFormat,
+    stream_export,
+    students_statement,
+)
+
+
+async def _seed(session, count: int = 5) -> Department:
+    dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+    session.add(dept)
+    await session.flush()
+    session.add_all(
+        Student(
+            matric_number=f"CSC/2021/{number:03d}",
+            first_name="Test",
+            last_name="Student",
+            email=f"student{number}@example.com",
+            department_id=dept.id,
+            level=300,
+        )
+        for number in range(1, count + 1)
+    )
+    await session.commit()
+    return dept
+
+
+async def _collect(statement, export_format, session, batch_size=2) -> list:
+    factory = async_sessionmaker(bind=session.bind)
+    return [
+        chunk
+        async for chunk in stream_export(statement, export_format, factory, batch_size)
+    ]
+
+
+class TestStreamExport:
+    """Tests for stream_export."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_streams_one_chunk_per_batch(self, async_db_session):
+        """Test rows arrive in batch-sized NDJSON chunks."""
+        await _seed(async_db_session)
+
+        chunks = await _collect(students_statement(), ExportFormat.NDJSON, async_db_session)
+        rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+
+        assert len(chunks) == 3
+        assert [row["matric_number"] for row in rows] == [
+            f"CSC/2021/{number:03d}" for number in range(1, 6)
+        ]
+        assert rows[0]["created_at"]
+
+    @pytest.mark.asyncio
+    async def test_csv_header_comes_first(self, async_db_session):
+        """Test the CSV header is its own first chunk, followed by rows."""
+        dept = await _seed(async_db_session, count=3)
+
+        chunks = await _collect(
+            students_statement(dept.id), ExportFormat.CSV, async_db_session
+        )
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+
+        assert chunks[0].startswith("id,matric_number,")
+        assert len(rows) == 4
+        assert rows[1][1] == "CSC/2021/001"
+
+    @pytest.mark.asyncio
+    async def test_filters_apply(self, async_db_session):
+        """Test an unmatched filter yields only the header."""
+        await _seed(async_db_session, count=2)
+
+        chunks = await _collect(students_statement(999), ExportFormat.CSV, async_db_session)
+
+        assert len(chunks) == 1
@@ -0,0 +1,73 @@
+"""Tests for the synthetic data generator."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from scripts.generate_data import TABLES, Scale, generate, generate_chunk
+
+SCALE = Scale(
+    departments=3,
+    sessions=2,
+    lecturers_per_department=2,
+    courses_per_department=4,
+    students=200,
+    feedback=1000,
+    internships=50,
+    projects=100,
+    events_per_session=3,
+    participants=300,
+)
+
+
+class TestGenerateChunk:
+    """Tests for chunk generation."""
+
+    def test_chunks_are_deterministic(self):
+        """Test the same seed and bounds always produce the same rows."""
+        first = generate_chunk("students", SCALE, 7, 0, 100)
+        again = generate_chunk("students", SCALE, 7, 0, 100)
+        other = generate_chunk("students", SCALE, 8, 0, 100)
+
+        pd.testing.assert_frame_equal(first, again)
+        assert not first["matric_number"].equals(other["matric_number"])
+
+    def test_feedback_courses_match_student_departments(self):
+        """Test feedback only references courses of the student's department."""
+        students = generate_chunk("students", SCALE, 7, 0, SCALE.students).set_index("id")
+        courses = generate_chunk("courses", SCALE, 7, 0, SCALE.rows("courses")).set_index("id")
+        feedback = generate_chunk("student_feedback", SCALE, 7, 500, 1000)
+
+        student_departments = students.loc[feedback["student_id"], "department_id"].to_numpy()
+        course_departments = courses.loc[feedback["course_id"], "department_id"].to_numpy()
+        assert (student_departments == course_departments).all()
+        assert feedback["id"].tolist() == list(range(501, 1001))
+
+
+class TestGenerate:
+    """Tests for loading a dataset."""
+
+    def test_loads_every_table(self, tmp_path):
+        """Test each table receives its scaled row count across chunks."""
+        url = f"sqlite:///{tmp_path / 'generated.db'}"
+
+        loaded = generate(url, SCALE, seed=7, chunk_size=64)
+
+        assert loaded == {table: SCALE.rows(table) for table in TABLES}
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            orphans = conn.execute(text(
+                "SELECT COUNT(*) FROM student_feedback f "
+                "LEFT JOIN students s ON s.id = f.student_id WHERE s.id IS NULL"
+            )).scalar()
+        engine.dispose()
+        assert orphans == 0
+
+    def test_refuses_non_empty_tables(self, tmp_path):
+        """Test loading into populated tables fails unless truncating."""
+        url = f"sqlite:///{tmp_path / 'generated.db'}"
+        generate(url, SCALE, tables=["departments"])
+
+        with pytest.raises(RuntimeError, match="departments is not empty"):
+            generate(url, SCALE, tables=["departments"])
+        assert generate(url, SCALE, truncate=True, tables=["departments"]) == {"departments": 3}
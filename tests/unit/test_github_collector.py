@@ -0,0 +1,271 @@
+"""Tests for the GitHub collector against a local stand-in API."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+from app.crud.collector import crud_collector_sync_run, crud_collector_sync_state
+from app.models import Student, StudentProject
+from app.services.collectors.github_collector import GitHubCollector, RateLimiter
+from app.services.collectors.pipeline import CollectorPipeline
+
+
+def repo(owner, name, updated_at="2024-01-01T00:00:00Z"):
+    """Minimal repository payload."""
+    return {
+        "id": hash((owner, name)) & 0xFFFF,
+        "name": name,
+        "full_name": f"{owner}/{name}",
+        "html_url": f"https://github.com/{owner}/{name}",
+        "language": "Python",
+        "stargazers_count": 1,
+        "fork": False,
+        "updated_at": updated_at,
+    }
+
+
+class StandInAPI(BaseHTTPRequestHandler):
+    """Serves /users/{name}/repos with ETags, pagination and rate limits."""
+
+    # Class-level state, reset per test by the fixture
+    requests = []
+    throttle = set()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.requests.append((url.path, url.query, self.headers.get("If-None-Match")))
+        parts = url.path.strip("/").split("/")
+        username = parts[1] if len(parts) == 3 else None
+        reset = str(int(time.time()) + 60)
+
+        if username in self.throttle:
+            self.throttle.discard(username)
+            headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+            return self.reply(403, {"message": "rate limited"}, headers)
+        if username == "ghost":
+            return self.reply(404, {"message": "Not Found"})
+
+        etag = f'"{username}-v1"'
+        if "page=2" not in url.query and self.headers.get("If-None-Match") == etag:
+            return self.reply(304, None, {"ETag": etag})
+
+        headers = {"ETag": etag, "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": reset}
+        if username == "alice" and "page=2" not in url.query:
+            port = self.server.server_address[1]
+            headers["Link"] = f'<http://127.0.0.1:{port}/users/alice/repos?page=2>; rel="next"'
+            page = [
+                repo("alice", "one", "2024-03-01T00:00:00Z"),
+                repo("alice", "two", "2024-02-01T00:00:00Z"),
+            ]
+            return self.reply(200, page, headers)
+        if username == "alice":
+            return self.reply(200, [repo("alice", "three", "2024-01-01T00:00:00Z")], headers)
+        return self.reply(200, [repo(username, "solo")], headers)
+
+    def reply(self, status, body, headers=None):
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def github_api():
+    """Run the stand-in API on a free local port."""
+    StandInAPI.requests = []
+    StandInAPI.throttle = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sleeps():
+    """Recorded waits of a rate limiter that never actually sleeps."""
+    return []
+
+
+def make_collector(db_session, base_url, sleeps, cls=GitHubCollector):
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    return cls(
+        db_session,
+        token="test-token",
+        base_url=base_url,
+        max_concurrency=4,
+        rate_limiter=RateLimiter(sleep=fake_sleep),
+    )
+
+
+class RecordingGitHubCollector(GitHubCollector):
+    """GitHub collector that keeps persisted items instead of writing them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.persisted = []
+
+    def persist_batch(self, items):
+        self.persisted.extend(items)
+        return len(items)
+
+
+class TestGitHubCollector:
+    """Tests for GitHubCollector."""
+
+    @pytest.mark.asyncio
+    async def test_collects_all_pages(self, db_session, github_api, sleeps):
+        """Test every page is followed and flattened into repository items."""
+        collector = make_collector(db_session, github_api, sleeps)
+
+        items = await collector.acollect([(1, "alice"), (2, "bob")])
+
+        assert sorted((i["student_id"], i["name"]) for i in items) == [
+            (1, "one"),
+            (1, "three"),
+            (1, "two"),
+            (2, "solo"),
+        ]
+        assert all(collector.validate(item) for item in items)
+        assert collector.stats.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_second_run_is_conditional(self, db_session, github_api, sleeps):
+        """Test stored ETags turn unchanged users into 304s and no items."""
+        students = [(1, "alice"), (2, "bob")]
+        first = make_collector(db_session, github_api, sleeps, RecordingGitHubCollector)
+        await CollectorPipeline(first).arun(students=students)
+
+        collector = make_collector(db_session, github_api, sleeps, RecordingGitHubCollector)
+        report = await CollectorPipeline(collector).arun(students=students)
+
+        assert collector.persisted == []
+        assert report.collect.items_out == 0
+        assert collector.stats.not_modified == 2
+        assert {r[2] for r in StandInAPI.requests[-2:]} == {'"alice-v1"', '"bob-v1"'}
+
+    @pytest.mark.asyncio
+    async def test_watermark_fetches_only_delta(self, db_session, github_api, sleeps):
+        """Test paging stops at the watermark and only newer repos are yielded."""
+        state = {
+            "entity": "repos:alice",
+            "watermark": "2024-02-15T00:00:00Z",
+            "etag": '"stale"',
+            "page_token": None,
+        }
+        crud_collector_sync_state.save_states(db_session, "github", [state])
+        collector = make_collector(db_session, github_api, sleeps, RecordingGitHubCollector)
+
+        await CollectorPipeline(collector).arun(students=[(1, "alice")])
+
+        assert [item["name"] for item in collector.persisted] == ["one"]
+        assert collector.stats.requests == 1
+        state = crud_collector_sync_state.get_states(db_session, "github")["repos:alice"]
+        assert (state.watermark, state.etag, state.page_token) == ("2024-03-01T00:00:00Z", '"alice-v1"', None)
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_page_token(self, db_session, github_api, sleeps):
+        """Test an interrupted fetch continues from its last committed page."""
+        page_two = f"{github_api}/users/alice/repos?page=2"
+        state = {"entity": "repos:alice", "watermark": None, "etag": None, "page_token": page_two}
+        crud_collector_sync_state.save_states(db_session, "github", [state])
+        collector = make_collector(db_session, github_api, sleeps, RecordingGitHubCollector)
+
+        await CollectorPipeline(collector).arun(students=[(1, "alice")])
+
+        assert [item["name"] for item in collector.persisted] == ["three"]
+        assert [r[:2] for r in StandInAPI.requests] == [("/users/alice/repos", "page=2")]
+        state = crud_collector_sync_state.get_states(db_session, "github")["repos:alice"]
+        assert state.page_token is None
+
+    @pytest.mark.asyncio
+    async def test_run_is_recorded(self, db_session, github_api, sleeps):
+        """Test each pipeline run stores its counts and request stats."""
+        collector = make_collector(db_session, github_api, sleeps, RecordingGitHubCollector)
+
+        await CollectorPipeline(collector).arun(students=[(1, "alice"), (3, "ghost")])
+
+        run = crud_collector_sync_run.get_latest(db_session, "github")
+        assert run.status == "succeeded"
+        assert run.finished_at is not None
+        assert (run.items_collected, run.items_persisted, run.checkpoints) == (3, 3, 2)
+        assert run.stats["collector"]["not_found"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_rate_limit_reset(self, db_session, github_api, sleeps):
+        """Test an exhausted quota pauses until the reset and then retries."""
+        StandInAPI.throttle = {"bob"}
+        collector = make_collector(db_session, github_api, sleeps)
+
+        items = await collector.acollect([(2, "bob")])
+
+        assert [i["name"] for i in items] == ["solo"]
+        assert collector.stats.retries == 1
+        assert collector.stats.rate_limit_waits == 1
+        assert 55 < sleeps[0] <= 60
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_skipped(self, db_session, github_api, sleeps):
+        """Test a 404 neither fails the run nor yields items."""
+        collector = make_collector(db_session, github_api, sleeps)
+
+        items = await collector.acollect([(3, "ghost"), (2, "bob")])
+
+        assert [i["student_id"] for i in items] == [2]
+        assert collector.stats.not_found == 1
+        assert collector.stats.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_pipeline_enriches_registered_projects(self, db_session, kpi_data, github_api, sleeps):
+        """Test streamed repositories update only the owner's matching project."""
+        student, other = db_session.query(Student).order_by(Student.id).limit(2)
+        mine = StudentProject(
+            student_id=student.id,
+            project_name="Solo",
+            github_url="https://github.com/bob/solo",
+            technologies_used=["FastAPI"],
+            academic_session_id=kpi_data["term"].id,
+        )
+        theirs = StudentProject(
+            student_id=other.id,
+            project_name="Copy",
+            github_url="https://github.com/bob/solo",
+            academic_session_id=kpi_data["term"].id,
+        )
+        db_session.add_all([mine, theirs])
+        db_session.commit()
+        collector = make_collector(db_session, github_api, sleeps)
+
+        report = await CollectorPipeline(collector, batch_size=2).arun(
+            students=[(student.id, "bob"), (student.id, "alice")]
+        )
+
+        db_session.expire_all()
+        assert report.validate.items_out == 4
+        assert report.persist.items_out == 1
+        assert mine.technologies_used == ["FastAPI", "Python"]
+        assert theirs.technologies_used == []
+
+    def test_rate_limiter_pauses_at_reserve(self):
+        """Test the gate closes once remaining quota reaches the reserve."""
+        limiter = RateLimiter(reserve=10, clock=lambda: 1000.0)
+
+        limiter.update({"X-RateLimit-Remaining": "11", "X-RateLimit-Reset": "1300"})
+        assert limiter.resume_at == 0.0
+
+        limiter.update({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1300"})
+        assert limiter.resume_at == 1300.0
@@ -0,0 +1,200 @@
+"""Tests for KPI snapshot upserts, history and rollups."""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.crud.kpi import HISTORY_KEY, crud_kpi_history
+from app.db import partitions
+from app.models import (
+    AcademicSession,
+    Department,
+    KPIDailyRollup,
+    KPISessionRollup,
+    KPISnapshot,
+    KPISnapshotHistory,
+)
+from app.services.calculators.batch_engine import BatchKPIEngine
+from app.tasks import kpi_tasks
+
+
+def _record(department_id, session_id, metric="average_course_rating", value=4.0):
+    return {
+        "department_id": department_id,
+        "academic_session_id": session_id,
+        "pillar_name": "academic_quality",
+        "metric_name": metric,
+        "calculated_value": value,
+        "target_value": 4.0,
+        "percentage_achieved": value * 25,
+        "status": "meets" if value >= 4.0 else "below",
+    }
+
+
+def _history(department_id, session_id, created_at, value, metric="average_course_rating"):
+    return KPISnapshotHistory(**_record(department_id, session_id, metric, value), created_at=created_at)
+
+
+class TestSnapshotUpsert:
+    """Tests for persisting snapshots."""
+
+    def test_latest_value_per_key(self, db_session, kpi_data):
+        """Test rewriting a key updates its row instead of adding one."""
+        engine = BatchKPIEngine(db_session)
+        dept, term = kpi_data["cs"].id, kpi_data["term"].id
+
+        engine.persist_records([_record(dept, term, value=3.0)])
+        engine.persist_records([_record(dept, term, value=4.5)])
+
+        snapshots = db_session.query(KPISnapshot).all()
+        assert [(s.calculated_value, s.status) for s in snapshots] == [(4.5, "meets")]
+
+    def test_history_records_changes_only(self, db_session, kpi_data):
+        """Test unchanged recomputations add no history rows."""
+        engine = BatchKPIEngine(db_session)
+        dept, term = kpi_data["cs"].id, kpi_data["term"].id
+
+        engine.persist_records([_record(dept, term, value=3.0), _record(dept, term, "feedback_response_rate")])
+        engine.persist_records([_record(dept, term, value=3.0), _record(dept, term, "feedback_response_rate")])
+        engine.persist_records([_record(dept, term, value=3.5), _record(dept, term, "feedback_response_rate")])
+
+        history = db_session.query(KPISnapshotHistory).order_by(KPISnapshotHistory.id).all()
+        assert [(h.metric_name, h.calculated_value) for h in history] == [
+            ("average_course_rating", 3.0),
+            ("feedback_response_rate", 4.0),
+            ("average_course_rating", 3.5),
+        ]
+
+    def test_dropped_metrics_are_removed(self, db_session, kpi_data):
+        """Test metrics no longer computed for a written pillar are deleted."""
+        engine = BatchKPIEngine(db_session)
+        dept, term = kpi_data["cs"].id, kpi_data["term"].id
+
+        engine.persist_records([_record(dept, term), _record(dept, term, "retired_metric")])
+        engine.persist_records([_record(dept, term)])
+
+        assert [s.metric_name for s in db_session.query(KPISnapshot)] == ["average_course_rating"]
+
+    def test_dropped_metrics_are_removed_per_department(self, db_session, kpi_data):
+        """Test a metric kept by one department is still removed from another."""
+        engine = BatchKPIEngine(db_session)
+        cs, se, term = kpi_data["cs"].id, kpi_data["se"].id, kpi_data["term"].id
+
+        engine.persist_records([_record(cs, term), _record(se, term), _record(se, term, "retired_metric")])
+        engine.persist_records([_record(cs, term, "retired_metric"), _record(se, term)])
+
+        rows = db_session.query(KPISnapshot).order_by(KPISnapshot.department_id, KPISnapshot.metric_name)
+        assert [(s.department_id, s.metric_name) for s in rows] == [
+            (cs, "retired_metric"),
+            (se, "average_course_rating"),
+        ]
+
+    def test_partitions_skipped_off_postgresql(self, db_session):
+        """Test partition management is a no-op on other databases."""
+        assert partitions.ensure_snapshot_partitions(db_session.connection(), [1, 2]) == []
+        assert partitions.partition_name(7) == "kpi_snapshots_s7"
+
+
+class TestHistoryRollup:
+    """Tests for rolling history up into daily and session summaries."""
+
+    @pytest.fixture
+    def history(self, db_session, kpi_data):
+        """Two old days and one recent day of history for one metric."""
+        dept, term = kpi_data["cs"].id, kpi_data["term"].id
+        db_session.add_all(
+            [
+                _history(dept, term, datetime(2024, 1, 1, 8), 2.0),
+                _history(dept, term, datetime(2024, 1, 1, 20), 4.0),
+                _history(dept, term, datetime(2024, 1, 2, 9), 3.0),
+                _history(dept, term, datetime(2024, 3, 1, 9), 5.0),
+            ]
+        )
+        db_session.commit()
+        return kpi_data
+
+    def test_rollup_summarizes_and_deletes(self, db_session, history):
+        """Test old rows become daily and session rollups and are removed."""
+        rolled = crud_kpi_history.rollup(db_session, before=datetime(2024, 2, 1))
+
+        assert rolled == 3
+        assert [h.calculated_value for h in db_session.query(KPISnapshotHistory)] == [5.0]
+        daily = db_session.query(KPIDailyRollup).order_by(KPIDailyRollup.day).all()
+        assert [(d.day, d.samples, d.min_value, d.max_value, d.avg_value) for d in daily] == [
+            (date(2024, 1, 1), 2, 2.0, 4.0, 3.0),
+            (date(2024, 1, 2), 1, 3.0, 3.0, 3.0),
+        ]
+        session = db_session.query(KPISessionRollup).one()
+        assert (session.first_day, session.last_day, session.samples) == (date(2024, 1, 1), date(2024, 1, 2), 3)
+        assert (session.min_value, session.max_value, session.avg_value) == (2.0, 4.0, 3.0)
+
+    def test_rollup_merges_into_existing_day(self, db_session, history):
+        """Test rows of an already rolled up day are merged, not duplicated."""
+        crud_kpi_history.rollup(db_session, before=datetime(2024, 2, 1))
+        db_session.add(_history(history["cs"].id, history["term"].id, datetime(2024, 1, 1, 23), 6.0))
+        db_session.commit()
+
+        crud_kpi_history.rollup(db_session, before=datetime(2024, 2, 1))
+
+        day = db_session.query(KPIDailyRollup).filter_by(day=date(2024, 1, 1)).one()
+        assert (day.samples, day.min_value, day.max_value, day.avg_value) == (3, 2.0, 6.0, 4.0)
+        assert db_session.query(KPISessionRollup).one().samples == 4
+
+    def test_nothing_to_roll_up(self, db_session, history):
+        """Test a cutoff before every row leaves the history alone."""
+        assert crud_kpi_history.rollup(db_session, before=datetime(2023, 1, 1)) == 0
+        assert db_session.query(KPISnapshotHistory).count() == 4
+
+    def test_task_keeps_recent_days(self, db_session, kpi_data, monkeypatch):
+        """Test the task only rolls up rows older than the raw retention."""
+        monkeypatch.setattr(kpi_tasks, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+        db_session.add_all(
+            [
+                _history(kpi_data["cs"].id, kpi_data["term"].id, datetime(2020, 1, 1), 1.0),
+                _history(kpi_data["cs"].id, kpi_data["term"].id, datetime.utcnow(), 2.0),
+            ]
+        )
+        db_session.commit()
+
+        assert kpi_tasks.rollup_kpi_history(raw_days=30) == 1
+
+
+class TestTrend:
+    """Tests for trend queries across rollups and raw history."""
+
+    @pytest.mark.asyncio
+    async def test_trend_combines_rollups_and_history(self, async_db_session):
+        """Test rolled up days and raw days form one ordered series."""
+        db = async_db_session
+        dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+        term = AcademicSession(
+            session_name="2023/2024", start_date="2023-09-01", end_date="2024-02-28", semester=1
+        )
+        db.add_all([dept, term])
+        await db.flush()
+        db.add_all(
+            [
+                KPIDailyRollup(
+                    day=date(2024, 1, 1),
+                    samples=2,
+                    min_value=2.0,
+                    max_value=4.0,
+                    avg_value=3.0,
+                    avg_percentage=75.0,
+                    **{name: _record(dept.id, term.id)[name] for name in HISTORY_KEY},
+                ),
+                _history(dept.id, term.id, datetime(2024, 3, 1, 9), 5.0),
+                _history(dept.id, term.id, datetime(2024, 3, 1, 10), 3.0),
+                _history(dept.id, term.id, datetime(2024, 3, 1, 11), 1.0, metric="feedback_response_rate"),
+                _history(dept.id, term.id, datetime(2023, 12, 1), 9.0),
+            ]
+        )
+        await db.commit()
+
+        points = await crud_kpi_history.aget_trend(db, dept.id, "average_course_rating", since=date(2023, 12, 2))
+
+        assert [(p["day"], p["samples"], p["avg_value"]) for p in points] == [
+            (date(2024, 1, 1), 2, 3.0),
+            (date(2024, 3, 1), 2, 4.0),
+        ]
@@ -0,0 +1,124 @@
+"""Tests for the KPI Celery tasks."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import KPISnapshot
+from app.services.calculators.batch_engine import BatchKPIEngine
+from app.tasks import kpi_tasks
+
+
+@pytest.fixture
+def task_sessions(db_session, monkeypatch):
+    """Point the tasks' session factory at the test database."""
+    monkeypatch.setattr(kpi_tasks, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+
+
+class TestBatchKeys:
+    """Tests for subtask batching."""
+
+    def test_batches_preserve_order(self):
+        """Test keys are split into ordered, JSON-friendly batches."""
+        keys = [(1, 1, "a"), (1, 1, "b"), (1, 2, "a"), (2, 1, "a"), (2, 1, "b")]
+
+        batches = kpi_tasks.batch_keys(keys, 2)
+
+        assert batches == [
+            [[1, 1, "a"], [1, 1, "b"]],
+            [[1, 2, "a"], [2, 1, "a"]],
+            [[2, 1, "b"]],
+        ]
+
+    def test_zero_size_means_one_key_per_batch(self):
+        """Test a non-positive batch size falls back to single keys."""
+        assert kpi_tasks.batch_keys([(1, 1, "a"), (1, 1, "b")], 0) == [
+            [[1, 1, "a"]],
+            [[1, 1, "b"]],
+        ]
+
+
+class TestKPIPipeline:
+    """Tests for the fan-out pipeline tasks."""
+
+    def test_subtasks_and_callback_match_engine(self, db_session, kpi_data, task_sessions):
+        """Test merging per-key results writes the same rows as a full run."""
+        keys = BatchKPIEngine(db_session).keys()
+        results = [kpi_tasks.compute_kpi_keys(batch) for batch in kpi_tasks.batch_keys(keys, 3)]
+
+        written = kpi_tasks.write_kpi_snapshots(results)
+
+        rows = {
+            (s.department_id, s.metric_name): s.calculated_value
+            for s in db_session.query(KPISnapshot)
+        }
+        expected = BatchKPIEngine(db_session).calculate_all()
+        assert written == len(expected) == len(rows)
+        for record in BatchKPIEngine.to_records(expected):
+            assert rows[(record["department_id"], record["metric_name"])] == pytest.approx(
+                record["calculated_value"]
+            )
+
+    def test_callback_keeps_snapshots_written_after_dispatch(self, db_session, kpi_data, task_sessions):
+        """Test stale pipeline results do not overwrite newer snapshots."""
+        records = BatchKPIEngine.to_records(BatchKPIEngine(db_session).calculate_all())
+        BatchKPIEngine(db_session).persist_records(records)
+        stale = [dict(record, calculated_value=-1.0) for record in records]
+
+        kpi_tasks.write_kpi_snapshots([stale], dispatched_at=datetime(2000, 1, 1).isoformat())
+        assert -1.0 not in {s.calculated_value for s in db_session.query(KPISnapshot)}
+
+        kpi_tasks.write_kpi_snapshots([stale], dispatched_at=datetime(2100, 1, 1).isoformat())
+        db_session.expire_all()
+        assert {s.calculated_value for s in db_session.query(KPISnapshot)} == {-1.0}
+
+    @pytest.fixture
+    def dispatched(self, monkeypatch):
+        """Capture the chord recompute_all would dispatch."""
+        dispatched = {}
+
+        class FakeResult:
+            id = "chord-id"
+
+        def fake_chord(header):
+            dispatched["header"] = list(header)
+
+            def run(callback):
+                dispatched["callback"] = callback
+                return FakeResult()
+
+            return run
+
+        monkeypatch.setattr(kpi_tasks, "chord", fake_chord)
+        return dispatched
+
+    def test_recompute_all_dispatches_chord(self, db_session, kpi_data, task_sessions, dispatched):
+        """Test one subtask is queued per key batch, with the writer as callback."""
+        result = kpi_tasks.recompute_all_kpis(keys_per_task=4)
+
+        # 2 departments x 1 session x 4 pillars
+        assert result == "chord-id"
+        assert len(dispatched["header"]) == 2
+        assert dispatched["header"][0].task == "kpi.compute_keys"
+        assert dispatched["callback"].task == "kpi.write_snapshots"
+        assert datetime.fromisoformat(dispatched["callback"].kwargs["dispatched_at"])
+
+    def test_recompute_all_from_fresh_views(
+        self, db_session, kpi_data, task_sessions, dispatched, monkeypatch
+    ):
+        """Test the views are refreshed before subtasks are told to read them."""
+        refreshed = []
+        monkeypatch.setattr(kpi_tasks, "refresh_aggregate_views", lambda: refreshed.append(1))
+
+        kpi_tasks.recompute_all_kpis(keys_per_task=4, from_views=True)
+
+        assert refreshed == [1]
+        assert all(task.kwargs == {"use_views": True} for task in dispatched["header"])
+
+    def test_nightly_recompute_reads_views(self):
+        """Test the scheduled full recompute refreshes and reads the views."""
+        schedule = kpi_tasks.celery_app.conf.beat_schedule
+
+        assert schedule["recompute-all-kpis"]["kwargs"] == {"from_views": True}
+        assert "kpi.refresh_aggregate_views" not in {entry["task"] for entry in schedule.values()}
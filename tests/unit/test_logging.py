@@ -0,0 +1,154 @@
+"""Tests for structured, queue-backed logging."""
+
+import json
+import logging
+import queue
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import logging as app_logging
+from app.core.config import settings
+from app.core.logging import (
+    ContextQueueHandler,
+    JSONFormatter,
+    LogContextMiddleware,
+    SamplingFilter,
+    bind_log_context,
+    log_context,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(name="app.test", level=logging.INFO, msg="hello %s", args=("world",), exc_info=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, exc_info)
+
+
+class TestSamplingFilter:
+    """Tests for per-logger sampling."""
+
+    def test_most_specific_logger_wins(self):
+        """Test child loggers inherit the closest configured rate."""
+        sampler = SamplingFilter({"app": 0.5, "app.api.students": 0.1})
+
+        assert sampler.rate("app.api.students.list") == 0.1
+        assert sampler.rate("app.core.cache") == 0.5
+        assert sampler.rate("httpx") == 1.0
+
+    def test_keeps_warnings(self):
+        """Test only records below WARNING are sampled."""
+        sampler = SamplingFilter({"app": 0.1}, rng=lambda: 0.5)
+
+        assert sampler.filter(make_record(level=logging.INFO)) is False
+        assert sampler.filter(make_record(level=logging.WARNING)) is True
+
+    def test_parses_settings(self, monkeypatch):
+        """Test the rates setting is parsed into a mapping."""
+        monkeypatch.setattr(settings, "LOG_SAMPLE_RATES", "httpx=0.01, app.api=0.1,")
+
+        assert settings.log_sample_rates == {"httpx": 0.01, "app.api": 0.1}
+
+
+class TestContextQueueHandler:
+    """Tests for the enqueueing handler."""
+
+    def test_captures_message_and_context(self):
+        """Test the queued record needs nothing from the calling thread."""
+        handler = ContextQueueHandler(queue.Queue())
+
+        with log_context(request_id="abc"):
+            bind_log_context(user_id=7)
+            handler.handle(make_record())
+
+        record = handler.queue.get_nowait()
+        assert (record.msg, record.args) == ("hello world", None)
+        assert record.context == {"request_id": "abc", "user_id": 7}
+
+    def test_formats_exception_in_caller(self):
+        """Test tracebacks are rendered before the record is queued."""
+        handler = ContextQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            handler.handle(make_record(level=logging.ERROR, exc_info=(type(e), e, e.__traceback__)))
+
+        record = handler.queue.get_nowait()
+        payload = json.loads(JSONFormatter().format(record))
+        assert record.exc_info is None
+        assert "ValueError: boom" in payload["exception"]
+
+    def test_drops_when_full(self):
+        """Test a full queue drops records instead of blocking."""
+        handler = ContextQueueHandler(queue.Queue(maxsize=1))
+
+        for _ in range(3):
+            handler.handle(make_record())
+
+        assert handler.dropped == 2
+
+
+class TestSetupLogging:
+    """Tests for the logging modes."""
+
+    @pytest.fixture(autouse=True)
+    def restore(self):
+        """Remove the handler installed by the test."""
+        yield
+        shutdown_logging()
+
+    def test_queue_mode_writes_from_listener(self, monkeypatch, capsys):
+        """Test records are written by the listener as JSON with their context."""
+        monkeypatch.setattr(settings, "LOG_QUEUE", True)
+        monkeypatch.setattr(settings, "LOG_FORMAT", "json")
+        setup_logging()
+
+        with log_context(request_id="r-1"):
+            logging.getLogger("app.test").warning("queued %d", 1)
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in capsys.readouterr().err.splitlines() if "queued" in line]
+        assert lines == [
+            {**lines[0], "message": "queued 1", "logger": "app.test", "request_id": "r-1"}
+        ]
+
+    def test_setup_replaces_previous_handler(self, monkeypatch):
+        """Test calling setup twice leaves one handler installed."""
+        monkeypatch.setattr(settings, "LOG_QUEUE", True)
+        setup_logging()
+        first = app_logging._handler
+        setup_logging()
+
+        root = logging.getLogger()
+        assert first not in root.handlers
+        assert app_logging._handler in root.handlers
+
+
+class TestLogContextMiddleware:
+    """Tests for request context binding."""
+
+    def test_binds_request_id_and_route(self):
+        """Test records logged by a route carry the request id, route and user."""
+        captured = []
+        app = FastAPI()
+        app.add_middleware(LogContextMiddleware)
+
+        @app.get("/students/{student_id}")
+        async def read_student(student_id: int):
+            bind_log_context(user_id=3)
+            captured.append(app_logging.current_log_context())
+            return {}
+
+        response = TestClient(app).get("/students/5", headers={"X-Request-ID": "req-42"})
+
+        assert response.headers["x-request-id"] == "req-42"
+        assert captured == [
+            {
+                "request_id": "req-42",
+                "method": "GET",
+                "path": "/students/5",
+                "route": "/students/{student_id}",
+                "user_id": 3,
+            }
+        ]
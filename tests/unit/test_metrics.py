@@ -0,0 +1,118 @@
+"""Tests for request and database metrics."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, exc, text
+
+from app.core.metrics import PrometheusMiddleware, metrics_endpoint
+from app.db.instrumentation import TimedQueuePool, instrument_engine, track_queries
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    """File-backed SQLite engine with a one-connection timed pool."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'metrics.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(pooled_engine):
+    """App whose item route runs one query per requested row."""
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+    app.add_route("/metrics", metrics_endpoint)
+
+    @app.get("/items/{count}")
+    def read_items(count: int):
+        with pooled_engine.connect() as conn:
+            return [conn.execute(text("SELECT :n"), {"n": n}).scalar() for n in range(count)]
+
+    return TestClient(app)
+
+
+class TestPrometheusMiddleware:
+    """Tests for per-request metrics."""
+
+    def test_records_route_template_and_queries(self, client):
+        """Test requests are labelled by route and charged their statements."""
+        route = {"method": "GET", "route": "/items/{count}"}
+        before = sample("http_request_db_queries_sum", **route)
+        requests = sample("http_requests_total", status="200", **route)
+
+        client.get("/items/3")
+        client.get("/items/4")
+
+        assert sample("http_requests_total", status="200", **route) == requests + 2
+        assert sample("http_request_db_queries_sum", **route) == before + 7
+        assert sample("http_response_size_bytes_sum", **route) > 0
+        assert sample("http_requests_in_progress", method="GET") == 0
+
+    def test_unmatched_paths_share_a_label(self, client):
+        """Test unknown paths do not create a label per URL."""
+        before = sample("http_requests_total", method="GET", route="<unmatched>", status="404")
+
+        client.get("/missing/1")
+        client.get("/missing/2")
+
+        assert sample("http_requests_total", method="GET", route="<unmatched>", status="404") == before + 2
+
+    def test_metrics_endpoint(self, client):
+        """Test metrics render in the Prometheus text format."""
+        client.get("/items/1")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/items/{count}"}' in response.text
+
+
+class TestDatabaseInstrumentation:
+    """Tests for statement and pool timing."""
+
+    def test_tracks_statements_of_the_block(self, pooled_engine):
+        """Test only statements inside the tracked block are counted."""
+        with pooled_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with track_queries() as stats:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+        assert stats.count == 2
+        assert stats.seconds > 0
+
+    def test_failed_statement_is_not_counted(self, pooled_engine):
+        """Test an error does not leave a dangling timer."""
+        with pooled_engine.connect() as conn, track_queries() as stats:
+            with pytest.raises(exc.OperationalError):
+                conn.execute(text("SELECT * FROM missing"))
+            conn.execute(text("SELECT 1"))
+            assert conn.info["query_started"] == []
+
+        assert stats.count == 1
+
+    def test_records_checkout_wait_and_timeouts(self, pooled_engine):
+        """Test checkouts are timed and an exhausted pool is counted."""
+        checkouts = sample("db_pool_checkout_seconds_count", pool="sync")
+        timeouts = sample("db_pool_checkout_timeouts_total", pool="sync")
+
+        with pooled_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                pooled_engine.connect()
+
+        assert sample("db_pool_checkout_seconds_count", pool="sync") == checkouts + 2
+        assert sample("db_pool_checkout_timeouts_total", pool="sync") == timeouts + 1
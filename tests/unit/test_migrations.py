@@ -0,0 +1,23 @@
+"""Tests keeping Alembic migrations in line with the models."""
+
+import pytest
+
+import app.models  # noqa: F401  (register every table)
+from app.db.base import Base
+
+
+class TestAggregationIndexes:
+    """Tests for the KPI aggregation index migration."""
+
+    @pytest.mark.parametrize(
+        "revision",
+        ["b7d2c41e9f03", "f1c3a9d2e7b4", "a7e2c94b1d60", "c3f8a61d5e27", "e5b9d3a7c418"],
+    )
+    def test_indexes_match_models(self, load_migration, revision):
+        """Test every migrated index is also declared on its model."""
+        migration = load_migration(revision)
+
+        for name, table, columns in migration.INDEXES:
+            indexes = {index.name: index for index in Base.metadata.tables[table].indexes}
+            assert name in indexes, name
+            assert [column.name for column in indexes[name].columns] == columns
@@ -0,0 +1,145 @@
+"""Tests for keyset pagination."""
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.crud.base import CRUDBase
+from app.crud.pagination import CountMode, decode_cursor, encode_cursor
+from app.crud.student import crud_student
+from app.models import Department, Student
+from app.schemas.student import StudentPage, StudentResponse, student_page_adapter
+
+
+def _seed(db_session) -> list:
+    first = Department(name="Computer Science", code="CS", faculty="Engineering")
+    second = Department(name="Mathematics", code="MTH", faculty="Science")
+    db_session.add_all([first, second])
+    db_session.flush()
+    for number in range(1, 8):
+        db_session.add(
+            Student(
+                matric_number=f"CSC/2021/{number:03d}",
+                first_name="Test",
+                last_name="Student",
+                email=f"student{number}@example.com",
+                department_id=second.id if number % 2 else first.id,
+                level=300,
+            )
+        )
+    db_session.commit()
+    return [first, second]
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the values it was built from."""
+        cursor = encode_cursor([3, 42])
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, 2) == [3, 42]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor!", encode_cursor([1])])
+    def test_invalid_cursor(self, cursor):
+        """Test malformed or wrongly sized cursors are rejected."""
+        with pytest.raises(ValidationException):
+            decode_cursor(cursor, 2)
+
+
+class TestGetPage:
+    """Tests for CRUDBase.get_page."""
+
+    def test_walks_all_pages_in_keyset_order(self, db_session):
+        """Test following next_cursor visits every row exactly once."""
+        _seed(db_session)
+        expected = [
+            s.id
+            for s in sorted(
+                db_session.query(Student).all(), key=lambda s: (s.department_id, s.id)
+            )
+        ]
+
+        seen, cursor = [], None
+        while True:
+            page = crud_student.get_page(db_session, cursor=cursor, limit=3)
+            seen.extend(s.id for s in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    def test_filters_and_exact_count(self, db_session):
+        """Test filters apply to both the page and the total."""
+        first, _ = _seed(db_session)
+        filters = [Student.department_id == first.id]
+
+        page = crud_student.get_page(
+            db_session, limit=2, filters=filters, count=CountMode.EXACT
+        )
+
+        assert page.total == 3
+        assert page.total_is_estimate is False
+        assert all(s.department_id == first.id for s in page.items)
+        assert page.next_cursor is not None
+
+    def test_estimate_falls_back_to_exact_count(self, db_session):
+        """Test estimates are exact on databases without planner stats."""
+        _seed(db_session)
+
+        page = crud_student.get_page(db_session, limit=2, count=CountMode.ESTIMATE)
+
+        assert page.total == 7
+        assert page.total_is_estimate is False
+
+    def test_skip_without_cursor(self, db_session):
+        """Test offset paging still works when no cursor is given."""
+        _seed(db_session)
+        crud = CRUDBase(Student)
+
+        page = crud.get_page(db_session, skip=5, limit=5)
+
+        assert [s.id for s in page.items] == [6, 7]
+        assert page.next_cursor is None
+
+    def test_estimate_from_plan(self):
+        """Test the planner row estimate is read from EXPLAIN JSON."""
+        plan = '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]'
+
+        assert CRUDBase._estimate_from_plan(plan) == 1234
+        assert CRUDBase._estimate_from_plan("[]") is None
+
+
+class TestGetPageRows:
+    """Tests for CRUDBase.get_page_rows."""
+
+    def test_matches_get_page(self, db_session):
+        """Test row pages follow the same keyset order and cursors as ORM pages."""
+        first, _ = _seed(db_session)
+        filters = [Student.department_id == first.id]
+
+        orm_page = crud_student.get_page(db_session, limit=2, filters=filters, count=CountMode.EXACT)
+        row_page = crud_student.get_page_rows(
+            db_session, [Student.first_name], limit=2, filters=filters, count=CountMode.EXACT
+        )
+
+        assert [row["id"] for row in row_page.items] == [s.id for s in orm_page.items]
+        # Keyset columns are selected for the cursor even when not requested
+        assert set(row_page.items[0].keys()) == {"first_name", "department_id", "id"}
+        assert (row_page.next_cursor, row_page.total) == (orm_page.next_cursor, 3)
+
+    def test_serializes_like_the_response_model(self, db_session):
+        """Test the typed fast path renders the same document as the ORM path."""
+        _seed(db_session)
+        columns = [getattr(Student, name) for name in StudentResponse.model_fields]
+        orm_page = crud_student.get_page(db_session, limit=5)
+        row_page = crud_student.get_page_rows(db_session, columns, limit=5)
+
+        def payload(page):
+            return {"skip": 0, "limit": 5, "next_cursor": page.next_cursor, "items": page.items}
+
+        expected = StudentPage.model_validate(payload(orm_page), from_attributes=True)
+        body = student_page_adapter.dump_json(student_page_adapter.validate_python(payload(row_page)))
+
+        assert body == expected.model_dump_json().encode()
@@ -0,0 +1,135 @@
+"""Tests for slow query logging, N+1 detection and query budgets."""
+
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.metrics import QueryBudgetMiddleware
+from app.db.instrumentation import (
+    QueryBudgetExceeded,
+    check_query_budget,
+    instrument_engine,
+    query_budget,
+    statement_shape,
+    track_queries,
+)
+from app.models import Student
+
+
+@pytest.fixture
+def instrumented(db_session, kpi_data):
+    """Session whose engine reports statements to the instrumentation."""
+    instrument_engine(db_session.get_bind())
+    return db_session
+
+
+@pytest.fixture
+def client(instrumented):
+    """App listing students with and without eager loading."""
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware)
+
+    def get_session():
+        instrumented.expire_all()
+        return instrumented
+
+    @app.get("/lazy")
+    @query_budget(3)
+    def lazy(db=Depends(get_session)):
+        return [len(student.projects) for student in db.scalars(select(Student))]
+
+    @app.get("/eager")
+    @query_budget(3)
+    def eager(db=Depends(get_session)):
+        statement = select(Student).options(selectinload(Student.projects))
+        return [len(student.projects) for student in db.scalars(statement)]
+
+    return TestClient(app)
+
+
+class TestStatementShape:
+    """Tests for statement normalization."""
+
+    def test_in_lists_share_a_shape(self):
+        """Test IN lists of any length normalize alike."""
+        assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == statement_shape(
+            "SELECT *\n  FROM t WHERE id IN (?)"
+        )
+        assert statement_shape("SELECT * FROM t WHERE id IN (%(id_1)s, %(id_2)s)") == (
+            "SELECT * FROM t WHERE id IN (...)"
+        )
+
+    def test_multi_row_values_share_a_shape(self):
+        """Test batched VALUES clauses normalize to one row."""
+        assert statement_shape("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)") == (
+            "INSERT INTO t (a, b) VALUES (...)"
+        )
+
+
+class TestQueryBudgets:
+    """Tests for per-route budgets and N+1 detection."""
+
+    def test_lazy_loading_exceeds_budget(self, client, monkeypatch, caplog):
+        """Test a relationship loaded per row fails the strict budget and is named."""
+        monkeypatch.setattr(settings, "N_PLUS_ONE_THRESHOLD", 3)
+
+        with caplog.at_level(logging.WARNING), pytest.raises(QueryBudgetExceeded, match="/lazy executed 5"):
+            client.get("/lazy")
+
+        assert "Possible N+1 query on /lazy: executed 4 times" in caplog.text
+
+    def test_eager_loading_within_budget(self, client):
+        """Test the same listing with selectinload stays within budget."""
+        response = client.get("/eager")
+
+        assert response.status_code == 200
+        assert sorted(response.json()) == [0, 0, 1, 1]
+
+    def test_lenient_mode_logs(self, caplog):
+        """Test budget overruns only log outside strict mode."""
+        with track_queries() as stats:
+            pass
+        stats.count = 7
+
+        with caplog.at_level(logging.WARNING):
+            check_query_budget(stats, "/students", budget=5, strict=False)
+
+        assert "/students executed 7 statements, budget is 5" in caplog.text
+
+    def test_nested_blocks_are_both_charged(self, instrumented):
+        """Test statements count towards every enclosing tracked block."""
+        with track_queries() as outer:
+            instrumented.scalars(select(Student)).all()
+            with track_queries() as inner:
+                instrumented.scalars(select(Student)).all()
+
+        assert (outer.count, inner.count) == (2, 1)
+
+
+class TestSlowQueryLog:
+    """Tests for slow statement logging."""
+
+    def test_logs_statement_and_parameters(self, instrumented, monkeypatch, caplog):
+        """Test statements above the threshold are logged with their parameters."""
+        monkeypatch.setattr(settings, "SLOW_QUERY_SECONDS", 1e-9)
+
+        with caplog.at_level(logging.WARNING, logger="app.db.instrumentation"):
+            instrumented.scalars(select(Student).where(Student.level == 300)).all()
+
+        assert "Slow query" in caplog.text
+        assert "FROM students WHERE students.level = ?" in caplog.text
+        assert "parameters=(300," in caplog.text
+
+    def test_disabled_threshold(self, instrumented, monkeypatch, caplog):
+        """Test a zero threshold turns the log off."""
+        monkeypatch.setattr(settings, "SLOW_QUERY_SECONDS", 0)
+
+        with caplog.at_level(logging.WARNING, logger="app.db.instrumentation"):
+            instrumented.scalars(select(Student)).all()
+
+        assert "Slow query" not in caplog.text
@@ -0,0 +1,181 @@
+"""Tests for KPI report generation."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from openpyxl import load_workbook
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints import reports
+from app.core.exceptions import ResourceNotFoundException
+from app.models.kpi import KPISnapshot
+from app.services.reports import kpi_report
+from app.services.reports.kpi_report import ReportFormat, generate_kpi_report, report_key
+from app.services.reports.store import ArtifactStore
+from app.tasks import report_tasks
+
+
+@pytest.fixture
+def snapshots(db_session, kpi_data):
+    """KPI snapshots of two pillars of the first department."""
+    rows = [
+        ("academic_quality", "average_feedback_rating", 4.0, 4.5, 88.89, "meets"),
+        ("academic_quality", "pass_rate", 70.0, 80.0, 87.5, "below"),
+        ("employability", "internship_rate", 25.0, 50.0, 50.0, "below"),
+    ]
+    db_session.add_all(
+        KPISnapshot(
+            academic_session_id=kpi_data["term"].id,
+            department_id=kpi_data["cs"].id,
+            pillar_name=pillar,
+            metric_name=metric,
+            calculated_value=value,
+            target_value=target,
+            percentage_achieved=achieved,
+            status=state,
+        )
+        for pillar, metric, value, target, achieved, state in rows
+    )
+    db_session.commit()
+    return kpi_data
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Artifact store in a temporary directory."""
+    return ArtifactStore(str(tmp_path))
+
+
+class TestReportKey:
+    """Tests for content hashing of report data."""
+
+    def test_same_data_same_key(self, db_session, snapshots):
+        """Test the key only depends on the data."""
+        dept = snapshots["cs"].id
+
+        assert report_key(db_session, dept) == report_key(db_session, dept)
+        assert report_key(db_session, dept) != report_key(db_session, snapshots["se"].id)
+
+    def test_changed_value_changes_key(self, db_session, snapshots):
+        """Test a changed snapshot value produces a new key."""
+        before = report_key(db_session, snapshots["cs"].id)
+        snapshot = db_session.query(KPISnapshot).first()
+        snapshot.calculated_value += 1
+        db_session.commit()
+
+        assert report_key(db_session, snapshots["cs"].id) != before
+
+    def test_recomputed_snapshots_keep_key(self, db_session, snapshots):
+        """Test snapshots rewritten with the same values keep the key."""
+        before = report_key(db_session, snapshots["cs"].id)
+        columns = (
+            "academic_session_id", "department_id", "pillar_name", "metric_name",
+            "calculated_value", "target_value", "percentage_achieved", "status",
+        )
+        rows = [
+            {column: getattr(snapshot, column) for column in columns}
+            for snapshot in db_session.query(KPISnapshot).all()
+        ]
+        db_session.query(KPISnapshot).delete()
+        db_session.add_all(KPISnapshot(**row) for row in rows)
+        db_session.commit()
+
+        assert report_key(db_session, snapshots["cs"].id) == before
+
+    def test_unknown_department(self, db_session, kpi_data):
+        """Test reports of missing departments are rejected."""
+        with pytest.raises(ResourceNotFoundException):
+            report_key(db_session, 999)
+
+
+class TestGenerateReport:
+    """Tests for rendering and caching artifacts."""
+
+    def test_excel_report(self, db_session, snapshots, store):
+        """Test the workbook holds every snapshot and a pillar summary."""
+        artifact = generate_kpi_report(db_session, snapshots["cs"].id, report_format=ReportFormat.XLSX, store=store)
+
+        assert not artifact.cached
+        assert artifact.rows == 3
+        assert artifact.path == store.path(artifact.key, "xlsx")
+        workbook = load_workbook(artifact.path, read_only=True)
+        rows = list(workbook["Snapshots"].values)
+        assert rows[0][:4] == ("Session", "Semester", "Pillar", "Metric")
+        assert [row[3] for row in rows[1:]] == ["average_feedback_rating", "pass_rate", "internship_rate"]
+        summary = list(workbook["Summary"].values)
+        assert summary[0][0] == "KPI report: Computer Science (CS)"
+        assert summary[4][2:] == ("academic_quality", 2, 88.19, 1)
+        assert summary[5][2:] == ("employability", 1, 50.0, 1)
+
+    def test_pdf_report(self, db_session, snapshots, store):
+        """Test a PDF document is written."""
+        artifact = generate_kpi_report(db_session, snapshots["cs"].id, report_format=ReportFormat.PDF, store=store)
+
+        assert artifact.path.suffix == ".pdf"
+        assert artifact.path.read_bytes().startswith(b"%PDF")
+
+    def test_unchanged_data_is_served_from_store(self, db_session, snapshots, store, monkeypatch):
+        """Test a second request for the same data does not render again."""
+        first = generate_kpi_report(db_session, snapshots["cs"].id, store=store)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("report rendered again")
+
+        monkeypatch.setattr(kpi_report, "_render", fail)
+        second = generate_kpi_report(db_session, snapshots["cs"].id, store=store)
+
+        assert second.cached
+        assert (second.key, second.path) == (first.key, first.path)
+
+    def test_no_temporary_files_left(self, db_session, snapshots, store):
+        """Test only the committed artifact remains in the store."""
+        artifact = generate_kpi_report(db_session, snapshots["cs"].id, store=store)
+
+        assert [path for path in store.root.rglob("*") if path.is_file()] == [artifact.path]
+
+    def test_task_returns_key(self, db_session, snapshots, store, monkeypatch):
+        """Test the Celery task renders through the configured store."""
+        monkeypatch.setattr(report_tasks, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+        monkeypatch.setattr(kpi_report, "ArtifactStore", lambda: store)
+
+        result = report_tasks.generate_kpi_report_task(snapshots["cs"].id, report_format="pdf")
+
+        assert result == {"key": report_key(db_session, snapshots["cs"].id), "format": "pdf", "cached": False}
+
+
+class TestArtifactStore:
+    """Tests for artifact keys."""
+
+    @pytest.mark.parametrize("key", ["../etc/passwd", "abc", "G" * 64, "A" * 64])
+    def test_rejects_malformed_keys(self, store, key):
+        """Test keys other than lowercase SHA-256 hex digests are refused."""
+        with pytest.raises(ValueError):
+            store.path(key, "pdf")
+
+
+class TestDownload:
+    """Tests for the download endpoint."""
+
+    @pytest.fixture
+    def app(self, store):
+        """App serving the report routes from the temporary store."""
+        app = FastAPI()
+        app.include_router(reports.router)
+        app.dependency_overrides[reports.get_report_store] = lambda: store
+        return app
+
+    @pytest.mark.asyncio
+    async def test_download(self, app, db_session, snapshots, store):
+        """Test a stored artifact is served with immutable caching."""
+        artifact = generate_kpi_report(db_session, snapshots["cs"].id, store=store)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/reports/{artifact.key}.xlsx")
+            missing = await client.get(f"/reports/{artifact.key}.pdf")
+            malformed = await client.get("/reports/not-a-key.xlsx")
+
+        assert response.status_code == 200
+        assert response.content == artifact.path.read_bytes()
+        assert response.headers["cache-control"] == reports.IMMUTABLE_CACHE_CONTROL
+        assert missing.status_code == 404
+        assert malformed.status_code == 404
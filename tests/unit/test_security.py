@@ -1,10 +1,17 @@
 """Tests for security utilities."""
 
+import asyncio
+import threading
+
 import pytest
 
+from app.core.exceptions import ServiceUnavailableException
 from app.core.security import (
+    PasswordHashPool,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     create_access_token,
     decode_token,
 )
@@ -30,6 +37,63 @@ class TestPasswordHashing:
         assert not verify_password("wrong_password", hashed)
 
 
+class TestPasswordHashPool:
+    """Tests for off-loop password hashing."""
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """Test async helpers round-trip."""
+        hashed = await hash_password_async("test_password_123")
+
+        assert await verify_password_async("test_password_123", hashed)
+        assert not await verify_password_async("wrong_password", hashed)
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test calls beyond workers + queue are shed with a 503."""
+        pool = PasswordHashPool(max_workers=1, max_queue=0)
+        release = threading.Event()
+        running = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await pool.run(lambda: None)
+
+        assert exc_info.value.status_code == 503
+        assert pool.stats()["in_progress"] == 1
+        assert pool.stats()["rejected"] == 1
+
+        release.set()
+        await running
+        assert pool.stats()["completed"] == 1
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_stays_pending_until_done(self):
+        """Test a cancelled caller's running job still occupies its worker."""
+        pool = PasswordHashPool(max_workers=1, max_queue=1)
+        release = threading.Event()
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: None))
+        await asyncio.sleep(0.05)
+
+        running.cancel()
+        queued.cancel()
+        await asyncio.gather(running, queued, return_exceptions=True)
+        try:
+            assert pool.stats()["in_progress"] == 1
+            assert pool.stats()["completed"] == 0
+        finally:
+            release.set()
+
+        for _ in range(100):
+            if pool.stats()["in_progress"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.stats()["completed"] == 1
+        pool.shutdown()
+
+
 class TestTokenGeneration:
     """Tests for JWT token generation and decoding."""
 
@@ -0,0 +1,153 @@
+"""Tests for bulk student import."""
+
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from openpyxl import Workbook
+
+from app.api.v1.endpoints.students import import_students
+from app.core.exceptions import ValidationException
+from app.models import AcademicSession, Department, KPIDirtyKey, Student
+from app.services.importers.student_import import StudentImporter, read_rows
+
+HEADER = "matric_number,first_name,last_name,email,level,department_id,github_username\n"
+
+
+@pytest.fixture
+def department(db_session):
+    dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+    db_session.add(dept)
+    db_session.commit()
+    return dept
+
+
+def _csv(*lines: str) -> io.BytesIO:
+    return io.BytesIO((HEADER + "".join(line + "\n" for line in lines)).encode())
+
+
+class TestReadRows:
+    """Tests for file readers."""
+
+    def test_csv_rows(self):
+        """Test CSV records are keyed by column and numbered by line."""
+        rows = list(read_rows(_csv("CSC/2021/001,Ada,Obi,ada@example.com,100,1,"), "a.csv"))
+
+        assert rows == [
+            (
+                2,
+                {
+                    "matric_number": "CSC/2021/001",
+                    "first_name": "Ada",
+                    "last_name": "Obi",
+                    "email": "ada@example.com",
+                    "level": "100",
+                    "department_id": "1",
+                    "github_username": None,
+                },
+            )
+        ]
+
+    def test_xlsx_rows(self):
+        """Test XLSX headers are normalized and blank rows skipped."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Matric Number", "First Name", "Last Name", "Email", "Level", "Department ID"])
+        sheet.append(["CSC/2021/001", "Ada", "Obi", "ada@example.com", 100, 1])
+        sheet.append([None] * 6)
+        stream = io.BytesIO()
+        workbook.save(stream)
+        stream.seek(0)
+
+        rows = list(read_rows(stream, "intake.XLSX"))
+
+        assert len(rows) == 1
+        assert rows[0][1]["level"] == 100
+
+    def test_missing_columns(self):
+        """Test a file without required columns is rejected."""
+        with pytest.raises(ValidationException):
+            list(read_rows(io.BytesIO(b"matric_number,email\n"), "a.csv"))
+
+    def test_unsupported_type(self):
+        """Test unknown file types are rejected."""
+        with pytest.raises(ValidationException):
+            read_rows(io.BytesIO(b""), "students.json")
+
+
+class TestStudentImporter:
+    """Tests for StudentImporter."""
+
+    def test_imports_valid_rows_and_reports_errors(self, db_session, department):
+        """Test valid rows are inserted and invalid ones reported per row."""
+        d = department.id
+        stream = _csv(
+            f"CSC/2021/001,Ada,Obi,ada@example.com,100,{d},ada-obi",
+            f"CSC/2021/002,Bola,Ade,bola@example.com,200,{d},",
+            f"csc-2021-3,Chi,Eze,chi@example.com,300,{d},",
+            f"CSC/2021/004,Dayo,Ola,dayo@example.com,500,{d},",
+            f"CSC/2021/001,Efe,Uzo,efe@example.com,100,{d},",
+            "CSC/2021/006,Femi,Oke,femi@example.com,100,999,",
+        )
+
+        report = StudentImporter(db_session, chunk_size=1).import_file(stream, "a.csv")
+
+        assert report.total_rows == 6
+        assert report.imported == 2
+        assert report.failed == 4
+        assert [error.row for error in report.errors] == [4, 5, 6, 7]
+        assert "matric_number: invalid format" in report.errors[0].errors
+        assert report.errors[1].errors[0].startswith("level")
+        assert report.errors[2].errors == ["matric_number: duplicate in file"]
+        assert "department 999 not found" in report.errors[3].errors[0]
+        assert db_session.query(Student).count() == 2
+
+    def test_existing_students_are_skipped(self, db_session, department):
+        """Test re-importing a file skips rows that already exist."""
+        line = f"CSC/2021/001,Ada,Obi,ada@example.com,100,{department.id},"
+        StudentImporter(db_session).import_file(_csv(line), "a.csv")
+
+        report = StudentImporter(db_session).import_file(
+            _csv(line, f"CSC/2021/002,Bola,Ade,bola@example.com,200,{department.id},"),
+            "a.csv",
+        )
+
+        assert report.imported == 1
+        assert report.skipped == 1
+        assert report.errors[0].row == 2
+        assert db_session.query(Student).count() == 2
+
+    def test_import_marks_department_keys_dirty(self, db_session, department):
+        """Test imported students mark their department's KPIs stale."""
+        term = AcademicSession(
+            session_name="2023/2024", start_date="2023-09-01", end_date="2024-02-28", semester=1
+        )
+        db_session.add(term)
+        db_session.commit()
+
+        StudentImporter(db_session).import_file(
+            _csv(f"CSC/2021/001,Ada,Obi,ada@example.com,100,{department.id},"), "a.csv"
+        )
+
+        keys = {(k.department_id, k.academic_session_id) for k in db_session.query(KPIDirtyKey)}
+        assert keys == {(department.id, term.id)}
+        assert db_session.query(KPIDirtyKey).count() == 4
+
+    def test_error_report_is_capped(self, db_session, department):
+        """Test the error list stops growing at max_errors."""
+        stream = _csv(*(f"bad,Ada,Obi,ada{i}@example.com,100,{department.id}," for i in range(5)))
+
+        report = StudentImporter(db_session, max_errors=2).import_file(stream, "a.csv")
+
+        assert report.failed == 5
+        assert len(report.errors) == 2
+        assert report.errors_truncated is True
+
+    def test_upload_without_filename(self, db_session):
+        """Test uploads without a file name are rejected before reading."""
+        upload = UploadFile(file=_csv(), filename=None)
+
+        with pytest.raises(HTTPException) as error:
+            import_students(file=upload, db=db_session)
+
+        assert error.value.status_code == 400
@@ -0,0 +1,201 @@
+"""Tests for the student profile endpoints."""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints import students
+from app.core.exceptions import ValidationException
+from app.core.metrics import QueryBudgetMiddleware
+from app.crud.student import PROFILE_SECTIONS, crud_student
+from app.db.base import Base
+from app.db.instrumentation import instrument_engine, track_queries
+from app.db.session import get_async_db
+from app.models import (
+    AcademicSession,
+    Course,
+    Department,
+    Event,
+    EventParticipant,
+    InternshipRecord,
+    Student,
+    StudentFeedback,
+    StudentProject,
+)
+
+
+async def _seed(db, students_count=3, history=5):
+    dept = Department(name="Computer Science", code="CS", faculty="Engineering")
+    term = AcademicSession(
+        session_name="2023/2024", start_date="2023-09-01", end_date="2024-02-28", semester=1
+    )
+    db.add_all([dept, term])
+    await db.flush()
+    course = Course(course_code="CS101", course_title="Programming", department_id=dept.id)
+    event = Event(
+        event_name="Hackathon",
+        event_type="hackathon",
+        organizer="CS",
+        event_date="2023-10-01",
+        academic_session_id=term.id,
+    )
+    people = [
+        Student(
+            matric_number=f"CSC/2021/{i:03d}",
+            first_name="Test",
+            last_name="Student",
+            email=f"student{i}@example.com",
+            department_id=dept.id,
+            level=300,
+        )
+        for i in range(1, students_count + 1)
+    ]
+    db.add_all([course, event, *people])
+    await db.flush()
+    for student in people:
+        for n in range(history):
+            db.add_all(
+                [
+                    StudentProject(
+                        student_id=student.id, project_name=f"Project {n}", academic_session_id=term.id
+                    ),
+                    InternshipRecord(
+                        student_id=student.id,
+                        company_name=f"Company {n}",
+                        internship_type="SIWES",
+                        start_date="2023-06-01",
+                        end_date="2023-09-01",
+                        academic_session_id=term.id,
+                    ),
+                    StudentFeedback(
+                        course_id=course.id, student_id=student.id, academic_session_id=term.id, rating=4
+                    ),
+                    EventParticipant(event_id=event.id, student_id=student.id, participation_date="2023-10-01"),
+                ]
+            )
+    await db.commit()
+    return [student.id for student in people]
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Instrumented in-memory async database."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    instrument_engine(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(session_factory):
+    """Client of an app serving the student routes under strict query budgets."""
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware)
+    app.include_router(students.router)
+
+    async def override():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestProfileSections:
+    """Tests for the include selector."""
+
+    def test_defaults_to_all(self):
+        """Test omitting include selects every section."""
+        assert crud_student.profile_sections(None) == list(PROFILE_SECTIONS)
+
+    def test_rejects_unknown_sections(self):
+        """Test unknown section names are reported."""
+        with pytest.raises(ValidationException) as excinfo:
+            crud_student.profile_sections("projects,grades")
+
+        assert excinfo.value.details["unknown"] == ["grades"]
+
+
+class TestStudentProfiles:
+    """Tests for the profile endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_profile_loads_every_section(self, client, session_factory):
+        """Test one profile carries all of the student's records."""
+        async with session_factory() as db:
+            ids = await _seed(db)
+
+        response = await client.get(f"/students/{ids[0]}/profile")
+
+        assert response.status_code == 200
+        profile = response.json()
+        assert profile["id"] == ids[0]
+        assert [p["project_name"] for p in profile["projects"]] == [f"Project {n}" for n in range(5)]
+        assert len(profile["internships"]) == len(profile["feedback"]) == 5
+        assert profile["event_participations"][0]["event"]["event_name"] == "Hackathon"
+
+    @pytest.mark.asyncio
+    async def test_query_count_is_constant(self, session_factory):
+        """Test the number of queries does not grow with students or history."""
+        async with session_factory() as db:
+            ids = await _seed(db, students_count=20, history=10)
+
+        counts = []
+        for batch in (ids[:1], ids):
+            async with session_factory() as db:
+                with track_queries() as stats:
+                    students_by_id = await crud_student.aget_profiles(db, batch, list(PROFILE_SECTIONS))
+                    for student in students_by_id.values():
+                        students._profile(student, list(PROFILE_SECTIONS))
+            counts.append(stats.count)
+
+        assert counts == [len(PROFILE_SECTIONS) + 2] * 2
+
+    @pytest.mark.asyncio
+    async def test_include_selects_sections(self, client, session_factory):
+        """Test sections left out of include are null."""
+        async with session_factory() as db:
+            ids = await _seed(db)
+
+        response = await client.get(f"/students/{ids[0]}/profile", params={"include": "projects"})
+
+        profile = response.json()
+        assert len(profile["projects"]) == 5
+        assert profile["internships"] is None
+        assert profile["event_participations"] is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_student(self, client, session_factory):
+        """Test a missing student is a 404."""
+        response = await client.get("/students/999/profile")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_batched_profiles(self, client, session_factory):
+        """Test profiles come back in request order, skipping unknown IDs."""
+        async with session_factory() as db:
+            ids = await _seed(db)
+
+        response = await client.get(
+            "/students/profiles", params={"ids": [ids[2], 999, ids[0]], "include": "feedback"}
+        )
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == [ids[2], ids[0]]
+        assert all(len(p["feedback"]) == 5 and p["projects"] is None for p in response.json())
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_limited(self, client):
+        """Test oversized batches are rejected."""
+        ids = list(range(1, students.MAX_PROFILE_BATCH + 2))
+
+        response = await client.get("/students/profiles", params={"ids": ids})
+
+        assert response.status_code == 400